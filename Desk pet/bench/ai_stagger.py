@@ -0,0 +1,39 @@
+"""
+Frame-time flatness with staggered AI: max/median tick time at 500 pets
+and 40 bugs. Before staggering, every 7th tick ran all AI at once.
+
+    python -m bench.ai_stagger
+"""
+from __future__ import annotations
+import contextlib
+import io
+import random
+import statistics
+import time
+
+from deskpet.world import World
+
+
+def main(pets: int = 500, bugs: int = 40, ticks: int = 700):
+    random.seed(7)
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1920, height=1080)
+        world.spawn_fenlings(pets - 1)
+        for _ in range(bugs):
+            world.add_enemy(x=random.uniform(0, 1920), y=500.0, w=24.0, h=24.0, hp=10**9)
+        for _ in range(20):
+            world.tick()
+
+        ms = []
+        for _ in range(ticks):
+            t0 = time.perf_counter()
+            world.tick()
+            ms.append((time.perf_counter() - t0) * 1000.0)
+
+    ms.sort()
+    print(f"{pets} pets, {bugs} bugs: tick median {statistics.median(ms):.2f} ms, "
+          f"p99 {ms[int(0.99 * len(ms))]:.2f} ms, max {ms[-1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Enemy AI cost per bug: per-bug Python loop vs the NumPy batch path.
+
+    python -m bench.enemy_swarm
+"""
+from __future__ import annotations
+import contextlib
+import io
+import random
+import time
+
+from deskpet.world import World
+from deskpet import ai_batch
+
+
+def _world(bugs: int) -> World:
+    random.seed(5)
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1920, height=1080, rng_seed=5)
+        world.spawn_fenlings(9)
+        for _ in range(bugs):
+            world.add_enemy(x=random.uniform(0, 1920), y=random.uniform(300, 1000),
+                            w=24.0, h=24.0, hp=10**9)
+        world.tick()
+    return world
+
+
+def _us_per_bug(step, world, reps: int) -> float:
+    enemies = world.enemies.items
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        step(enemies)
+    return (time.perf_counter() - t0) / reps / len(enemies) * 1e6
+
+
+def main():
+    if not ai_batch.available():
+        print("numpy not installed; only the per-bug loop is available")
+        return
+    print(f"{'bugs':>6} | {'loop us/bug':>11} | {'batch us/bug':>12}")
+    for bugs in (8, 64, 512, 4096):
+        world = _world(bugs)
+        reps = max(3, 20000 // bugs)
+        loop = _us_per_bug(world._enemy_ai_step, world, reps)
+        batch = _us_per_bug(lambda es: world.enemy_batch_ai.step(world, es), world, reps)
+        print(f"{bugs:6d} | {loop:11.2f} | {batch:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
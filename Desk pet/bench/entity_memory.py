@@ -0,0 +1,67 @@
+"""
+Bytes per entity at 10k entities: dict-backed dataclasses (the old layout)
+vs the current slotted classes with fixed-layout trait/origin records.
+
+    python -m bench.entity_memory
+"""
+from __future__ import annotations
+import dataclasses
+import gc
+import tracemalloc
+
+from deskpet.entities.pet import Pet
+from deskpet.entities.enemy import Enemy
+from deskpet.entities.food import Food
+from deskpet.entities.toy import ToyBall
+from deskpet.personality import DEFAULT_TRAITS, DEFAULT_ORIGIN
+
+N = 10_000
+
+
+def _unslotted(cls, overrides=None):
+    """Same fields as cls, but a plain __dict__ dataclass (the pre-slots shape)."""
+    overrides = overrides or {}
+    spec = []
+    for f in dataclasses.fields(cls):
+        if f.name in overrides:
+            spec.append((f.name, object, dataclasses.field(default_factory=overrides[f.name])))
+        elif f.default_factory is not dataclasses.MISSING:
+            spec.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        elif f.default is not dataclasses.MISSING:
+            spec.append((f.name, f.type, dataclasses.field(default=f.default)))
+        else:
+            spec.append((f.name, f.type))
+    return dataclasses.make_dataclass(cls.__name__ + "Legacy", spec)
+
+
+def _bytes_per(factory) -> float:
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    items = [factory() for _ in range(N)]
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del items
+    return used / N
+
+
+def main():
+    legacy = {
+        "Pet": _unslotted(Pet, {"traits": lambda: dict(DEFAULT_TRAITS), "origin_memory": lambda: dict(DEFAULT_ORIGIN)}),
+        "Enemy": _unslotted(Enemy),
+        "Food": _unslotted(Food),
+        "ToyBall": _unslotted(ToyBall),
+    }
+    current = {"Pet": Pet, "Enemy": Enemy, "Food": Food, "ToyBall": ToyBall}
+    ctor_args = {"Pet": {}, "Enemy": {"eid": 0, "x": 0.0, "y": 0.0}, "Food": {"x": 0.0, "y": 0.0}, "ToyBall": {"x": 0.0, "y": 0.0}}
+
+    print(f"bytes/entity at {N:,} entities")
+    for name in current:
+        kw = ctor_args[name]
+        before = _bytes_per(lambda: legacy[name](**kw))
+        after = _bytes_per(lambda: current[name](**kw))
+        print(f"  {name:8s} before {before:7.0f}  after {after:7.0f}  ({100 * (1 - after / before):.0f}% smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+A hungry crowd on one side of the screen, pellets spread across it: tick
+time and the largest group of pets chasing a single pellet. Before claims
+every pet ran for its own nearest pellet, so the whole crowd piled onto one.
+
+    python -m bench.food_claims
+"""
+from __future__ import annotations
+import contextlib
+from collections import Counter
+import io
+import random
+import statistics
+import time
+
+from deskpet.world import World
+
+
+def main(pets: int = 300, pellets: int = 60, ticks: int = 200):
+    random.seed(11)
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1920, height=1080)
+        world.spawn_fenlings(pets - 1)
+        for p in world.fenlings:
+            p.x = random.uniform(0, 400)
+            p.hunger = 80.0
+            p.hunger_rate = 0.0
+        for _ in range(pellets):
+            world.food.acquire(x=random.uniform(0, 1920), y=world.ground_y() - 32.0, kind="kibble")
+
+        ms = []
+        crowd = []
+        for _ in range(ticks):
+            t0 = time.perf_counter()
+            world.tick()
+            ms.append((time.perf_counter() - t0) * 1000.0)
+            if world.food:
+                chasing = Counter(p.food_fid for p in world.fenlings if world.food.get(p.food_fid))
+                crowd.append(max(chasing.values(), default=0))
+
+    print(f"{pets} hungry pets, {pellets} pellets: tick median {statistics.median(ms):.2f} ms | "
+          f"most pets on one pellet (median) {statistics.median(crowd):.0f} | "
+          f"eaten {pellets - len(world.food)}")
+
+
+if __name__ == "__main__":
+    main()
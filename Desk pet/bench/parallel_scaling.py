@@ -0,0 +1,60 @@
+"""
+Tick time of a big world as the per-entity phases get more worker threads.
+
+    python -m bench.parallel_scaling
+
+Workers are forced on (ParallelStepper(force=True)), so on a GIL build this
+shows the threading overhead rather than a speed-up; run it on a
+free-threaded interpreter (python3.13t / 3.14t) to see the phases scale.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import os
+import random
+import time
+
+from deskpet.parallel import ParallelStepper, gil_enabled
+from deskpet.world import World
+
+
+def _percentile(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+
+def run(workers: int, pets: int = 2000, bugs: int = 200, ticks: int = 100):
+    random.seed(48)
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1920, height=1080, rng_seed=48)
+        world.parallel = ParallelStepper(workers, force=True)
+        world.spawn_fenlings(pets - 1)
+        for _ in range(bugs):
+            world.add_enemy(x=random.uniform(0, 1920), y=random.uniform(300, 1000),
+                            w=24.0, h=24.0, hp=10**9)
+        for _ in range(10):
+            world.tick()
+
+        tick_ms = []
+        for _ in range(ticks):
+            t0 = time.perf_counter()
+            world.tick()
+            tick_ms.append((time.perf_counter() - t0) * 1000.0)
+    world.parallel.close()
+
+    print(f"{workers:3d} workers ({world.parallel.mode:>16}) | tick p50 {_percentile(tick_ms, 0.5):7.2f} ms"
+          f"  p95 {_percentile(tick_ms, 0.95):7.2f} ms")
+
+
+def main():
+    print(f"GIL {'on' if gil_enabled() else 'off'}, {os.cpu_count()} cpus")
+    n = 1
+    while True:
+        run(n)
+        if n >= (os.cpu_count() or 1) and n >= 2:
+            break
+        n *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Tk-side frame cost with the simulation on a thread vs in its own process.
+
+    python -m bench.sim_process
+
+Each "frame" reads sim.latest() and walks every pet's x/y columns (a stand-in for the
+canvas updates). With the sim thread both share one GIL, so frames stretch
+while a tick runs; with the sim process they only compete for CPU, which on
+a multi-core machine they don't. Also prints the shared-memory publish and
+read cost per state.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import random
+import time
+from multiprocessing import shared_memory
+
+from deskpet.sim import SimThread
+from deskpet.simproc import SimProcess, StateLayout, StateReader, StateWriter
+from deskpet.world import World
+
+
+def _percentile(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+
+def _frames(sim, secs: float = 2.0):
+    frame_ms = []
+    end = time.perf_counter() + secs
+    while time.perf_counter() < end:
+        t0 = time.perf_counter()
+        s = sim.latest()
+        acc = 0.0
+        for x, y in zip(s.pets.col("x"), s.pets.col("y")):
+            acc += x * 0.5 + y * 0.5
+        frame_ms.append((time.perf_counter() - t0) * 1000.0)
+        time.sleep(0.016)
+    return frame_ms
+
+
+def _shm_costs(world: World, reps: int = 50):
+    layout = StateLayout()
+    shm = shared_memory.SharedMemory(create=True, size=layout.size)
+    writer = StateWriter(shm.buf, layout)
+    reader = StateReader(shm.buf, layout)
+    state = world.snapshot()
+    pub = read = 0.0
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        writer.publish(state, 0, 0)
+        t1 = time.perf_counter()
+        reader.read()
+        pub += t1 - t0
+        read += time.perf_counter() - t1
+    pub, read = pub / reps * 1000.0, read / reps * 1000.0
+    writer.release()
+    shm.close()
+    shm.unlink()
+    return pub, read
+
+
+def run(pets: int):
+    random.seed(49)
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1920, height=1080, rng_seed=49)
+        world.spawn_fenlings(pets - 1)
+        pub, read = _shm_costs(world)
+
+        sim = SimThread(world)
+        sim.start()
+        thread_ms = _frames(sim)
+        sim.stop()
+
+        proc = SimProcess(dict(width=1920, height=1080, rng_seed=49))
+        proc.start()
+        proc.call(proc.world.spawn_fenlings, pets - 1)
+        time.sleep(0.5)
+        proc_ms = _frames(proc)
+        proc.stop()
+
+    print(f"{pets:5d} pets | frame p50/p95 thread {_percentile(thread_ms, 0.5):6.2f}/{_percentile(thread_ms, 0.95):6.2f} ms"
+          f"  process {_percentile(proc_ms, 0.5):6.2f}/{_percentile(proc_ms, 0.95):6.2f} ms"
+          f" | shm publish {pub:5.2f} ms  read {read:5.2f} ms")
+
+
+def main():
+    for n in (100, 1000, 3000):
+        run(n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Tick and click latency as the fenling population grows.
+
+    python -m bench.world_scale
+"""
+from __future__ import annotations
+import contextlib
+import io
+import random
+import time
+
+from deskpet.world import World
+
+
+def _percentile(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+
+def run(pets: int, ticks: int = 400, clicks: int = 2000):
+    random.seed(1234)
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1920, height=1080)
+        world.spawn_fenlings(pets - 1)
+        for _ in range(3):
+            world.spawn_enemy()
+        for _ in range(20):
+            world.tick()
+
+        tick_ms = []
+        for _ in range(ticks):
+            t0 = time.perf_counter()
+            world.tick()
+            world.get_focused()
+            tick_ms.append((time.perf_counter() - t0) * 1000.0)
+
+    click_us = []
+    for _ in range(clicks):
+        x = random.uniform(0, world.width)
+        y = random.uniform(0, world.height)
+        t0 = time.perf_counter()
+        ent = world.pick_entity_at(x, y)
+        if ent is not None and hasattr(ent, "handle"):
+            world.set_focus(ent)
+        click_us.append((time.perf_counter() - t0) * 1e6)
+
+    per_pet_us = 1000.0 * sum(tick_ms) / len(tick_ms) / pets
+    print(f"{pets:5d} pets | tick p50 {_percentile(tick_ms, 0.5):6.2f} ms  p95 {_percentile(tick_ms, 0.95):6.2f} ms"
+          f"  ({per_pet_us:5.1f} us/pet) | click p50 {_percentile(click_us, 0.5):6.1f} us"
+          f"  p95 {_percentile(click_us, 0.95):6.1f} us")
+
+
+def main():
+    for n in (10, 100, 500):
+        run(n)
+
+
+if __name__ == "__main__":
+    main()
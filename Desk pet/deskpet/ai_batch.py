@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+try:
+    import numpy as np
+except Exception:  # optional: World falls back to the per-bug loop
+    np = None
+
+from deskpet.config import (
+    ENEMY_MAX_SPEED, ENEMY_DETECT_RADIUS, ENEMY_ORBIT_CHANCE, ENEMY_ORBIT_RADIUS,
+    ENEMY_STYLE_MIN_SECS_DIRECT, ENEMY_STYLE_MAX_SECS_DIRECT,
+    ENEMY_STYLE_MIN_SECS_ORBIT, ENEMY_STYLE_MAX_SECS_ORBIT,
+    ENEMY_SKITTER_ON,
+    ENEMY_JUMP_STRENGTH, ENEMY_JUMP_COOLDOWN, ENEMY_WANDER_HOP_RATE, ENEMY_CHASE_HOP_RATE,
+    ENEMY_LOD_NEAR_RADIUS, ENEMY_LOD_CURSOR_RADIUS, ENEMY_LOD_FAR_STRIDE,
+    AI_STEP_SECS, ATTACK_RANGE,
+)
+
+# below this many bugs per AI slice the plain Python loop is quicker
+BATCH_MIN = 24
+
+# nearest-fenling distance matrix is built in chunks of at most this many cells
+_CHUNK_CELLS = 1 << 20
+
+
+def available() -> bool:
+    return np is not None
+
+
+class EnemyBatchAI:
+    """
+    Whole-slice enemy AI with NumPy: same rules as World._enemy_ai_step
+    (LOD tiers, orbit/direct style, skitter, hops), computed as array ops.
+    Randomness comes from one Generator.random((n, 6)) draw per call.
+    Entity attributes are gathered once into arrays and scattered back once.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = np.random.default_rng(seed)
+
+    def _nearest(self, ex, ey, px, py):
+        n = ex.shape[0]
+        idx = np.empty(n, dtype=np.int64)
+        d2 = np.empty(n)
+        step = max(1, _CHUNK_CELLS // max(1, px.shape[0]))
+        for s in range(0, n, step):
+            dx = px[None, :] - ex[s:s + step, None]
+            dy = py[None, :] - ey[s:s + step, None]
+            dd = dx * dx + dy * dy
+            k = dd.argmin(axis=1)
+            idx[s:s + step] = k
+            d2[s:s + step] = dd[np.arange(k.shape[0]), k]
+        return idx, np.sqrt(d2)
+
+    def step(self, world, enemies: List) -> None:
+        n = len(enemies)
+        if n == 0:
+            return
+        fenlings = world.fenlings
+        if not fenlings:
+            for e in enemies:
+                e.vx_desired = 0.0
+            return
+
+        now = world.time_s
+
+        # gather
+        ex = np.fromiter((e.x for e in enemies), float, n)
+        ey = np.fromiter((e.y for e in enemies), float, n)
+        eh = np.fromiter((e.h for e in enemies), float, n)
+        held = np.fromiter((e.held for e in enemies), bool, n)
+        on_ground = np.fromiter((e.on_ground for e in enemies), bool, n)
+        last_jump = np.fromiter((e.last_jump_time for e in enemies), float, n)
+        style_until = np.fromiter((e.style_until for e in enemies), float, n)
+        orbit = np.fromiter((e.chase_style == "orbit" for e in enemies), bool, n)
+        orbit_dir = np.fromiter((e.orbit_dir for e in enemies), float, n)
+        lod_skip = np.fromiter((e.lod_skip for e in enemies), np.int64, n)
+        phase = np.fromiter((e.skitter_phase for e in enemies), float, n)
+        freq = np.fromiter((e.skitter_freq for e in enemies), float, n)
+        amp = np.fromiter((e.skitter_amp for e in enemies), float, n)
+
+        px = np.fromiter((p.x for p in fenlings), float, len(fenlings))
+        py = np.fromiter((p.y for p in fenlings), float, len(fenlings))
+
+        u = self.rng.random((n, 6))
+
+        # targets + LOD tiers
+        tidx, d = self._nearest(ex, ey, px, py)
+        tx = px[tidx]
+        on_screen = (ex >= 0.0) & (ex <= world.width) & (ey >= -eh) & (ey <= world.height)
+        near = d <= ENEMY_LOD_NEAR_RADIUS
+        if world.cursor_x is not None and world.cursor_y is not None:
+            near |= np.hypot(ex - world.cursor_x, ey - world.cursor_y) <= ENEMY_LOD_CURSOR_RADIUS
+        full = on_screen & near & ~held
+        cheap = ~full & ~held
+
+        # style re-roll for chasers whose style expired
+        chasing = full & (d <= ENEMY_DETECT_RADIUS)
+        reroll = chasing & (now >= style_until)
+        to_orbit = reroll & (u[:, 0] < ENEMY_ORBIT_CHANCE)
+        to_direct = reroll & ~to_orbit
+        orbit = np.where(to_orbit, True, np.where(to_direct, False, orbit))
+        orbit_dir = np.where(to_orbit, np.where(u[:, 1] < 0.5, -1.0, 1.0), orbit_dir)
+        span_o = ENEMY_STYLE_MIN_SECS_ORBIT + u[:, 2] * (ENEMY_STYLE_MAX_SECS_ORBIT - ENEMY_STYLE_MIN_SECS_ORBIT)
+        span_d = ENEMY_STYLE_MIN_SECS_DIRECT + u[:, 2] * (ENEMY_STYLE_MAX_SECS_DIRECT - ENEMY_STYLE_MIN_SECS_DIRECT)
+        style_until = np.where(to_orbit, now + span_o, np.where(to_direct, now + span_d, style_until))
+
+        # steering
+        gap = np.abs(tx - ex)
+        aim = np.where(orbit, tx + orbit_dir * ENEMY_ORBIT_RADIUS, tx) - ex
+        chase_base = np.where(gap <= ATTACK_RANGE * 1.2, 0.0, np.sign(aim) * ENEMY_MAX_SPEED)
+        wander_base = np.where(u[:, 3] < 0.5, -0.55, 0.55) * ENEMY_MAX_SPEED
+        wander_base = np.where(u[:, 4] < 0.25, 0.0, wander_base)
+        base = np.where(chasing, chase_base, wander_base)
+        if ENEMY_SKITTER_ON:
+            skitter = (np.abs(base) > 40) & (gap > ATTACK_RANGE * 1.2)
+            base = base + np.where(skitter, np.sin(phase + now * freq) * amp, 0.0)
+
+        # far bugs act every ENEMY_LOD_FAR_STRIDE-th turn, plain wander only
+        lod_skip = np.where(cheap, lod_skip + 1, 0)
+        cheap_act = cheap & (lod_skip >= ENEMY_LOD_FAR_STRIDE)
+        lod_skip = np.where(cheap_act, 0, lod_skip)
+
+        vx_desired = np.where(full, base, np.where(cheap_act, wander_base, np.nan))
+        vx_desired = np.where(held, 0.0, vx_desired)
+
+        # hops
+        hop_rate = np.where(chasing, ENEMY_CHASE_HOP_RATE, ENEMY_WANDER_HOP_RATE) * AI_STEP_SECS
+        hop_rate = np.where(cheap_act, ENEMY_WANDER_HOP_RATE * AI_STEP_SECS * ENEMY_LOD_FAR_STRIDE, hop_rate)
+        can_hop = (full | cheap_act) & on_ground & ((now - last_jump) >= ENEMY_JUMP_COOLDOWN)
+        hop = can_hop & (u[:, 5] < hop_rate)
+
+        # scatter (nan = leave the previous desired velocity alone)
+        lod = cheap.tolist()
+        for e, v, o, od, su, ls, lv, h in zip(
+            enemies, vx_desired.tolist(), orbit.tolist(), orbit_dir.tolist(),
+            style_until.tolist(), lod_skip.tolist(), lod, hop.tolist(),
+        ):
+            if v == v:
+                e.vx_desired = v
+            e.chase_style = "orbit" if o else "direct"
+            e.orbit_dir = int(od)
+            e.style_until = su
+            e.lod = 1 if lv else 0
+            e.lod_skip = ls
+            if h:
+                e.vy = -ENEMY_JUMP_STRENGTH
+                e.last_jump_time = now
@@ -4,18 +4,24 @@ import ctypes
 
 from deskpet.config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, TICK_MS,
-    THROW_MODE, THROW_SMOOTHING,
+    THROW_MODE, THROW_FIT_SECS, LATENCY_DUMP_PATH,
     THROW_SCALE_GENTLE, MAX_THROW_SPEED_GENTLE,
     THROW_SCALE_YEET, MAX_THROW_SPEED_YEET,
     FOOD_TYPES,
+    CURSOR_SPEED_WINDOW_SECS, CURSOR_POLL_SECS, CURSOR_POLL_SPEED_WINDOW_SECS,
+    SIM_PROCESS,
 )
 from deskpet.world import World
 from deskpet.renderer import Renderer
-from deskpet.util.mathutil import clamp, dist
+from deskpet.sim import SimThread
+from deskpet.simproc import SimProcess
+from deskpet.util.mathutil import clamp
+from deskpet.util.inputqueue import InputQueue
+from deskpet.util.motion import MotionRing
 
 from deskpet.intro import IntroModal
-from deskpet.dialogue import generate_reply
-from deskpet.personality import record_throw
+from deskpet.dialogue import INTENT_RULES
+from deskpet.autocomplete import PrefixTrie
 
 user32 = ctypes.windll.user32
 GWL_EXSTYLE = -20
@@ -74,9 +80,21 @@ class DesktopPetApp:
         )
         self.canvas.pack(fill="both", expand=True)
 
-        self.world = World(width=vw, height=vh, offset_x=vx, offset_y=vy, work_area=work_area)
+        world_kwargs = dict(width=vw, height=vh, offset_x=vx, offset_y=vy, work_area=work_area)
         self.renderer = Renderer(self.root)
 
+        # World.tick runs on its own thread (or process); this thread only sends
+        # commands (sim.call) and draws the latest snapshot (sim.latest).
+        # In process mode self.world is a RemoteWorld: its methods are just names.
+        if SIM_PROCESS:
+            self.sim = SimProcess(world_kwargs)
+        else:
+            self.sim = SimThread(World(**world_kwargs))
+        self.world = self.sim.world
+        self._modal_depth = 0
+        self.renderer.profiler.register(
+            "sim", lambda: f"{self.sim.ticks} ticks, {self.sim.dropped_ticks} dropped")
+
         self.overlay_on = False
         self.clickthrough_on = False
 
@@ -86,19 +104,22 @@ class DesktopPetApp:
         self._hotkey_debounce_s = 0.20
 
         self.dragging = False
-        self.drag_ent = None
-        self.drag_off_x = 0.0
-        self.drag_off_y = 0.0
+        self._drag_seq = 0
+
+        # drag: raw samples for the throw fit; position applied once per event burst
+        self.drag_samples = MotionRing(32)
+        self._drag_to = None
+        self._drag_t = 0.0
+        self._drag_flush_pending = False
 
-        self.last_mouse_x = None
-        self.last_mouse_y = None
-        self.last_mouse_t = None
-        self.smoothed_vx = 0.0
-        self.smoothed_vy = 0.0
+        # cursor: fed by <Motion>, read once per tick; root origin cached from <Configure>
+        self.cursor_samples = MotionRing(32)
+        self._root_x = 0
+        self._root_y = 0
+        self._next_cursor_poll = 0.0
 
-        self._last_cursor_x = None
-        self._last_cursor_y = None
-        self._last_cursor_t = None
+        # chat-box completions: dialogue keywords + lines you've sent before
+        self.chat_completer = PrefixTrie(entries=[kw for r in INTENT_RULES for kw in r["keywords"]])
 
         # Keybinds
         self.root.bind("<F3>", lambda e: self.on_hotkey("f3", self.toggle_overlay))
@@ -112,8 +133,8 @@ class DesktopPetApp:
         self.root.bind("c", lambda e: self.on_hotkey("c", self.toggle_craft_menu))
         self.root.bind("C", lambda e: self.on_hotkey("c", self.toggle_craft_menu))
 
-        self.root.bind("b", lambda e: self.on_hotkey("b", self.world.spawn_ball))
-        self.root.bind("B", lambda e: self.on_hotkey("b", self.world.spawn_ball))
+        self.root.bind("b", lambda e: self.on_hotkey("b", lambda: self.sim.call(self.world.spawn_ball)))
+        self.root.bind("B", lambda e: self.on_hotkey("b", lambda: self.sim.call(self.world.spawn_ball)))
 
         # Wave 7
         self.root.bind("i", lambda e: self.on_hotkey("i", self.show_intro))
@@ -125,11 +146,23 @@ class DesktopPetApp:
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
         self.canvas.bind("<Button-3>", self.on_right_click)
-
+        self.canvas.bind("<Motion>", self.on_mouse_move)
+        self.root.bind("<Configure>", self._on_root_configure)
+
+        # filled from other threads (global hotkeys); drained once per frame in tick()
+        self.input_queue = InputQueue()
+        self._queued_actions = {
+            "f3": self.toggle_overlay,
+            "f2": self.toggle_clickthrough,
+            "esc": self.quit,
+        }
+
+        self.running = True
         self._kb_listener = None
         self._start_global_hotkeys()
 
         # Start loop
+        self.sim.start()
         self.tick()
 
         # Auto-run intro every launch for now (no save/load)
@@ -147,8 +180,9 @@ class DesktopPetApp:
         self._last_hotkey[name] = now
         return True
 
-    def on_hotkey(self, name: str, fn):
+    def on_hotkey(self, name: str, fn, t: float = None):
         if self._debounce(name):
+            self.sim.call(self.world.note_input, "key", time.perf_counter() if t is None else t)
             fn()
 
     def _start_global_hotkeys(self):
@@ -158,16 +192,13 @@ class DesktopPetApp:
             print("[hotkeys] pynput not available; global hotkeys disabled.")
             return
 
+        keys = {keyboard.Key.f3: "f3", keyboard.Key.f2: "f2", keyboard.Key.esc: "esc"}
+
+        # listener thread: never touch Tk here, just hand the key to the main loop
         def on_press(key):
-            try:
-                if key == keyboard.Key.f3:
-                    self.root.after(0, lambda: self.on_hotkey("f3", self.toggle_overlay))
-                elif key == keyboard.Key.f2:
-                    self.root.after(0, lambda: self.on_hotkey("f2", self.toggle_clickthrough))
-                elif key == keyboard.Key.esc:
-                    self.root.after(0, lambda: self.on_hotkey("esc", self.quit))
-            except Exception:
-                pass
+            name = keys.get(key)
+            if name is not None:
+                self.input_queue.push(name)
 
         self._kb_listener = keyboard.Listener(on_press=on_press)
         self._kb_listener.daemon = True
@@ -179,8 +210,9 @@ class DesktopPetApp:
     # -----------------------
 
     def _run_modal(self, build_modal_fn):
-        prev_paused = self.world.paused
-        self.world.paused = True
+        self._modal_depth += 1
+        if self._modal_depth == 1:
+            self.sim.call(self.world.set_paused, True)
 
         prev_clickthrough = self.clickthrough_on
         if prev_clickthrough:
@@ -191,14 +223,16 @@ class DesktopPetApp:
             # blocks until destroyed
             self.root.wait_window(modal.win if hasattr(modal, "win") else modal)
         finally:
-            self.world.paused = prev_paused
+            self._modal_depth -= 1
+            if self._modal_depth == 0:
+                self.sim.call(self.world.set_paused, False)
             if prev_clickthrough:
                 self._set_clickthrough(True)
 
     def show_intro(self):
-        self._run_modal(lambda: IntroModal(self.root, self.world))
-        p = self.world.get_focused()
-        p.push_bubble("hi.", self.world.time_s, ttl=1.4, priority=60)
+        name = self.sim.latest().focused.name
+        self._run_modal(lambda: IntroModal(
+            self.root, name, lambda new_name, choice: self.sim.call(self.world.apply_intro, new_name, choice)))
 
     def show_chat(self):
         def build():
@@ -217,6 +251,52 @@ class DesktopPetApp:
             entry.pack(padx=14, pady=(0, 10))
             entry.focus_set()
 
+            # completion dropdown (filled from the trie on each keystroke)
+            suggest = tk.Listbox(win, height=5, width=42, bg="#1b1b1b", fg="white",
+                                 selectbackground="#444444", highlightthickness=0, activestyle="none")
+
+            def refresh_suggestions(e=None):
+                if e is not None and e.keysym in ("Up", "Down", "Tab", "Return", "Escape"):
+                    return
+                items = self.chat_completer.complete(entry.get())
+                if not items or items == [entry.get()]:
+                    suggest.pack_forget()
+                    return
+                suggest.delete(0, "end")
+                for text in items:
+                    suggest.insert("end", text)
+                if not suggest.winfo_ismapped():
+                    suggest.pack(padx=14, pady=(0, 10), after=entry)
+
+            def accept_suggestion(e=None):
+                sel = suggest.curselection()
+                if not suggest.winfo_ismapped() or suggest.size() == 0:
+                    return None
+                text = suggest.get(sel[0] if sel else 0)
+                entry.delete(0, "end")
+                entry.insert(0, text)
+                entry.icursor("end")
+                entry.focus_set()
+                refresh_suggestions()
+                return "break"
+
+            def move_selection(step):
+                if not suggest.winfo_ismapped() or suggest.size() == 0:
+                    return
+                sel = suggest.curselection()
+                i = (sel[0] + step) if sel else (0 if step > 0 else suggest.size() - 1)
+                i = int(clamp(i, 0, suggest.size() - 1))
+                suggest.selection_clear(0, "end")
+                suggest.selection_set(i)
+                suggest.see(i)
+
+            entry.bind("<KeyRelease>", refresh_suggestions)
+            entry.bind("<Tab>", accept_suggestion)
+            entry.bind("<Return>", lambda e: accept_suggestion() if suggest.curselection() else None)
+            entry.bind("<Down>", lambda e: move_selection(+1))
+            entry.bind("<Up>", lambda e: move_selection(-1))
+            suggest.bind("<ButtonRelease-1>", accept_suggestion)
+
             btn_row = tk.Frame(win, bg="#111111")
             btn_row.pack(padx=14, pady=(0, 12), fill="x")
 
@@ -225,10 +305,8 @@ class DesktopPetApp:
                 if not text:
                     win.destroy()
                     return
-                p = self.world.get_focused()
-                reply = generate_reply(self.world, p, text)
-                if reply:
-                    p.push_bubble(reply, self.world.time_s, ttl=2.4, priority=80)
+                self.chat_completer.add(text)
+                self.sim.call(self.world.reply_to, text)
                 win.destroy()
 
             send_btn = tk.Button(btn_row, text="Send", command=send)
@@ -259,14 +337,14 @@ class DesktopPetApp:
     def toggle_craft_menu(self):
         self.ui_state["craft_menu_open"] = not self.ui_state["craft_menu_open"]
         if self.ui_state["craft_menu_open"]:
-            self.world.get_focused().push_bubble("crafting…", self.world.time_s, ttl=1.0, priority=70)
+            self._say("crafting…", ttl=1.0, priority=70)
 
     def _point_in_rect(self, x, y, r):
         x1, y1, x2, y2 = r
         return (x1 <= x <= x2) and (y1 <= y <= y2)
 
     def _hotbar_hit(self, x, y):
-        slots = self.renderer.hotbar_layout(self.world)
+        slots = self.renderer.hotbar_layout(self.sim.latest())
         for s in slots:
             if (s["x1"] <= x <= s["x2"]) and (s["y1"] <= y <= s["y2"]):
                 return s
@@ -284,39 +362,23 @@ class DesktopPetApp:
     def select_food_by_index(self, idx: int):
         kinds = list(FOOD_TYPES.keys())[:3]
         if 0 <= idx < len(kinds):
-            self.world.set_selected_food(kinds[idx])
+            self.sim.call(self.world.set_selected_food, kinds[idx])
 
     # -----------------------
     # Picking / focus / dragging
     # -----------------------
 
-    def _hit_entity(self, ent, x, y) -> bool:
-        half_w = max(18.0, float(ent.w) * 0.5)
-        half_h = max(18.0, float(ent.h) * 0.5)
-        return (abs(x - ent.x) <= half_w) and (abs(y - ent.y) <= half_h)
-
-    def _pick_entity_under_cursor(self, x, y):
-        for e in reversed(self.world.enemies):
-            if self._hit_entity(e, x, y):
-                return e
-        for b in reversed(getattr(self.world, "toys", [])):
-            if dist(x, y, b.x, b.y) <= (b.r + 8):
-                return b
-        for p in reversed(self.world.fenlings):
-            if self._hit_entity(p, x, y):
-                return p
-        return None
+    def _say(self, text: str, ttl: float, priority: int):
+        self.sim.call(self.world.say, text, ttl, priority)
 
     def on_left_click(self, e):
         x, y = float(e.x), float(e.y)
+        self.sim.call(self.world.note_input, "click", time.perf_counter())
 
         if self.ui_state.get("craft_menu_open", False):
             hit = self._craft_menu_hit(x, y)
             if hit:
-                kind = hit["kind"]
-                ok = self.world.try_craft_food(kind)
-                if ok:
-                    self.world.set_selected_food(kind)
+                self.sim.call(self.world.craft_and_select, hit["kind"])
                 return
             bounds = self.ui_state.get("craft_bounds")
             if bounds and (not self._point_in_rect(x, y, bounds)):
@@ -325,16 +387,17 @@ class DesktopPetApp:
 
         slot = self._hotbar_hit(x, y)
         if slot:
-            self.world.set_selected_food(slot["kind"])
+            self.sim.call(self.world.set_selected_food, slot["kind"])
             return
 
         self.on_mouse_down(e)
 
     def on_right_click(self, e):
         x, y = float(e.x), float(e.y)
+        self.sim.call(self.world.note_input, "click", time.perf_counter())
         slot = self._hotbar_hit(x, y)
         if slot:
-            self.world.try_craft_food(slot["kind"])
+            self.sim.call(self.world.try_craft_food, slot["kind"])
             return
         self.toggle_craft_menu()
 
@@ -342,68 +405,58 @@ class DesktopPetApp:
         x, y = float(e.x), float(e.y)
         now = time.perf_counter()
 
-        self.last_mouse_x = x
-        self.last_mouse_y = y
-        self.last_mouse_t = now
-        self.smoothed_vx = 0.0
-        self.smoothed_vy = 0.0
-
-        ent = self._pick_entity_under_cursor(x, y)
-        if ent is not None:
-            if hasattr(ent, "inventory") and hasattr(ent, "selected_food_kind"):
-                self.world.set_focus(ent)
-
-            self.dragging = True
-            self.drag_ent = ent
-
-            ent.held = True
-            ent.vx = 0.0
-            ent.vy = 0.0
-            ent.vx_desired = 0.0
-
-            self.drag_off_x = ent.x - x
-            self.drag_off_y = ent.y - y
-            return
-
-        self.world.drop_food(x, y)
+        self.drag_samples.clear()
+        self.drag_samples.add(x, y, now)
+        self._drag_to = None
+
+        # pick from the snapshot on screen, so the drag can move it right away;
+        # the sim holds that same entity. Nothing there: the sim drops food.
+        self.dragging = True
+        self._drag_seq += 1
+        g = self.renderer.begin_drag(self.sim.latest(), x, y)
+        if g is not None:
+            self.sim.call(self.world.grab, g.kind, g.key, g.off_x, g.off_y)
+        else:
+            self.sim.call(self.world.grab_at, x, y)
 
     def on_mouse_drag(self, e):
-        if not self.dragging or self.drag_ent is None:
-            return
-
         x, y = float(e.x), float(e.y)
         now = time.perf_counter()
+        # <B1-Motion> shadows <Motion>, so the cursor stimulus is fed from here too
+        self.cursor_samples.add(x, y, now)
 
-        if self.last_mouse_t is not None:
-            dtm = max(0.001, now - self.last_mouse_t)
-            dx = x - float(self.last_mouse_x)
-            dy = y - float(self.last_mouse_y)
-            raw_vx = dx / dtm
-            raw_vy = dy / dtm
-
-            a = THROW_SMOOTHING
-            self.smoothed_vx = (1.0 - a) * self.smoothed_vx + a * raw_vx
-            self.smoothed_vy = (1.0 - a) * self.smoothed_vy + a * raw_vy
-
-        self.last_mouse_x = x
-        self.last_mouse_y = y
-        self.last_mouse_t = now
+        if not self.dragging:
+            return
 
-        ent = self.drag_ent
-        ent.x = x + self.drag_off_x
-        ent.y = y + self.drag_off_y
-        ent.x = clamp(ent.x, 0.0, float(self.world.width))
-        ent.y = clamp(ent.y, -2000.0, float(self.world.height))
+        self.drag_samples.add(x, y, now)
+        if self._drag_to is None:
+            self._drag_t = now
+        self._drag_to = (x, y)
+        # a high-rate mouse sends many events per frame: move the sprite for the
+        # last one as soon as Tk goes idle, ahead of the sim catching up, and
+        # send the sim just that one
+        if not self._drag_flush_pending:
+            self._drag_flush_pending = True
+            self.root.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        self._drag_flush_pending = False
+        if not self.dragging or self._drag_to is None:
+            return
+        x, y = self._drag_to
+        self._drag_to = None
+        self.sim.call_latest(f"drag{self._drag_seq}", self.world.drag_grab_to, x, y)
+        self.sim.flush()
+        self.renderer.move_held(self.canvas, self.sim.latest(), x, y, self._drag_t)
 
     def on_mouse_up(self, e):
-        if not self.dragging or self.drag_ent is None:
+        if not self.dragging:
             return
 
-        ent = self.drag_ent
+        self._flush_drag()
         self.dragging = False
-        self.drag_ent = None
-
-        ent.held = False
+        self.renderer.end_drag(self.sim.latest())
+        fit_vx, fit_vy = self.drag_samples.velocity(time.perf_counter(), THROW_FIT_SECS)
 
         if THROW_MODE == "yeet":
             scale = THROW_SCALE_YEET
@@ -412,8 +465,8 @@ class DesktopPetApp:
             scale = THROW_SCALE_GENTLE
             vmax = MAX_THROW_SPEED_GENTLE
 
-        vx = clamp(self.smoothed_vx * scale, -vmax, vmax)
-        vy = clamp(self.smoothed_vy * scale, -vmax, vmax)
+        vx = clamp(fit_vx * scale, -vmax, vmax)
+        vy = clamp(fit_vy * scale, -vmax, vmax)
 
         speed = (vx * vx + vy * vy) ** 0.5
         if speed > vmax and speed > 0:
@@ -421,13 +474,7 @@ class DesktopPetApp:
             vx *= k
             vy *= k
 
-        ent.vx = vx
-        ent.vy = vy
-
-        # Wave 7: record throw intensity (Fenling only)
-        if hasattr(ent, "traits"):
-            intensity = "gentle" if speed < 900 else "hard"
-            record_throw(ent, intensity)
+        self.sim.call(self.world.release_grab, vx, vy)
 
     # -----------------------
     # Overlay / click-through
@@ -490,39 +537,59 @@ class DesktopPetApp:
     # Cursor stimulus
     # -----------------------
 
-    def _update_cursor_stimulus(self):
-        sx = float(self.root.winfo_pointerx())
-        sy = float(self.root.winfo_pointery())
-        wx = float(self.root.winfo_rootx())
-        wy = float(self.root.winfo_rooty())
-        lx = sx - wx
-        ly = sy - wy
-
-        now = time.perf_counter()
-        speed = 0.0
-        if self._last_cursor_t is not None:
-            dt = max(0.001, now - self._last_cursor_t)
-            dx = lx - float(self._last_cursor_x)
-            dy = ly - float(self._last_cursor_y)
-            speed = (dx * dx + dy * dy) ** 0.5 / dt
+    def on_mouse_move(self, e):
+        self.cursor_samples.add(float(e.x), float(e.y), time.perf_counter())
 
-        self._last_cursor_x = lx
-        self._last_cursor_y = ly
-        self._last_cursor_t = now
+    def _on_root_configure(self, e):
+        if e.widget is self.root:
+            self._root_x = self.root.winfo_rootx()
+            self._root_y = self.root.winfo_rooty()
 
-        self.world.set_cursor(lx, ly, speed)
+    def _update_cursor_stimulus(self):
+        now = time.perf_counter()
+        window = CURSOR_SPEED_WINDOW_SECS
+
+        if self.clickthrough_on:
+            # mouse events pass through the window: slow global poll as a fallback
+            window = CURSOR_POLL_SPEED_WINDOW_SECS
+            if now >= self._next_cursor_poll:
+                self._next_cursor_poll = now + CURSOR_POLL_SECS
+                sx, sy = self.root.winfo_pointerxy()
+                self.cursor_samples.add(float(sx - self._root_x), float(sy - self._root_y), now)
+
+        last = self.cursor_samples.latest()
+        if last is None:
+            return
+        _, lx, ly = last
+        self.sim.call_latest("cursor", self.world.set_cursor, lx, ly, self.cursor_samples.speed(now, window))
 
     # -----------------------
     # Loop / quit
     # -----------------------
 
+    def _drain_input(self):
+        for ev in self.input_queue.drain():
+            fn = self._queued_actions.get(ev.name)
+            if fn is not None:
+                self.on_hotkey(ev.name, fn, ev.t)
+
     def tick(self):
+        self._drain_input()
+        if not self.running:
+            return
         self._update_cursor_stimulus()
-        self.world.tick()
-        self.renderer.draw(self.canvas, self.world, self.ui_state)
+        self.sim.flush()
+        state = self.sim.latest()
+        self.renderer.draw(self.canvas, state, self.ui_state, self.sim.take_input_stamps(state.t))
         self.root.after(TICK_MS, self.tick)
 
     def quit(self):
+        self.running = False
+        self.sim.stop()
+        try:
+            self.renderer.profiler.dump(LATENCY_DUMP_PATH)
+        except OSError as ex:
+            print("[profiler] latency dump failed:", ex)
         try:
             if self._kb_listener is not None:
                 self._kb_listener.stop()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# sentence starters the brain understands
+COMMAND_FORMS = (
+    "when I say ",
+    "if I say ",
+    "remember that ",
+    "remember ",
+    "forget ",
+    "what do you remember",
+    "what did I tell you about ",
+    "how are you",
+    "help",
+)
+
+
+class _Node:
+    __slots__ = ("children", "weight", "text", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.weight = 0.0
+        self.text: Optional[str] = None
+        self.top: List[Tuple[float, str]] = []
+
+
+class PrefixTrie:
+    """
+    Case-insensitive completion trie.
+
+    Every node keeps its own best-k (weight, text) list, refreshed along the
+    insert path, so a lookup is a walk down the prefix plus a list copy -
+    nothing is rebuilt per keystroke.
+    """
+
+    def __init__(self, k: int = 5, entries: Iterable[str] = ()):
+        self.k = int(k)
+        self.root = _Node()
+        for text in entries:
+            self.add(text)
+
+    def _path(self, key: str) -> List[_Node]:
+        node = self.root
+        path = [node]
+        for ch in key:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                nxt = node.children[ch] = _Node()
+            node = nxt
+            path.append(node)
+        return path
+
+    def add(self, text: str, weight: float = 1.0) -> None:
+        """Insert text, or bump its weight if already present."""
+        if not (text or "").strip():
+            return
+        key = text.lower()
+        path = self._path(key)
+        leaf = path[-1]
+        leaf.text = text
+        leaf.weight += float(weight)
+        entry = (leaf.weight, text)
+        for node in path:
+            top = [t for t in node.top if t[1].lower() != key]
+            top.append(entry)
+            top.sort(key=lambda t: -t[0])
+            node.top = top[:self.k]
+
+    def remove(self, text: str) -> None:
+        key = (text or "").lower()
+        node = self.root
+        path = [node]
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return
+            path.append(node)
+        if node.text is None:
+            return
+        node.text = None
+        node.weight = 0.0
+        # rebuild the best-k lists bottom-up from the children's lists
+        for node in reversed(path):
+            pool = [(node.weight, node.text)] if node.text is not None else []
+            for child in node.children.values():
+                pool.extend(child.top)
+            pool.sort(key=lambda t: -t[0])
+            node.top = pool[:self.k]
+
+    def complete(self, prefix: str, k: Optional[int] = None) -> List[str]:
+        node = self.root
+        for ch in (prefix or "").lower():
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        top = node.top if k is None else node.top[:k]
+        return [text for _, text in top]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from typing import Dict, List, Optional, Tuple, Any
 import time
 import random
 import re
 
+from deskpet.history import ConversationHistory
+from deskpet.markov import NGramModel
+from deskpet.autocomplete import COMMAND_FORMS, PrefixTrie
+
 
 DEFAULT_TRAITS: Dict[str, float] = {
     "trust": 50.0,
@@ -21,6 +25,10 @@ DEFAULT_TRAITS: Dict[str, float] = {
 TRAIT_MIN = 0.0
 TRAIT_MAX = 100.0
 
+HABIT_HALF_LIFE_DAYS = 14.0
+HABIT_MIN_EVENTS = 3.0      # decayed count before a routine is believed
+HABIT_MIN_SHARE = 0.35      # share of events within an hour of the peak hour
+
 
 def _clamp(v: float, lo: float = TRAIT_MIN, hi: float = TRAIT_MAX) -> float:
     return lo if v < lo else hi if v > hi else v
@@ -66,6 +74,62 @@ class CareStats:
     praised_by_day: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class HabitHistogram:
+    """
+    Exponentially decayed hour-of-day / weekday counts for one event kind.
+
+    Instead of decaying every bin on every event, new events are added with
+    weight 2**((ts - ref_ts) / half_life); older bins shrink relative to them
+    automatically. When weights get large everything is rescaled once (31
+    bins), so updates stay O(1) and memory stays fixed.
+    """
+    hours: List[float] = field(default_factory=lambda: [0.0] * 24)
+    weekdays: List[float] = field(default_factory=lambda: [0.0] * 7)
+    total: float = 0.0
+    ref_ts: float = 0.0
+
+    def _scale(self, ts: float) -> float:
+        return 2.0 ** ((ts - self.ref_ts) / (HABIT_HALF_LIFE_DAYS * 86400.0))
+
+    def add(self, ts: float) -> None:
+        if self.total == 0.0:
+            self.ref_ts = ts
+        w = self._scale(ts)
+        if w > 1e6:
+            self._rebase(ts)
+            w = 1.0
+        lt = time.localtime(ts)
+        self.hours[lt.tm_hour] += w
+        self.weekdays[lt.tm_wday] += w
+        self.total += w
+
+    def _rebase(self, ts: float) -> None:
+        k = 1.0 / self._scale(ts)
+        self.hours = [v * k for v in self.hours]
+        self.weekdays = [v * k for v in self.weekdays]
+        self.total *= k
+        self.ref_ts = ts
+
+    def weight_now(self, now_ts: float) -> float:
+        """Decayed number of events as seen from now_ts."""
+        return self.total / self._scale(now_ts) if self.total > 0 else 0.0
+
+    def peak_hour(self) -> Tuple[int, float]:
+        """(busiest hour, share of events within an hour either side of it)."""
+        if self.total <= 0:
+            return 0, 0.0
+        h = self.hours
+        best = max(range(24), key=lambda i: (h[i], h[i - 1] + h[(i + 1) % 24]))
+        return best, (h[best - 1] + h[best] + h[(best + 1) % 24]) / self.total
+
+    def peak_weekday(self) -> Tuple[int, float]:
+        if self.total <= 0:
+            return 0, 0.0
+        best = max(range(7), key=lambda i: self.weekdays[i])
+        return best, self.weekdays[best] / self.total
+
+
 @dataclass
 class BrainState:
     pet_name: str = "FenPet"
@@ -82,12 +146,16 @@ class BrainState:
     last_user_utterances: List[str] = field(default_factory=list)
     last_pet_replies: List[str] = field(default_factory=list)
 
+    # full, searchable conversation log (both speakers)
+    history: ConversationHistory = field(default_factory=ConversationHistory)
+
     # mechanical learning: phrase triggers -> replies
     phrase_memory: Dict[str, str] = field(default_factory=dict)
 
     # word + habit memory (your earlier “word_memory/habit_memory” direction)
     word_memory: Dict[str, str] = field(default_factory=dict)        # key -> value
     habit_memory: Dict[str, float] = field(default_factory=dict)     # metric -> score
+    habit_hist: Dict[str, HabitHistogram] = field(default_factory=dict)  # event kind -> when it happens
 
     care: CareStats = field(default_factory=CareStats)
 
@@ -127,12 +195,27 @@ class PetBrain:
         self._ask_name = {"your name", "who are you", "what are you"}
         self._help = {"help", "how", "what can you do", "commands"}
 
+        # learned echo of the user's own phrasing (rebuilt from history, not saved)
+        self.ngram = NGramModel()
+        for _, speaker, text in self.state.history.entries:
+            if speaker == "user":
+                self.ngram.train(text)
+
+        # chat-box completions: command forms + everything taught/remembered
+        self.completer = PrefixTrie(entries=COMMAND_FORMS)
+        for key in self.state.phrase_memory:
+            self.completer.add(key)
+        for key in self.state.word_memory:
+            self.completer.add(key)
+
     # ---------------------------
     # Persistence
     # ---------------------------
 
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self.state)
+        # asdict deep-copies every field; the history (postings and all) is saved as rows instead
+        d = asdict(replace(self.state, history=None))
+        d["history"] = self.state.history.to_list()
         d["interaction_log"] = [asdict(ev) for ev in self.state.interaction_log]
         return d
 
@@ -165,9 +248,11 @@ class PetBrain:
             interaction_log=[],
             last_user_utterances=list(d.get("last_user_utterances", [])),
             last_pet_replies=list(d.get("last_pet_replies", [])),
+            history=ConversationHistory.from_list(d.get("history", [])),
             phrase_memory=dict(d.get("phrase_memory", {})),
             word_memory=dict(d.get("word_memory", {})),
             habit_memory={k: float(v) for k, v in (d.get("habit_memory", {}) or {}).items()},
+            habit_hist={},
             care=care,
             mood=d.get("mood", "neutral"),
             last_chat_ts=float(d.get("last_chat_ts", 0.0)),
@@ -188,6 +273,21 @@ class PetBrain:
             except Exception:
                 continue
 
+        for kind, hd in (d.get("habit_hist", {}) or {}).items():
+            try:
+                hours = [float(v) for v in hd.get("hours", [])]
+                weekdays = [float(v) for v in hd.get("weekdays", [])]
+                if len(hours) != 24 or len(weekdays) != 7:
+                    continue
+                st.habit_hist[str(kind)] = HabitHistogram(
+                    hours=hours,
+                    weekdays=weekdays,
+                    total=float(hd.get("total", 0.0)),
+                    ref_ts=float(hd.get("ref_ts", 0.0)),
+                )
+            except Exception:
+                continue
+
         for k in list(st.traits.keys()):
             st.traits[k] = _clamp(float(st.traits[k]))
 
@@ -423,6 +523,11 @@ class PetBrain:
             care.last_talk_ts = now_ts
             care.talked_by_day[today] = int(care.talked_by_day.get(today, 0)) + 1
 
+        hist = self.state.habit_hist.get(kind)
+        if hist is None:
+            hist = self.state.habit_hist[kind] = HabitHistogram()
+        hist.add(now_ts)
+
         self._apply_event_to_traits(ev)
         self._refresh_mood_from_recent()
 
@@ -508,12 +613,16 @@ class PetBrain:
         if not k or not v:
             return
         self.state.word_memory[k[:40]] = v[:120]
+        self.completer.add(k[:40])
 
     def forget(self, key: str) -> bool:
         k = (key or "").strip().lower()
         if not k:
             return False
-        return self.state.word_memory.pop(k, None) is not None
+        found = self.state.word_memory.pop(k, None) is not None
+        if found and k not in self.state.phrase_memory:
+            self.completer.remove(k)
+        return found
 
     # ---------------------------
     # Chat (mechanical learning)
@@ -534,6 +643,7 @@ class PetBrain:
         if taught:
             key, val = taught
             self.state.phrase_memory[key] = val
+            self.completer.add(key, weight=2.0)
             return self._reply(f"Okay. When you say “{key}”, I’ll say “{val}”.", kind="talked")
 
         # Word memory: "remember that X is Y" or "remember X = Y"
@@ -555,6 +665,14 @@ class PetBrain:
                 return self._reply(f"I don’t have anything for “{k}” yet.", kind="talked")
             return self._reply(f"{k} = {v}", kind="talked")
 
+        # Recall: "what did I tell you about X"
+        about = self._parse_history_query(txt)
+        if about:
+            hits = self.recall(about, speaker="user", limit=1, before=len(self.state.history) - 1)
+            if not hits:
+                return self._reply(f"I don’t think you’ve told me about “{about}”.", kind="talked")
+            return self._reply(f"You said: “{hits[0][2]}”", kind="talked")
+
         # Forget: "forget X"
         forget_key = self._parse_forget(txt)
         if forget_key:
@@ -619,6 +737,9 @@ class PetBrain:
         if "how are you" in low or "hru" in low:
             return self._reply(self._status_line(), kind="talked")
 
+        if "routine" in low or "habit" in low:
+            return self._reply(self._habit_line(), kind="talked")
+
         if "fight" in low or "combat" in low:
             if brave >= 60:
                 return self._reply("Point me at a monster. I’ll handle the negotiations.", kind="talked")
@@ -632,6 +753,11 @@ class PetBrain:
         if curious >= 65 and self.rng.random() < 0.35:
             return self._reply(self._curious_prompt(), kind="talked")
 
+        if self.ngram.sentences >= 12 and self.rng.random() < 0.25:
+            babble = self.ngram.generate(self.rng, max_words=10)
+            if babble and babble != low:
+                return self._reply(babble, kind="talked")
+
         options = []
         if trust >= 60:
             options += ["I’m listening.", "Tell me more.", "Okay. What next?"]
@@ -648,12 +774,20 @@ class PetBrain:
         if len(self.state.last_pet_replies) > 25:
             self.state.last_pet_replies = self.state.last_pet_replies[-25:]
         self.state.last_chat_ts = _now()
+        self.state.history.add("pet", text, self.state.last_chat_ts)
         return text
 
     def _remember_utterance(self, txt: str) -> None:
         self.state.last_user_utterances.append(txt)
         if len(self.state.last_user_utterances) > 25:
             self.state.last_user_utterances = self.state.last_user_utterances[-25:]
+        self.state.history.add("user", txt, _now())
+        self.ngram.train(txt)
+
+    def recall(self, query: str, *, speaker: Optional[str] = None, limit: int = 5,
+               before: Optional[int] = None) -> List[Tuple[float, str, str]]:
+        """Newest-first (ts, speaker, text) lines from the whole history mentioning the query words."""
+        return self.state.history.search(query, speaker=speaker, limit=limit, before=before)
 
     def _parse_teaching(self, txt: str) -> Optional[Tuple[str, str]]:
         t = txt.strip()
@@ -692,6 +826,13 @@ class PetBrain:
             return m.group(1).strip().lower()
         return None
 
+    def _parse_history_query(self, txt: str) -> Optional[str]:
+        # "what did I tell you about X" / "what did I say about X"
+        m = re.search(r"^\s*what did i (?:tell you|say)(?: to you)? about (.+?)\s*\??\s*$", txt, flags=re.IGNORECASE)
+        if m:
+            return m.group(1).strip().lower()
+        return None
+
     def _parse_forget(self, txt: str) -> Optional[str]:
         m = re.search(r"^\s*forget\s+(.+)\s*$", txt, flags=re.IGNORECASE)
         if m:
@@ -730,6 +871,40 @@ class PetBrain:
         ]
         return self.rng.choice(prompts)
 
+    # ---------------------------
+    # Habits
+    # ---------------------------
+
+    def top_habits(self, n: int = 3, now_ts: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Strongest routines, e.g. {"kind": "fed", "hour": 9, "share": 0.6, ...}.
+        Only kinds with enough recent events and a clear peak are returned.
+        """
+        now_ts = _now() if now_ts is None else float(now_ts)
+        out = []
+        for kind, hist in self.state.habit_hist.items():
+            count = hist.weight_now(now_ts)
+            if count < HABIT_MIN_EVENTS:
+                continue
+            hour, share = hist.peak_hour()
+            if share < HABIT_MIN_SHARE:
+                continue
+            wday, wday_share = hist.peak_weekday()
+            out.append({
+                "kind": kind, "hour": hour, "share": share,
+                "weekday": wday, "weekday_share": wday_share, "count": count,
+            })
+        out.sort(key=lambda h: h["share"] * h["count"], reverse=True)
+        return out[:n]
+
+    def _habit_line(self) -> str:
+        habits = self.top_habits(n=2)
+        if not habits:
+            return "I haven’t figured out your routine yet."
+        verbs = {"fed": "feed me", "talked": "talk to me", "played": "play with me", "praised": "praise me"}
+        parts = [f"you usually {verbs.get(h['kind'], h['kind'])} around {h['hour']}" for h in habits]
+        return "I’ve noticed " + " and ".join(parts) + "."
+
     def _status_line(self) -> str:
         t = self.state.traits
         mood = self.state.mood
@@ -8,9 +8,32 @@ PET_SPRITES = {
     "alt": ASSETS_DIR / "fenrir2.png",
 }
 
+PET_SPRITE_SCALE = 1.0
+PET_WALK_FRAMES = ("idle", "alt")
+PET_WALK_FRAME_SECS = 0.18
+PET_WALK_MIN_SPEED = 30.0
+
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 TICK_MS = 50
+# sim thread: after a stall longer than this many ticks, resync instead of fast-forwarding
+SIM_MAX_CATCHUP_TICKS = 5
+# ticks' worth of input stamps kept for the renderer to claim (nothing drawing: oldest go)
+SIM_STAMP_BACKLOG = 256
+# the sim's overlay stats (profiler lines) go into snapshots this often, not every tick
+SIM_STATS_SECS = 0.5
+
+# per-entity tick phases on a thread pool (free-threaded Python only; 0 = one per core)
+PARALLEL_WORKERS = 0
+PARALLEL_MIN_CHUNK = 64
+
+# run the simulation in its own process; state comes back through shared memory
+SIM_PROCESS = False
+SHM_MAX_PETS = 4096       # rows reserved per entity kind; extras aren't drawn
+SHM_MAX_ENEMIES = 4096
+SHM_MAX_FOOD = 1024
+SHM_MAX_TOYS = 64
+SHM_META_BYTES = 16384    # focus / overlay stats / input stamps, as JSON
 
 SPAWN_INTERVAL_TICKS = 200
 MAX_ENEMIES = 3
@@ -18,6 +41,12 @@ MAX_ENEMIES = 3
 ATTACK_RANGE = 26
 FOOD_EAT_RANGE = 22
 HUNGER_START_SEEK_FOOD = 25.0
+PET_HUNGER_RATE = 0.6     # hunger gained per tick (0..100)
+
+# food claims: hungry pets are matched to pellets within this radius first
+FOOD_CLAIM_RADIUS = 480.0
+# once all pellets are claimed, each extra pet on a pellet counts as this many px farther
+FOOD_SHARE_PENALTY = 60.0
 
 # ----------------------------
 # Physics / ground
@@ -37,7 +66,11 @@ STOP_EPS_SKID = 12.0
 # Drag / throw
 # ----------------------------
 THROW_MODE = "gentle"  # "gentle" or "yeet"
-THROW_SMOOTHING = 0.35
+# throw velocity = least-squares fit over the drag samples from the last THROW_FIT_SECS
+THROW_FIT_SECS = 0.08
+
+# input-to-photon latency histograms are written here on quit
+LATENCY_DUMP_PATH = "deskpet_latency.json"
 
 THROW_SCALE_GENTLE = 0.70
 MAX_THROW_SPEED_GENTLE = 1400.0
@@ -73,6 +106,12 @@ ENEMY_JUMP_COOLDOWN = 1.5
 ENEMY_WANDER_HOP_RATE = 0.20
 ENEMY_CHASE_HOP_RATE = 0.25
 
+# AI level of detail: bugs with no fenling within NEAR radius (and no cursor
+# close by) run a cheap wander every FAR_STRIDE-th AI turn
+ENEMY_LOD_NEAR_RADIUS = 360.0
+ENEMY_LOD_CURSOR_RADIUS = 200.0
+ENEMY_LOD_FAR_STRIDE = 3
+
 PET_ATTACK_COOLDOWN = 0.45
 ENEMY_ATTACK_COOLDOWN = 0.65
 PET_DAMAGE = 2
@@ -95,6 +134,12 @@ CURSOR_POKE_RADIUS = 40
 CURSOR_STILL_SPEED = 40.0
 CURSOR_FAST_SPEED = 250.0
 
+# cursor speed = path length over this trailing window of <Motion> samples
+CURSOR_SPEED_WINDOW_SECS = 0.10
+# click-through windows get no <Motion>; poll the global pointer this often instead
+CURSOR_POLL_SECS = 0.10
+CURSOR_POLL_SPEED_WINDOW_SECS = 0.30
+
 CURSOR_REACT_COOLDOWN = 1.0
 CURSOR_POKE_IRRITATION = 0.12
 CURSOR_POKE_FOR_FRUSTRATION_JUMP = 5
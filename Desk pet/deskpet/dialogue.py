@@ -1,85 +1,160 @@
 from __future__ import annotations
 import random
+import re
+from typing import Callable, Dict, List, Optional, Tuple
 from deskpet.util.mathutil import clamp
 from deskpet.personality import ensure_personality
 
 
+# ----------------------------
+# Rule table
+# ----------------------------
+# Rules are checked in priority order (first listed wins). Keywords are whole
+# tokens or token phrases, so "hi" no longer fires inside "this".
+# Each rule lists (condition, replies) cases; the first case whose condition
+# holds is used, None means "otherwise". "{name}" is filled with the pet name.
+
+INTENT_RULES = (
+    {"intent": "greet", "keywords": ("hi", "hello", "hey", "yo"),
+     "cases": (("trusting", ("hi!", "hey!", "hello human.")),
+               (None, ("hm.", "…hi.", "hi.")))},
+
+    {"intent": "name", "keywords": ("name", "who are you", "what are you"),
+     "cases": ((None, ("i'm {name}.", "{name}. that's me.", "{name}. don't forget it.")),)},
+
+    {"intent": "food", "keywords": ("hungry", "food", "eat"),
+     "cases": (("hungry", ("yes. food. now.", "i would like… snacks.", "my tummy is yelling.")),
+               (None, ("i'm okay for now.", "later. maybe.", "not starving yet.")))},
+
+    {"intent": "play", "keywords": ("play", "ball", "toy"),
+     "cases": (("keen_to_play", ("BALL!!", "yes yes yes.", "throw it. i dare you.")),
+               (None, ("maybe later.", "not feeling it.", "…fine. one ball.")))},
+
+    {"intent": "sorry", "keywords": ("sorry", "apologize"),
+     "cases": (("still_hurt", ("hmpf.", "i will remember this… and also forgive. maybe.", "…okay. softer next time.")),
+               (None, ("okay.", "we're good.", "fine.")))},
+
+    {"intent": "praise", "keywords": ("love you", "good", "good job", "nice"),
+     "cases": (("clingy", ("again. say it again.", "stay here.", "i like that.")),
+               (None, (":)", "thanks.", "i'm trying.")))},
+
+    {"intent": "calm", "keywords": ("stop", "calm", "sit"),
+     "cases": (("annoyed", ("finally.", "yes. silence.", "good.")),
+               (None, ("ok.", "sure.", "sitting-ish.")))},
+)
+
+# fallback based on current vibe
+FALLBACK_CASES = (
+    ("scared", ("…keep the bugs away.", "too many eyes.", "i don't like this.")),
+    ("annoyed", ("no.", "don't.", "…what.")),
+    ("happy_after_ball", ("again!!", "we are unstoppable.", "more chaos please.")),
+    ("happy", ("♪", "hi hi!", "this is nice.")),
+    ("bored", ("i'm bored.", "something happen.", "ball? bug? anything?")),
+    (None, ("hm.", "okay.", "i'm listening.", "…")),
+)
+
+
+def _trait(pet, key: str) -> float:
+    return float(pet.traits.get(key, 0.5))
+
+
+def _recent_event(pet, needle: str) -> bool:
+    return any(needle in e for e in list(getattr(pet, "event_log", []))[-6:])
+
+
+CONDITIONS: Dict[str, Callable] = {
+    "trusting": lambda pet: _trait(pet, "trust") > 0.6,
+    "hungry": lambda pet: getattr(pet, "hunger", 0.0) >= 30,
+    "keen_to_play": lambda pet: _trait(pet, "playful") > 0.6 or getattr(pet, "boredom", 0.0) > 40,
+    "still_hurt": lambda pet: _recent_event(pet, "thrown") and _trait(pet, "trust") < 0.55,
+    "clingy": lambda pet: _trait(pet, "clingy") > 0.65,
+    "annoyed": lambda pet: getattr(pet, "mood_state", "content") == "annoyed",
+    "scared": lambda pet: getattr(pet, "mood_state", "content") == "scared",
+    "happy_after_ball": lambda pet: getattr(pet, "mood_state", "content") == "happy" and _recent_event(pet, "ball"),
+    "happy": lambda pet: getattr(pet, "mood_state", "content") == "happy",
+    "bored": lambda pet: getattr(pet, "boredom", 0.0) > 55,
+}
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+# ----------------------------
+# Compiled engine
+# ----------------------------
+
+class IntentEngine:
+    """
+    Compiles a rule table once:
+      - token index: first token -> [(phrase tokens, rule rank, intent)]
+      - reply cases: intent -> ((condition fn, replies, needs_name), ...)
+    A reply is then one pass over the input tokens plus a few condition checks.
+    """
+
+    def __init__(self, rules=INTENT_RULES, fallback=FALLBACK_CASES, conditions=CONDITIONS):
+        self.index: Dict[str, List[Tuple[Tuple[str, ...], int, str]]] = {}
+        self.cases: Dict[str, Tuple] = {}
+
+        for rank, rule in enumerate(rules):
+            intent = rule["intent"]
+            for kw in rule["keywords"]:
+                phrase = tuple(tokenize(kw))
+                if phrase:
+                    self.index.setdefault(phrase[0], []).append((phrase, rank, intent))
+            self.cases[intent] = self._compile_cases(rule["cases"], conditions)
+        self.fallback = self._compile_cases(fallback, conditions)
+
+    @staticmethod
+    def _compile_cases(cases, conditions):
+        out = []
+        for cond, replies in cases:
+            fn = conditions[cond] if cond is not None else None
+            out.append((fn, tuple(replies), any("{name}" in r for r in replies)))
+        return tuple(out)
+
+    def match(self, tokens: List[str]) -> Optional[str]:
+        best_rank, best_intent = 1 << 30, None
+        n = len(tokens)
+        for i, tok in enumerate(tokens):
+            entries = self.index.get(tok)
+            if not entries:
+                continue
+            for phrase, rank, intent in entries:
+                if rank >= best_rank:
+                    continue
+                k = len(phrase)
+                if k == 1 or (i + k <= n and tuple(tokens[i:i + k]) == phrase):
+                    best_rank, best_intent = rank, intent
+            if best_rank == 0:
+                break
+        return best_intent
+
+    def reply(self, pet, text: str, rng: random.Random) -> str:
+        intent = self.match(tokenize(text))
+        cases = self.cases[intent] if intent is not None else self.fallback
+        for fn, replies, needs_name in cases:
+            if fn is None or fn(pet):
+                choice = _pick(replies, rng)
+                return choice.format(name=pet.name) if needs_name else choice
+        return ""
+
+
 def _pick(options, rng: random.Random) -> str:
     return rng.choice(options) if options else ""
 
 
-def generate_reply(world, pet, user_text: str) -> str:
+_ENGINE = IntentEngine()
+_RNG = random.Random()
+
+
+def generate_reply(world, pet, user_text: str, rng: Optional[random.Random] = None) -> str:
     """
     Local, rule-based “chat” that feels alive.
     No network. No ML libs. Just mood + traits + recent context.
     """
     ensure_personality(pet)
-
-    txt = (user_text or "").strip().lower()
-    rng = random.Random(hash((pet.name, world.t, txt)) & 0xFFFFFFFF)
-
-    # quick state
-    mood_state = getattr(pet, "mood_state", "content")
-    hunger = getattr(pet, "hunger", 0.0)
-    boredom = getattr(pet, "boredom", 0.0)
-
-    trust = float(pet.traits.get("trust", 0.5))
-    bold = float(pet.traits.get("bold", 0.5))
-    clingy = float(pet.traits.get("clingy", 0.5))
-    playful = float(pet.traits.get("playful", 0.5))
-
-    last_events = list(getattr(pet, "event_log", []))[-6:]
-    recently_thrown = any("thrown" in e for e in last_events)
-    recently_ball = any("ball" in e for e in last_events)
-
-    # intent-ish keyword buckets
-    if any(k in txt for k in ["hi", "hello", "hey", "yo"]):
-        if trust > 0.6:
-            return _pick(["hi!", "hey!", "hello human."], rng)
-        return _pick(["hm.", "…hi.", "hi."], rng)
-
-    if any(k in txt for k in ["name", "who are you", "what are you"]):
-        return _pick([f"i'm {pet.name}.", f"{pet.name}. that's me.", f"{pet.name}. don't forget it."], rng)
-
-    if any(k in txt for k in ["hungry", "food", "eat"]):
-        if hunger >= 30:
-            return _pick(["yes. food. now.", "i would like… snacks.", "my tummy is yelling."], rng)
-        return _pick(["i'm okay for now.", "later. maybe.", "not starving yet."], rng)
-
-    if any(k in txt for k in ["play", "ball", "toy"]):
-        if playful > 0.6 or boredom > 40:
-            return _pick(["BALL!!", "yes yes yes.", "throw it. i dare you."], rng)
-        return _pick(["maybe later.", "not feeling it.", "…fine. one ball."], rng)
-
-    if any(k in txt for k in ["sorry", "apologize"]):
-        if recently_thrown and trust < 0.55:
-            return _pick(["hmpf.", "i will remember this… and also forgive. maybe.", "…okay. softer next time."], rng)
-        return _pick(["okay.", "we're good.", "fine."], rng)
-
-    if any(k in txt for k in ["love you", "good", "good job", "nice"]):
-        if clingy > 0.65:
-            return _pick(["again. say it again.", "stay here.", "i like that."], rng)
-        return _pick([":)", "thanks.", "i'm trying."], rng)
-
-    if any(k in txt for k in ["stop", "calm", "sit"]):
-        if mood_state == "annoyed":
-            return _pick(["finally.", "yes. silence.", "good."], rng)
-        return _pick(["ok.", "sure.", "sitting-ish."], rng)
-
-    # fallback based on current vibe
-    if mood_state == "scared":
-        return _pick(["…keep the bugs away.", "too many eyes.", "i don't like this."], rng)
-
-    if mood_state == "annoyed":
-        return _pick(["no.", "don't.", "…what."], rng)
-
-    if mood_state == "happy":
-        if recently_ball:
-            return _pick(["again!!", "we are unstoppable.", "more chaos please."], rng)
-        return _pick(["♪", "hi hi!", "this is nice."], rng)
-
-    # content
-    if boredom > 55:
-        return _pick(["i'm bored.", "something happen.", "ball? bug? anything?"], rng)
-
-    return _pick(["hm.", "okay.", "i'm listening.", "…"], rng)
\ No newline at end of file
+    return _ENGINE.reply(pet, user_text, rng or _RNG)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     eid: int
     x: float
@@ -20,6 +20,7 @@ class Enemy:
 
     # AI steering
     vx_desired: float = 0.0
+    ai_phase: int = 0  # staggered AI slot, fixed at spawn
 
     # Skitter identity
     skitter_phase: float = 0.0
@@ -31,8 +32,13 @@ class Enemy:
     orbit_dir: int = 1            # -1 or +1
     style_until: float = 0.0
 
-    # Combat timing
-    attack_cd: float = 0.0
+    # AI level of detail: 0 = full chase/orbit, 1 = cheap far wander
+    lod: int = 0
+    lod_skip: int = 0
+
+    # Combat timing (absolute world-clock deadline)
+    attack_ready_at: float = 0.0
+    last_jump_time: float = 0.0
 
     # Debug
     last_impact: float = 0.0
\ No newline at end of file
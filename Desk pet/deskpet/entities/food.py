@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Food:
     x: float
     y: float
-    kind: str = "kibble"
\ No newline at end of file
+    kind: str = "kibble"
+    fid: int = 0  # World pool id
\ No newline at end of file
@@ -1,26 +1,79 @@
 from dataclasses import dataclass, field
-from typing import Optional, Dict
-
-@dataclass
-class Pet:
-    x: float = 200.0
-    y: float = 200.0
-    hp: int = 10
-    max_hp: int = 10
-    hunger: float = 0.0
-    alive: bool = True
-
-@dataclass
-class Enemy:
-    eid: int
+from typing import Dict, Optional, Tuple
+
+from deskpet.config import FOOD_TYPES
+
+# Immutable per-tick snapshots of the world, published by the simulation
+# thread (deskpet/sim.py) and read by the renderer on the Tk thread.
+# Only what drawing / hit-testing needs; never mutate, never keep entity refs.
+
+
+# Entity rows: every entity of a kind is one row of float64 columns, packed
+# row-major in a single buffer (an array in thread mode, a slice of the
+# shared-memory copy in process mode). The renderer reads them by column.
+
+PET_COLS = ("handle", "x", "y", "w", "h", "vx", "on_ground", "held")
+ENEMY_COLS = ("eid", "x", "y", "w", "h")
+FOOD_COLS = ("fid", "x", "y", "kind")     # kind: index into FOOD_KINDS
+TOY_COLS = ("tid", "x", "y", "r")
+FOOD_KINDS = tuple(FOOD_TYPES)
+
+
+class Rows:
+    """n rows x len(cols) float64s in one buffer; col() is a zero-copy strided view."""
+
+    __slots__ = ("cols", "data", "n")
+
+    def __init__(self, cols: Tuple[str, ...], data=b""):
+        mv = memoryview(data)
+        self.cols = cols
+        self.data = mv if mv.format == "d" else mv.cast("d")
+        self.n = len(self.data) // len(cols)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def col(self, name: str) -> memoryview:
+        return self.data[self.cols.index(name)::len(self.cols)]
+
+
+@dataclass(frozen=True, slots=True)
+class Focus:
+    handle: int
+    name: str
     x: float
     y: float
-    hp: int = 6
-    speed: float = 1.2
+    h: float
+    mood: float
+    mood_state: str
+    boredom: float
+    bug_bits: int
+    selected_food_kind: str
+    bubble: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Grab:
+    """Entity currently held by the mouse: kind is "pet", "enemy" or "toy"."""
+    kind: str
+    key: int
+    off_x: float
+    off_y: float
+    half_w: float
+    half_h: float
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorldState:
-    pet: Pet = field(default_factory=Pet)
-    enemies: Dict[int, Enemy] = field(default_factory=dict)
-    next_eid: int = 1
-    t: int = 0
+    t: int
+    time_s: float
+    width: float
+    height: float
+    focused: Focus
+    pets: Rows = field(default_factory=lambda: Rows(PET_COLS))
+    enemies: Rows = field(default_factory=lambda: Rows(ENEMY_COLS))
+    food: Rows = field(default_factory=lambda: Rows(FOOD_COLS))
+    toys: Rows = field(default_factory=lambda: Rows(TOY_COLS))
+    grab: Optional[Grab] = None
+    lod: Dict[str, int] = field(default_factory=dict)
+    stats: Tuple[Tuple[str, str], ...] = ()
@@ -1,12 +1,31 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict
+import heapq
 from deskpet.util.mathutil import clamp
+from deskpet.util.timerwheel import TimerWheel
+from deskpet.entities.traits import Traits, OriginMemory
 
+BUBBLE_MAX = 3
 
-@dataclass
+
+@dataclass(slots=True, order=True)
+class Bubble:
+    # heap order: highest priority first, then oldest
+    neg_prio: int
+    seq: int
+    until: float = field(compare=False)
+    text: str = field(compare=False)
+
+    @property
+    def prio(self) -> int:
+        return -self.neg_prio
+
+
+@dataclass(slots=True)
 class Pet:
     # Fenling identity
     name: str = "Fenling"
+    handle: int = 0  # stable World registry key
 
     x: float = 200.0
     y: float = 200.0
@@ -21,15 +40,18 @@ class Pet:
 
     # AI steering
     vx_desired: float = 0.0
+    ai_phase: int = 0  # staggered AI: thinks on ticks where t % ai_slots == ai_phase
 
     # Wander
     wander_tx: float = 200.0
     wander_until: float = 0.0
     wander_pause_until: float = 0.0
 
-    # Combat timing
-    attack_cd: float = 0.0
+    # Combat timing (absolute world-clock deadlines, not countdowns)
+    attack_ready_at: float = 0.0
     target_eid: Optional[int] = None
+    ai_choice: str = "wander"  # last utility-AI pick (debug overlay)
+    food_fid: Optional[int] = None  # claimed pellet (World.food_claims)
 
     # Debug/physics
     last_impact: float = 0.0
@@ -52,12 +74,14 @@ class Pet:
     dock_progress: float = 0.0
     stagger_until: float = 0.0
 
-    cursor_react_cd: float = 0.0
+    cursor_react_ready_at: float = 0.0
     poke_count: int = 0
     last_poke_time: float = -999.0
 
-    bubbles: List[Dict] = field(default_factory=list)
-    bubble_cd: float = 0.0
+    bubbles: List[Bubble] = field(default_factory=list)  # min-heap, bubbles[0] is shown
+    bubble_ready_at: float = 0.0
+    bubble_seq: int = 0
+    timers: Optional[TimerWheel] = None  # World's wheel; expires bubbles
 
     # Per-Fenling inventory + per-Fenling food selection
     inventory: Dict = field(default_factory=lambda: {"bug_bits": 0})
@@ -68,13 +92,8 @@ class Pet:
     _is_playing: bool = False
 
     # Wave 7 personality scaffold (local, no save yet)
-    traits: Dict = field(default_factory=lambda: {
-        "trust": 0.50, "bold": 0.50, "clingy": 0.50, "playful": 0.50
-    })
-    origin_memory: Dict = field(default_factory=lambda: {
-        "named": False, "fed_first": False, "played_first": False,
-        "petted_first": False, "thrown_first": False, "poked_first": False
-    })
+    traits: Traits = field(default_factory=Traits)
+    origin_memory: OriginMemory = field(default_factory=OriginMemory)
     event_log: List[str] = field(default_factory=list)
 
     def heal(self, amount: int):
@@ -97,8 +116,22 @@ class Pet:
         self.hunger = clamp(self.hunger + self.hunger_rate, 0, 100)
 
     def push_bubble(self, text: str, now_s: float, ttl: float = 2.2, priority: int = 50):
-        if self.bubble_cd > 0:
+        if now_s < self.bubble_ready_at:
             return
-        self.bubbles.append({"text": text, "until": now_s + ttl, "prio": priority})
-        self.bubbles = sorted(self.bubbles, key=lambda b: b["prio"], reverse=True)[:3]
-        self.bubble_cd = 0.7
\ No newline at end of file
+        self.bubble_seq += 1
+        b = Bubble(-int(priority), self.bubble_seq, now_s + ttl, text)
+        heapq.heappush(self.bubbles, b)
+        if len(self.bubbles) > BUBBLE_MAX:
+            # drop the lowest-priority (newest on ties); k is tiny
+            self.bubbles.remove(max(self.bubbles))
+            heapq.heapify(self.bubbles)
+        if self.timers is not None:
+            self.timers.schedule(b.until, self.expire_bubble, b)
+        self.bubble_ready_at = now_s + 0.7
+
+    def expire_bubble(self, b: Bubble):
+        try:
+            self.bubbles.remove(b)
+        except ValueError:
+            return  # already pushed out by higher-priority bubbles
+        heapq.heapify(self.bubbles)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class ToyBall:
     x: float
     y: float
@@ -15,4 +15,5 @@ class ToyBall:
 
     held: bool = False
     on_ground: bool = False
-    last_impact: float = 0.0
\ No newline at end of file
+    last_impact: float = 0.0
+    tid: int = 0  # World pool id
\ No newline at end of file
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, fields
+
+
+class _Record:
+    """Fixed-layout record that still reads like the old dicts: rec["trust"], rec.get("trust", 0.5)."""
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self):
+        return [f.name for f in fields(self)]
+
+    def items(self):
+        return [(f.name, getattr(self, f.name)) for f in fields(self)]
+
+
+@dataclass(slots=True)
+class Traits(_Record):
+    trust: float = 0.50
+    bold: float = 0.50
+    clingy: float = 0.50
+    playful: float = 0.50
+
+
+@dataclass(slots=True)
+class OriginMemory(_Record):
+    named: bool = False
+    fed_first: bool = False
+    played_first: bool = False
+    petted_first: bool = False
+    thrown_first: bool = False
+    poked_first: bool = False
@@ -0,0 +1,280 @@
+"""
+Headless balance sweeps: many seeded World runs across a process pool.
+
+    python -m deskpet.farm bench/balance.json -o balance.parquet
+
+The spec (JSON) declares how long each run is, how many seeds per point, the
+simulated player policies, and a grid of config.py overrides:
+
+    {
+      "hours": 1.0,          sim time per run
+      "seeds": 8,            runs per (grid point, policy)
+      "seed": 0,             base seed; every grid point sees the same seeds
+      "pets": 3,
+      "world": [1920, 1080],
+      "policies": ["idle", "feeder", "attentive"],
+      "grid": {"MAX_ENEMIES": [3, 6], "ENEMY_DAMAGE": [1, 2]}
+    }
+
+One row per run goes into a columnar file: .parquet if pyarrow is
+installed, otherwise JSON {"column": [values, ...]}. A per-point summary
+(mean over seeds) is printed at the end.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from deskpet import config
+from deskpet.entities.enemy import Enemy
+from deskpet.util.mathutil import dist
+from deskpet.world import World
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: JSON columns instead
+    pa = None
+
+SAMPLE_TICKS = 20          # metrics sampled once per sim second
+POLICY_TICKS = 10          # simulated player acts at most twice a second
+METRICS = ("survival", "downed_frac", "hungry_frac", "starving_frac", "kills_per_hour", "bits_per_hour")
+
+
+# ----------------------------
+# Simulated players
+# ----------------------------
+
+class Policy:
+    """Does nothing: the pets fend for themselves."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def step(self, world) -> None:
+        pass
+
+
+class Feeder(Policy):
+    """Drops a pellet by the hungriest pet now and then, a bit off target."""
+
+    def step(self, world) -> None:
+        if len(world.food) >= len(world.fenlings) or self.rng.random() < 0.5:
+            return
+        p = max(world.fenlings, key=lambda q: q.hunger)
+        if p.hunger >= config.HUNGER_START_SEEK_FOOD:
+            world.drop_food(p.x + self.rng.uniform(-120.0, 120.0), world.ground_y() - 32.0)
+
+
+class Attentive(Feeder):
+    """Feeder who also crafts better food with bug bits and flings bugs off pets."""
+
+    def step(self, world) -> None:
+        food_types = config.FOOD_TYPES
+        for kind in sorted(food_types, key=lambda k: -food_types[k].get("cost_bug_bits", 0)):
+            cost = food_types[kind].get("cost_bug_bits", 0)
+            if cost and world.get_focused().inventory.get("bug_bits", 0) >= cost:
+                world.try_craft_food(kind)
+                break
+        super().step(world)
+
+        if world.grabbed is None and self.rng.random() < 0.3:
+            for e in world.enemies:
+                if any(dist(p.x, p.y, e.x, e.y) <= config.ENEMY_DETECT_RADIUS * 0.5 for p in world.fenlings):
+                    if isinstance(world.pick_entity_at(e.x, e.y), Enemy):
+                        world.grab_at(e.x, e.y)
+                        world.release_grab(self.rng.choice([-1.0, 1.0]) * 1200.0, -700.0)
+                    break
+
+
+POLICIES = {"idle": Policy, "feeder": Feeder, "attentive": Attentive}
+
+
+# ----------------------------
+# One run (worker process)
+# ----------------------------
+
+@contextlib.contextmanager
+def overrides(values: Dict[str, object]):
+    """
+    Temporarily rebind config constants, in config itself and in every
+    loaded deskpet module that imported them by name. Workers run one World
+    at a time. This module may be __main__ (python -m), where nothing would
+    be rebound, so it reads the constants as config.NAME at call time.
+    """
+    saved = []
+    for name, value in values.items():
+        old = getattr(config, name)
+        for mod in list(sys.modules.values()):
+            if getattr(mod, "__name__", "").startswith("deskpet") and getattr(mod, name, None) is old:
+                saved.append((mod, name, old))
+                setattr(mod, name, value)
+    try:
+        yield
+    finally:
+        for mod, name, old in reversed(saved):
+            setattr(mod, name, old)
+
+
+def run_one(task: dict) -> dict:
+    random.seed(task["seed"])
+    with overrides(task["params"]), contextlib.redirect_stdout(io.StringIO()):
+        tick_ms = config.TICK_MS
+        hunger_seek = config.HUNGER_START_SEEK_FOOD
+        ticks = int(task["hours"] * 3600.0 * 1000.0 / tick_ms)
+        width, height = task["world"]
+        world = World(width=width, height=height, rng_seed=task["seed"])
+        world.spawn_fenlings(task["pets"] - 1)
+        policy = POLICIES[task["policy"]](random.Random(task["seed"] + 1))
+
+        pets = list(world.fenlings)
+        downed_ever = set()
+        samples = downed = hungry = starving = 0
+        for i in range(1, ticks + 1):
+            world.tick()
+            if i % POLICY_TICKS == 0:
+                policy.step(world)
+            if i % SAMPLE_TICKS == 0:
+                for p in pets:
+                    samples += 1
+                    if p.hp <= 0:
+                        downed += 1
+                        downed_ever.add(p.handle)
+                    if p.hunger >= hunger_seek:
+                        hungry += 1
+                    if p.hunger >= 100.0:
+                        starving += 1
+
+    hours = ticks * tick_ms / 1000.0 / 3600.0
+    samples = max(1, samples)
+    return {
+        "survival": 1.0 - len(downed_ever) / len(pets),
+        "downed_frac": downed / samples,
+        "hungry_frac": hungry / samples,
+        "starving_frac": starving / samples,
+        "kills_per_hour": world.kills / hours,
+        "bits_per_hour": world.bug_bits_earned / hours,
+    }
+
+
+# ----------------------------
+# Spec -> tasks -> columns
+# ----------------------------
+
+def load_spec(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    spec.setdefault("hours", 1.0)
+    spec.setdefault("seeds", 4)
+    spec.setdefault("seed", 0)
+    spec.setdefault("pets", 3)
+    spec.setdefault("world", [1920, 1080])
+    spec.setdefault("policies", ["idle"])
+    spec.setdefault("grid", {})
+    for name in spec["grid"]:
+        if not name.isupper() or not hasattr(config, name):
+            raise ValueError(f"grid: {name!r} is not a config.py constant")
+    for name in spec["policies"]:
+        if name not in POLICIES:
+            raise ValueError(f"policies: unknown {name!r} (have {', '.join(POLICIES)})")
+    return spec
+
+
+def tasks(spec: dict) -> List[dict]:
+    names = list(spec["grid"])
+    out = []
+    for point in itertools.product(*(spec["grid"][n] for n in names)):
+        for policy in spec["policies"]:
+            for k in range(int(spec["seeds"])):
+                out.append({
+                    "params": dict(zip(names, point)),
+                    "policy": policy,
+                    "seed": int(spec["seed"]) * 1_000_003 + k,
+                    "hours": float(spec["hours"]),
+                    "pets": int(spec["pets"]),
+                    "world": tuple(spec["world"]),
+                })
+    return out
+
+
+def to_columns(spec: dict, runs: List[dict], results: List[dict]) -> Dict[str, list]:
+    cols: Dict[str, list] = {name: [] for name in spec["grid"]}
+    cols.update(policy=[], seed=[])
+    cols.update({m: [] for m in METRICS})
+    for task, res in zip(runs, results):
+        for name, value in task["params"].items():
+            cols[name].append(value)
+        cols["policy"].append(task["policy"])
+        cols["seed"].append(task["seed"])
+        for m in METRICS:
+            cols[m].append(res[m])
+    return cols
+
+
+def write_columns(path: str, cols: Dict[str, list]) -> None:
+    if path.endswith(".parquet"):
+        if pa is None:
+            raise RuntimeError("writing .parquet needs pyarrow; use a .json path instead")
+        pq.write_table(pa.table(cols), path)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cols, f)
+
+
+def summarize(spec: dict, cols: Dict[str, list]) -> List[str]:
+    keys = list(spec["grid"]) + ["policy"]
+    groups: Dict[tuple, List[int]] = {}
+    for i in range(len(cols["policy"])):
+        groups.setdefault(tuple(cols[k][i] for k in keys), []).append(i)
+    lines = []
+    for point, idx in groups.items():
+        means = " ".join(f"{m}={sum(cols[m][i] for i in idx) / len(idx):.3g}" for m in METRICS)
+        lines.append(" ".join(f"{k}={v}" for k, v in zip(keys, point)) + " | " + means)
+    return lines
+
+
+def run_farm(spec: dict, workers: Optional[int] = None, progress=None) -> Dict[str, list]:
+    runs = tasks(spec)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for n, res in enumerate(pool.map(run_one, runs, chunksize=max(1, len(runs) // (8 * (os.cpu_count() or 1)))), 1):
+            results.append(res)
+            if progress is not None:
+                progress(n, len(runs))
+    return to_columns(spec, runs, results)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m deskpet.farm", description=__doc__.split("\n\n")[0])
+    ap.add_argument("spec", help="JSON spec file")
+    ap.add_argument("-o", "--out", default="farm_results.json", help=".parquet (needs pyarrow) or .json")
+    ap.add_argument("-j", "--workers", type=int, default=None, help="processes (default: every core)")
+    args = ap.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    n = len(tasks(spec))
+    print(f"[farm] {n} runs x {spec['hours']} h on {args.workers or os.cpu_count()} processes")
+    t0 = time.perf_counter()
+
+    def progress(done, total):
+        if done == total or done % max(1, total // 20) == 0:
+            print(f"[farm] {done}/{total} ({time.perf_counter() - t0:.0f}s)", flush=True)
+
+    cols = run_farm(spec, args.workers, progress)
+    write_columns(args.out, cols)
+    for line in summarize(spec, cols):
+        print(line)
+    print(f"[farm] wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import re
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# words that say nothing about *what* was talked about
+STOP_WORDS = {
+    "a", "an", "the", "i", "you", "me", "my", "your", "it", "is", "are", "was",
+    "to", "of", "and", "or", "about", "what", "did", "do", "tell", "told", "say",
+    "said", "that", "this", "in", "on", "for", "with", "be",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _put_varint(buf: bytearray, n: int) -> None:
+    while n >= 0x80:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def _iter_varints(buf: bytearray) -> Iterable[int]:
+    n = 0
+    shift = 0
+    for b in buf:
+        n |= (b & 0x7F) << shift
+        if b & 0x80:
+            shift += 7
+        else:
+            yield n
+            n = 0
+            shift = 0
+
+
+class ConversationHistory:
+    """
+    Append-only conversation log with an inverted index.
+
+      entries:  [(ts, speaker, text), ...]   utterance id == position
+      postings: token -> bytearray of delta+varint encoded utterance ids
+
+    Ids only ever grow, so appending a posting is O(1) and a lookup only
+    decodes the postings of the query words: cost follows the number of
+    matches, not the length of the history.
+    """
+
+    def __init__(self):
+        self.entries: List[Tuple[float, str, str]] = []
+        self.postings: Dict[str, bytearray] = {}
+        self._last_id: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, speaker: str, text: str, ts: float) -> int:
+        uid = len(self.entries)
+        self.entries.append((float(ts), speaker, text))
+        for tok in set(tokenize(text)):
+            buf = self.postings.get(tok)
+            if buf is None:
+                buf = self.postings[tok] = bytearray()
+                prev = 0
+            else:
+                prev = self._last_id[tok]
+            _put_varint(buf, uid - prev)
+            self._last_id[tok] = uid
+        return uid
+
+    def _ids_for(self, tok: str) -> List[int]:
+        out = []
+        uid = 0
+        for delta in _iter_varints(self.postings.get(tok, b"")):
+            uid += delta
+            out.append(uid)
+        return out
+
+    def search(self, query: str, *, speaker: Optional[str] = None, limit: int = 5,
+               before: Optional[int] = None) -> List[Tuple[float, str, str]]:
+        """Newest-first utterances containing every meaningful word of the query."""
+        toks = [t for t in set(tokenize(query)) if t not in STOP_WORDS]
+        if not toks or any(t not in self.postings for t in toks):
+            return []
+
+        # intersect starting from the rarest word (shortest posting list)
+        toks.sort(key=lambda t: len(self.postings[t]))
+        ids = self._ids_for(toks[0])
+        for tok in toks[1:]:
+            keep = set(self._ids_for(tok))
+            ids = [i for i in ids if i in keep]
+            if not ids:
+                return []
+
+        out = []
+        for uid in reversed(ids):
+            if before is not None and uid >= before:
+                continue
+            ent = self.entries[uid]
+            if speaker is not None and ent[1] != speaker:
+                continue
+            out.append(ent)
+            if len(out) >= limit:
+                break
+        return out
+
+    # ---------------------------
+    # Persistence (index is rebuilt on load)
+    # ---------------------------
+
+    def to_list(self) -> List[List[Any]]:
+        return [[ts, speaker, text] for ts, speaker, text in self.entries]
+
+    @classmethod
+    def from_list(cls, rows) -> "ConversationHistory":
+        h = cls()
+        for row in rows or []:
+            try:
+                ts, speaker, text = row
+                h.add(str(speaker), str(text), float(ts))
+            except Exception:
+                continue
+        return h
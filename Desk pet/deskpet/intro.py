@@ -1,15 +1,19 @@
 from __future__ import annotations
 import tkinter as tk
-from deskpet.personality import ensure_personality, apply_intro_name, apply_intro_choice
+from typing import Callable, Optional
 
 
 class IntroModal:
     """
     Centered modal, reliable. Freezes the world while open.
+
+    Never touches the World: it starts from the focused pet's name and hands
+    (name or None, choice or None) to on_done when it closes.
     """
-    def __init__(self, root: tk.Tk, world):
+    def __init__(self, root: tk.Tk, name: str, on_done: Callable[[Optional[str], Optional[str]], None]):
         self.root = root
-        self.world = world
+        self.on_done = on_done
+        self.name = None
         self.result = None
 
         self.win = tk.Toplevel(root)
@@ -31,7 +35,7 @@ class IntroModal:
         self.body_lbl = tk.Label(self.win, text="It looks at you like you owe it rent.", fg="white", bg="#111111", wraplength=360, justify="center")
         self.body_lbl.pack(padx=16, pady=(0, 10))
 
-        self.name_var = tk.StringVar(value=self.world.get_focused().name)
+        self.name_var = tk.StringVar(value=name)
         self.name_entry = tk.Entry(self.win, textvariable=self.name_var, width=28)
         self.name_entry.pack(padx=16, pady=(0, 10))
 
@@ -101,10 +105,7 @@ class IntroModal:
 
     def _next(self):
         if self.stage == 0:
-            # apply name
-            p = self.world.get_focused()
-            ensure_personality(p)
-            apply_intro_name(p, self.name_var.get())
+            self.name = self.name_var.get()
             self.stage = 1
             self._render_stage()
             self._center()
@@ -113,10 +114,7 @@ class IntroModal:
         self._finish()
 
     def _finish(self):
-        # Apply default if no choice made
-        p = self.world.get_focused()
-        ensure_personality(p)
-        if self.result:
-            apply_intro_choice(p, self.result)
+        # no choice made: on_done still runs, so the personality gets its defaults
+        self.on_done(self.name, self.result)
         self.win.grab_release()
         self.win.destroy()
\ No newline at end of file
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+import random
+
+from deskpet.history import tokenize
+
+
+BOS = 0
+EOS = 1
+
+
+class NGramModel:
+    """
+    Tiny word n-gram model learned from the user's own lines.
+
+    Counts live in a trie keyed by integer token ids:
+        node = [count, {token_id: node} or None]
+    Every k-gram (k <= order) is one root->node path. When the trie grows past
+    max_nodes all counts are halved and nodes that drop to zero are removed,
+    so rare n-grams fade first; words no surviving node uses are dropped and
+    the ids renumbered, so the vocabulary stays bounded too.
+    """
+
+    def __init__(self, order: int = 3, max_nodes: int = 20000):
+        self.order = max(2, int(order))
+        self.max_nodes = int(max_nodes)
+        self.words: List[str] = ["<s>", "</s>"]
+        self.ids: Dict[str, int] = {}
+        self.root: list = [0, {}]
+        self.nodes = 0
+        self.sentences = 0
+
+    def _id(self, word: str) -> int:
+        tid = self.ids.get(word)
+        if tid is None:
+            tid = len(self.words)
+            self.ids[word] = tid
+            self.words.append(word)
+        return tid
+
+    # ---------------------------
+    # Training
+    # ---------------------------
+
+    def train(self, text: str) -> None:
+        toks = tokenize(text)
+        if not toks:
+            return
+        seq = [BOS] + [self._id(w) for w in toks] + [EOS]
+        n = self.order
+        for s in range(len(seq)):
+            node = self.root
+            for tid in seq[s:s + n]:
+                children = node[1]
+                if children is None:
+                    children = node[1] = {}
+                child = children.get(tid)
+                if child is None:
+                    child = children[tid] = [0, None]
+                    self.nodes += 1
+                child[0] += 1
+                node = child
+        self.sentences += 1
+
+        if self.nodes > self.max_nodes:
+            self.prune()
+
+    def prune(self) -> None:
+        """Halve every count and drop what reaches zero."""
+        def walk(node) -> int:
+            children = node[1]
+            if not children:
+                return 0
+            kept = 0
+            for tid in list(children):
+                child = children[tid]
+                child[0] >>= 1
+                if child[0] <= 0:
+                    del children[tid]
+                else:
+                    kept += 1 + walk(child)
+            if not children:
+                node[1] = None
+            return kept
+
+        self.nodes = walk(self.root)
+        self._compact_vocab()
+
+    def _compact_vocab(self) -> None:
+        """Keep only the words still in the trie (plus BOS/EOS) and renumber them."""
+        used = set()
+        stack = [self.root]
+        while stack:
+            children = stack.pop()[1]
+            if children:
+                used.update(children)
+                stack.extend(children.values())
+
+        remap = {BOS: BOS, EOS: EOS}
+        words = self.words[:2]
+        for tid in sorted(used - {BOS, EOS}):
+            remap[tid] = len(words)
+            words.append(self.words[tid])
+        self.words = words
+        self.ids = {w: i for i, w in enumerate(words) if i > EOS}
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node[1]:
+                node[1] = {remap[tid]: child for tid, child in node[1].items()}
+                stack.extend(node[1].values())
+
+    # ---------------------------
+    # Generation
+    # ---------------------------
+
+    def _children_for(self, context: List[int]) -> Optional[dict]:
+        # longest context first, back off to shorter ones
+        for k in range(min(len(context), self.order - 1), 0, -1):
+            node = self.root
+            for tid in context[-k:]:
+                children = node[1]
+                node = children.get(tid) if children else None
+                if node is None:
+                    break
+            if node is not None and node[1]:
+                return node[1]
+        return None
+
+    def generate(self, rng: random.Random, max_words: int = 12) -> str:
+        context = [BOS]
+        out: List[str] = []
+        while len(out) < max_words:
+            children = self._children_for(context)
+            if not children:
+                break
+            total = 0
+            for child in children.values():
+                total += child[0]
+            pick = rng.random() * total
+            tid = EOS
+            for tid, child in children.items():
+                pick -= child[0]
+                if pick < 0:
+                    break
+            if tid == EOS:
+                break
+            out.append(self.words[tid])
+            context.append(tid)
+        return " ".join(out)
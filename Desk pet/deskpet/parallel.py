@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+from deskpet.config import PARALLEL_WORKERS, PARALLEL_MIN_CHUNK
+
+
+def gil_enabled() -> bool:
+    """False only on a free-threaded build (3.13t+) running with the GIL off."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else bool(check())
+
+
+class ParallelStepper:
+    """
+    Runs one per-entity tick phase over disjoint, contiguous partitions of an
+    entity list on a thread pool, and hands back each partition's result in
+    partition order so shared effects can be merged deterministically.
+
+    Only enabled on free-threaded builds with more than one worker; with the
+    GIL, threads would just take turns, so run() calls fn once over the whole
+    list on the calling thread. force=True skips that check (benchmarks).
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_chunk: int = PARALLEL_MIN_CHUNK, force: bool = False):
+        n = PARALLEL_WORKERS if workers is None else workers
+        self.workers = max(1, int(n) if n else (os.cpu_count() or 1))
+        self.min_chunk = max(1, int(min_chunk))
+        self.enabled = self.workers > 1 and (force or not gil_enabled())
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def mode(self) -> str:
+        if not self.enabled:
+            return "serial"
+        return f"{self.workers} threads" + ("" if not gil_enabled() else " (GIL)")
+
+    def _partitions(self, items: Sequence) -> List[Sequence]:
+        n = len(items)
+        parts = min(self.workers, n // self.min_chunk)
+        if parts < 2:
+            return [items]
+        size = -(-n // parts)
+        return [items[i:i + size] for i in range(0, n, size)]
+
+    def run(self, fn: Callable, items: Sequence, *args) -> list:
+        """[fn(part, *args) for part in partitions(items)], parts run concurrently."""
+        if not self.enabled:
+            return [fn(items, *args)]
+        parts = self._partitions(items)
+        if len(parts) == 1:
+            return [fn(items, *args)]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="deskpet-step")
+        futures = [self._pool.submit(fn, part, *args) for part in parts[1:]]
+        first = fn(parts[0], *args)
+        return [first] + [f.result() for f in futures]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
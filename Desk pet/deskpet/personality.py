@@ -2,6 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List
 from deskpet.util.mathutil import clamp
+from deskpet.entities.traits import Traits, OriginMemory
 
 
 DEFAULT_TRAITS = {
@@ -24,17 +25,14 @@ DEFAULT_ORIGIN = {
 
 def ensure_personality(pet) -> None:
     """Attach personality fields if missing (safe for older saves / dev runs)."""
-    if not hasattr(pet, "traits") or pet.traits is None:
-        pet.traits = dict(DEFAULT_TRAITS)
-    else:
-        for k, v in DEFAULT_TRAITS.items():
-            pet.traits.setdefault(k, v)
-
-    if not hasattr(pet, "origin_memory") or pet.origin_memory is None:
-        pet.origin_memory = dict(DEFAULT_ORIGIN)
-    else:
-        for k, v in DEFAULT_ORIGIN.items():
-            pet.origin_memory.setdefault(k, v)
+    traits = getattr(pet, "traits", None)
+    if not isinstance(traits, Traits):
+        # dict-shaped traits from older saves: keep known keys, default the rest
+        pet.traits = Traits(**{k: float((traits or {}).get(k, v)) for k, v in DEFAULT_TRAITS.items()})
+
+    origin = getattr(pet, "origin_memory", None)
+    if not isinstance(origin, OriginMemory):
+        pet.origin_memory = OriginMemory(**{k: bool((origin or {}).get(k, v)) for k, v in DEFAULT_ORIGIN.items()})
 
     if not hasattr(pet, "event_log") or pet.event_log is None:
         pet.event_log = []  # list[str]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+import json
+import math
+from typing import Callable, Dict, List, Tuple
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram: four buckets per doubling, starting at
+    lo_ms. Constant memory however long the app runs; percentiles come back
+    as bucket upper edges (within ~19% of the true value).
+    """
+
+    STEPS_PER_OCTAVE = 4
+
+    def __init__(self, lo_ms: float = 0.25, buckets: int = 64):
+        self.lo_ms = float(lo_ms)
+        self.counts = [0] * int(buckets)
+        self.n = 0
+        self.max_ms = 0.0
+
+    def _edge(self, i: int) -> float:
+        return self.lo_ms * 2.0 ** (i / self.STEPS_PER_OCTAVE)
+
+    def record(self, ms: float) -> None:
+        i = 0
+        if ms > self.lo_ms:
+            i = min(len(self.counts) - 1, int(math.ceil(self.STEPS_PER_OCTAVE * math.log2(ms / self.lo_ms))))
+        self.counts[i] += 1
+        self.n += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float:
+        if not self.n:
+            return 0.0
+        want = q * self.n
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= want:
+                return min(self._edge(i), self.max_ms)
+        return self.max_ms
+
+    def stats(self) -> str:
+        if not self.n:
+            return "-"
+        return (f"p50 {self.percentile(0.50):.0f}ms p95 {self.percentile(0.95):.0f}ms "
+                f"max {self.max_ms:.0f}ms (n={self.n})")
+
+    def to_dict(self) -> Dict:
+        return {
+            "n": self.n,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": [[round(self._edge(i), 3), c] for i, c in enumerate(self.counts) if c],
+        }
+
+
+class Profiler:
+    """
+    Registry of named live stats for the debug overlay.
+    Sources are callables returning a short string; they're only called
+    when someone looks (renderer overlay, dumps), never per tick.
+    """
+
+    def __init__(self):
+        self.sources: Dict[str, Callable[[], str]] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def register(self, name: str, fn: Callable[[], str]) -> None:
+        self.sources[name] = fn
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Named latency histogram, created (and shown on the overlay) on first use."""
+        h = self.histograms.get(name)
+        if h is None:
+            h = self.histograms[name] = LatencyHistogram()
+            self.register(name, h.stats)
+        return h
+
+    def lines(self) -> List[Tuple[str, str]]:
+        out = []
+        for name, fn in self.sources.items():
+            try:
+                out.append((name, fn()))
+            except Exception as ex:
+                out.append((name, f"<{ex.__class__.__name__}>"))
+        return out
+
+    def dump(self, path: str) -> None:
+        data = {
+            "stats": dict(self.lines()),
+            "histograms": {name: h.to_dict() for name, h in self.histograms.items()},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
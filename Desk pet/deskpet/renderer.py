@@ -1,36 +1,190 @@
+import time
 import tkinter as tk
+from deskpet.sprites import SpriteAtlas
+from deskpet.profiler import Profiler
+from deskpet.entities.models import FOOD_KINDS, Grab
+from deskpet.util.mathutil import clamp
 from deskpet.config import (
-    PET_SPRITES,
+    PET_SPRITE_SCALE, PET_WALK_FRAMES, PET_WALK_FRAME_SECS, PET_WALK_MIN_SPEED,
     FOOD_TYPES,
     HOTBAR_HEIGHT, HOTBAR_PAD, HOTBAR_SLOT_W, HOTBAR_SLOT_H, HOTBAR_SLOT_GAP,
 )
 
 class Renderer:
     def __init__(self, root: tk.Tk):
-        self.pet_img = tk.PhotoImage(file=str(PET_SPRITES["idle"]))
+        self.atlas = SpriteAtlas(root)
+        # frame 0 is decoded up front so a bad asset fails at startup
+        self.pet_img = self.atlas.frame("idle", PET_SPRITE_SCALE, 1)
+
+        # pet handle -> [canvas item, facing, current image]; pet items outlive a frame
+        self._pet_items = {}
+        # (handle, x, y) the focused bubble was drawn for, so a drag can carry it
+        self._bubble_at = None
+        # [Grab, local (x, y) or None, tick released at or None] while dragging
+        self._held = None
+
+        # Tk-side stats (input latency); the sim's own come in with each snapshot
+        self.profiler = Profiler()
+
+    def _pet_frame(self, handle: int, walking: bool, facing: int, time_s: float) -> tk.PhotoImage:
+        if walking:
+            # per-pet phase so a crowd doesn't march in lockstep
+            step = int(time_s / PET_WALK_FRAME_SECS + handle % 7)
+            sprite = PET_WALK_FRAMES[step % len(PET_WALK_FRAMES)]
+        else:
+            sprite = PET_WALK_FRAMES[0]
+        return self.atlas.frame(sprite, PET_SPRITE_SCALE, facing)
+
+    def _draw_pets(self, canvas, state):
+        seen = set()
+        pets = state.pets
+        for handle, x, y, vx, on_ground, held in zip(
+                pets.col("handle"), pets.col("x"), pets.col("y"),
+                pets.col("vx"), pets.col("on_ground"), pets.col("held")):
+            key = int(handle)
+            seen.add(key)
+            slot = self._pet_items.get(key)
+            if slot is None:
+                item = canvas.create_image(x, y, image=self.pet_img, anchor="center", tags=("pet",))
+                slot = self._pet_items[key] = [item, 1, self.pet_img]
+            else:
+                canvas.coords(slot[0], x, y)
+
+            if vx > PET_WALK_MIN_SPEED:
+                slot[1] = 1
+            elif vx < -PET_WALK_MIN_SPEED:
+                slot[1] = -1
+
+            walking = abs(vx) >= PET_WALK_MIN_SPEED and on_ground and not held
+            img = self._pet_frame(key, walking, slot[1], state.time_s)
+            if img is not slot[2]:
+                canvas.itemconfigure(slot[0], image=img)
+                slot[2] = img
+
+        for key in [k for k in self._pet_items if k not in seen]:
+            canvas.delete(self._pet_items.pop(key)[0])
+
+    # ----------------------------
+    # Drag (local, ahead of the sim)
+    # ----------------------------
+
+    def pick(self, state, x: float, y: float):
+        """What World.pick_entity_at would pick in this snapshot, as a Grab at the cursor's offset."""
+        # enemies over toys over pets; within a kind the last drawn is on top
+        hit = None
+        en = state.enemies
+        for eid, ex, ey, w, h in zip(en.col("eid"), en.col("x"), en.col("y"), en.col("w"), en.col("h")):
+            if abs(x - ex) <= max(18.0, w * 0.5) and abs(y - ey) <= max(18.0, h * 0.5):
+                hit = Grab("enemy", int(eid), ex - x, ey - y, w / 2, h / 2)
+        if hit is not None:
+            return hit
+        toys = state.toys
+        for tid, ex, ey, r in zip(toys.col("tid"), toys.col("x"), toys.col("y"), toys.col("r")):
+            if (x - ex) ** 2 + (y - ey) ** 2 <= (r + 8) ** 2:
+                hit = Grab("toy", int(tid), ex - x, ey - y, r, r)
+        if hit is not None:
+            return hit
+        pets = state.pets
+        for handle, ex, ey, w, h in zip(pets.col("handle"), pets.col("x"), pets.col("y"),
+                                        pets.col("w"), pets.col("h")):
+            if abs(x - ex) <= max(18.0, w * 0.5) and abs(y - ey) <= max(18.0, h * 0.5):
+                hit = Grab("pet", int(handle), ex - x, ey - y, w / 2, h / 2)
+        return hit
+
+    def begin_drag(self, state, x: float, y: float):
+        """
+        Mouse down: pick from the snapshot on screen and hold that entity
+        locally. Returns the Grab (send it to World.grab) or None.
+        """
+        g = self.pick(state, x, y)
+        self._held = None if g is None else [g, None, None]
+        return g
+
+    def end_drag(self, state) -> None:
+        """Mouse up: keep drawing the held entity locally until a snapshot shows it let go."""
+        if self._held is not None:
+            self._held[2] = state.t
+
+    def _redraw_held(self, canvas, state) -> None:
+        """Put the held entity back where the cursor has it; snapshots lag the drag."""
+        held = self._held
+        if held is None:
+            return
+        g, pos, released_t = held
+        if released_t is not None and state.t > released_t and (
+                state.grab is None or (state.grab.kind, state.grab.key) != (g.kind, g.key)):
+            self._held = None   # the sim has let go too: its positions are current again
+            return
+        if pos is not None:
+            self._place_held(canvas, g, *pos)
+
+    def move_held(self, canvas, state, x: float, y: float, t_input: float = None):
+        """
+        Drag fast path: put the held entity's canvas items under the cursor
+        right away, ahead of the next snapshot; draw() keeps them there until
+        the sim catches up. Same clamp as World.drag_grab_to.
+        """
+        if self._held is None:
+            return
+        g = self._held[0]
+        ex = clamp(x + g.off_x, 0.0, state.width)
+        ey = clamp(y + g.off_y, -2000.0, state.height)
+        self._held[1] = (ex, ey)
+        self._place_held(canvas, g, ex, ey)
+        if t_input is not None:
+            self._mark_presented(canvas, [{"drag": t_input}])
+
+    def _place_held(self, canvas, g, ex: float, ey: float) -> None:
+        if g.kind == "pet":
+            slot = self._pet_items.get(g.key)
+            if slot is None:
+                return
+            canvas.coords(slot[0], ex, ey)
+            at = self._bubble_at
+            if at is not None and at[0] == g.key:
+                canvas.move("bubble", ex - at[1], ey - at[2])
+                self._bubble_at = (at[0], ex, ey)
+        else:
+            canvas.coords(f"{g.kind}:{g.key}", ex - g.half_w, ey - g.half_h, ex + g.half_w, ey + g.half_h)
+
+    # ----------------------------
+    # Input-to-photon latency
+    # ----------------------------
+
+    def _mark_presented(self, canvas, stamps):
+        if stamps:
+            # Tk repaints the canvas from an idle handler queued by the item
+            # changes above; ours is queued after it, so it runs once the frame is out
+            canvas.after_idle(self._record_latency, stamps)
+
+    def _record_latency(self, stamps):
+        now = time.perf_counter()
+        for batch in stamps:
+            for kind, t in batch.items():
+                self.profiler.histogram(f"{kind} latency").record((now - t) * 1000.0)
 
     def _draw_bubble(self, canvas, x, y, text: str):
         pad_x = 10
         pad_y = 6
-        text_id = canvas.create_text(x, y, text=text, anchor="s", fill="black")
+        text_id = canvas.create_text(x, y, text=text, anchor="s", fill="black", tags=("bubble",))
         bbox = canvas.bbox(text_id)
         if not bbox:
             return
         x1, y1, x2, y2 = bbox
         x1 -= pad_x; x2 += pad_x; y1 -= pad_y; y2 += pad_y
-        rect = canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="black")
+        rect = canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="black", tags=("bubble",))
         tail = canvas.create_polygon(
             x, y2,
             x - 8, y2 + 10,
             x + 8, y2 + 10,
-            fill="white", outline="black",
+            fill="white", outline="black", tags=("bubble",),
         )
         canvas.tag_raise(text_id, rect)
         canvas.tag_raise(text_id, tail)
 
-    def hotbar_layout(self, world):
-        w = int(world.width)
-        h = int(world.height)
+    def hotbar_layout(self, state):
+        w = int(state.width)
+        h = int(state.height)
         bar_y0 = h - HOTBAR_HEIGHT
         kinds = list(FOOD_TYPES.keys())[:3]
         total_w = (len(kinds) * HOTBAR_SLOT_W) + ((len(kinds) - 1) * HOTBAR_SLOT_GAP)
@@ -43,13 +197,13 @@ class Renderer:
             slots.append({"kind": kind, "i": i, "x1": x, "y1": y, "x2": x + HOTBAR_SLOT_W, "y2": y + HOTBAR_SLOT_H})
         return slots
 
-    def _draw_hotbar(self, canvas, world, focused):
-        w = int(world.width)
-        h = int(world.height)
+    def _draw_hotbar(self, canvas, state, focused):
+        w = int(state.width)
+        h = int(state.height)
         bar_y0 = h - HOTBAR_HEIGHT
         canvas.create_rectangle(0, bar_y0, w, h, fill="", outline="")
 
-        slots = self.hotbar_layout(world)
+        slots = self.hotbar_layout(state)
         for s in slots:
             kind = s["kind"]
             i = s["i"]
@@ -67,20 +221,20 @@ class Renderer:
             if cost > 0:
                 canvas.create_text(x2-8, y2-8, text=f"{cost}🪲", fill="white", anchor="se")
 
-    def _draw_craft_menu(self, canvas, world, ui_state):
+    def _draw_craft_menu(self, canvas, state, ui_state):
         if not ui_state.get("craft_menu_open", False):
             return
 
-        w = int(world.width)
-        h = int(world.height)
+        w = int(state.width)
+        h = int(state.height)
         mw, mh = 320, 190
         x1 = (w - mw) / 2
         y1 = (h - mh) / 2
         x2 = x1 + mw
         y2 = y1 + mh
 
-        focused = world.get_focused()
-        bits = focused.inventory.get("bug_bits", 0)
+        focused = state.focused
+        bits = focused.bug_bits
 
         canvas.create_rectangle(x1, y1, x2, y2, fill="#1b1b1b", outline="white", width=2)
         canvas.create_text((x1+x2)/2, y1+18, text="Crafting", fill="white", font=("TkDefaultFont", 12, "bold"))
@@ -105,51 +259,75 @@ class Renderer:
         ui_state["craft_buttons"] = btns
         ui_state["craft_bounds"] = (x1, y1, x2, y2)
 
-    def draw(self, canvas, world, ui_state=None):
+    def draw(self, canvas, state, ui_state=None, stamps=None):
+        """
+        Draw one WorldState snapshot (see World.snapshot / SimThread.latest).
+        stamps: input stamps of every tick up to this snapshot not drawn yet
+        (SimThread.take_input_stamps); they reach the screen with this frame.
+        """
         if ui_state is None:
             ui_state = {}
 
-        canvas.delete("all")
+        # everything except the pet sprites is redrawn from scratch
+        canvas.addtag_all("stale")
+        canvas.dtag("pet", "stale")
+        canvas.delete("stale")
 
         # toys (ball)
-        for b in getattr(world, "toys", []):
-            canvas.create_oval(b.x - b.r, b.y - b.r, b.x + b.r, b.y + b.r, fill="white", outline="")
+        toys = state.toys
+        for tid, x, y, r in zip(toys.col("tid"), toys.col("x"), toys.col("y"), toys.col("r")):
+            canvas.create_oval(x - r, y - r, x + r, y + r, fill="white", outline="",
+                               tags=("toy", f"toy:{int(tid)}"))
 
         # fenlings
-        for p in world.fenlings:
-            canvas.create_image(p.x, p.y, image=self.pet_img, anchor="center")
+        self._draw_pets(canvas, state)
+        canvas.tag_lower("toy")
 
         # food
-        for f in world.food:
-            fill = "green" if f.kind == "kibble" else ("orange" if f.kind == "meat" else "pink")
-            canvas.create_oval(f.x - 6, f.y - 6, f.x + 6, f.y + 6, fill=fill, outline="")
+        food = state.food
+        for x, y, k in zip(food.col("x"), food.col("y"), food.col("kind")):
+            kind = FOOD_KINDS[int(k)] if k >= 0 else None
+            fill = "green" if kind == "kibble" else ("orange" if kind == "meat" else "pink")
+            canvas.create_oval(x - 6, y - 6, x + 6, y + 6, fill=fill, outline="")
 
         # enemies
-        for e in world.enemies:
-            canvas.create_oval(e.x - e.w/2, e.y - e.h/2, e.x + e.w/2, e.y + e.h/2, fill="red", outline="")
+        en = state.enemies
+        for eid, x, y, w, h in zip(en.col("eid"), en.col("x"), en.col("y"), en.col("w"), en.col("h")):
+            canvas.create_oval(x - w/2, y - h/2, x + w/2, y + h/2, fill="red", outline="",
+                               tags=(f"enemy:{int(eid)}",))
 
-        focused = world.get_focused()
+        focused = state.focused
 
         # focused bubble
-        if focused.bubbles:
-            b = focused.bubbles[0]
-            self._draw_bubble(canvas, focused.x, focused.y - (focused.h * 0.65), b["text"])
+        self._bubble_at = None
+        if focused.bubble:
+            self._draw_bubble(canvas, focused.x, focused.y - (focused.h * 0.65), focused.bubble)
+            self._bubble_at = (focused.handle, focused.x, focused.y)
+
+        self._redraw_held(canvas, state)
 
         # hotbar + craft menu
-        self._draw_hotbar(canvas, world, focused)
-        self._draw_craft_menu(canvas, world, ui_state)
+        self._draw_hotbar(canvas, state, focused)
+        self._draw_craft_menu(canvas, state, ui_state)
 
-        bits = focused.inventory.get("bug_bits", 0)
-        boredom = getattr(focused, "boredom", 0.0)
         canvas.create_text(
             10, 10,
-            text=f"focused={focused.name} | mood={focused.mood_state} ({focused.mood:+.2f}) | boredom={boredom:.0f} | bits={bits} | selected={focused.selected_food_kind} | balls={len(getattr(world,'toys',[]))}",
+            text=f"focused={focused.name} | mood={focused.mood_state} ({focused.mood:+.2f}) | boredom={focused.boredom:.0f} | bits={focused.bug_bits} | selected={focused.selected_food_kind} | balls={len(state.toys)}",
             anchor="nw",
             fill="white"
         )
+        lod = state.lod
         canvas.create_text(
             10, 30,
-            text="Wave 6: Press B to spawn a ball",
+            text=f"Wave 6: Press B to spawn a ball | bug AI full={lod.get('full', 0)} cheap={lod.get('cheap', 0)}",
             anchor="nw",
             fill="white"
-        )
\ No newline at end of file
+        )
+        canvas.create_text(
+            10, 50,
+            text=" | ".join(f"{name}: {val}" for name, val in state.stats + tuple(self.profiler.lines())),
+            anchor="nw",
+            fill="white"
+        )
+
+        self._mark_presented(canvas, stamps)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from deskpet.config import TICK_MS, SIM_MAX_CATCHUP_TICKS, SIM_STAMP_BACKLOG
+from deskpet.entities.models import WorldState
+
+
+class SimThread:
+    """
+    Runs World.tick on its own thread at a fixed rate.
+
+    Tk -> sim:  call() / call_latest() queue commands (plain callables), run
+                on the sim thread between ticks. call_latest() keeps only the
+                newest command per key (cursor, drag), at its first position.
+    sim -> Tk:  after every tick an immutable WorldState goes into a double
+                buffer; latest() returns the front one without locking.
+                Input stamps (World.note_input) queue up per tick until
+                take_input_stamps() claims them, so a snapshot the renderer
+                never drew doesn't lose its inputs.
+
+    hold() gives the caller exclusive access to the World (tools, benches):
+    the sim thread takes the same lock around each step. The app itself only
+    talks to the World through commands, so it also runs on SimProcess.
+    """
+
+    def __init__(self, world, tick_secs: float = TICK_MS / 1000.0):
+        self.world = world
+        self.tick_secs = float(tick_secs)
+        self.lock = threading.RLock()
+
+        self._commands: deque = deque()
+        self._stamps: deque = deque(maxlen=SIM_STAMP_BACKLOG)   # (tick, {kind: stamp})
+        self._slots = [world.snapshot(), None]
+        self._front = 0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.ticks = 0
+        self.dropped_ticks = 0
+
+    # ----------------------------
+    # Tk side
+    # ----------------------------
+
+    def call(self, fn: Callable, *args) -> None:
+        self._commands.append((None, fn, args))
+
+    def call_latest(self, key: str, fn: Callable, *args) -> None:
+        self._commands.append((key, fn, args))
+
+    def flush(self) -> None:
+        """Nothing to do: commands are already queued (SimProcess batches its pipe writes here)."""
+
+    def latest(self) -> WorldState:
+        return self._slots[self._front]
+
+    def take_input_stamps(self, upto_t: int) -> List[Dict[str, float]]:
+        """Stamps of every tick up to upto_t (the snapshot being drawn), each handed out once."""
+        q = self._stamps
+        out = []
+        while q and q[0][0] <= upto_t:
+            out.append(q.popleft()[1])
+        return out
+
+    def hold(self):
+        return self.lock
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="deskpet-sim", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ----------------------------
+    # Sim side
+    # ----------------------------
+
+    def _drain(self) -> None:
+        q = self._commands
+        batch = []
+        latest = {}
+        while True:
+            try:
+                key, fn, args = q.popleft()
+            except IndexError:
+                break
+            if key is None:
+                batch.append([fn, args])
+            elif key in latest:
+                latest[key][1] = args
+            else:
+                latest[key] = [fn, args]
+                batch.append(latest[key])
+        for fn, args in batch:
+            try:
+                fn(*args)
+            except Exception as ex:  # a bad command must not kill the simulation
+                print(f"[sim] command {getattr(fn, '__name__', fn)} failed: {ex!r}")
+
+    def _publish(self, state: WorldState) -> None:
+        back = 1 - self._front
+        self._slots[back] = state
+        self._front = back
+
+    def step(self) -> None:
+        with self.lock:
+            self._drain()
+            self.world.tick()
+            state = self.world.snapshot()
+            stamps = self.world.take_input_stamps()
+            if stamps:
+                self._stamps.append((state.t, stamps))
+            self._publish(state)
+        self.ticks += 1
+
+    def _run(self) -> None:
+        dt = self.tick_secs
+        next_t = time.perf_counter()
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now < next_t:
+                self._stop.wait(next_t - now)
+                continue
+            self.step()
+            next_t += dt
+            # fell far behind (modal held the lock, debugger, sleep): don't fast-forward
+            behind = int((time.perf_counter() - next_t) / dt)
+            if behind > SIM_MAX_CATCHUP_TICKS:
+                self.dropped_ticks += behind
+                next_t = time.perf_counter()
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import json
+import multiprocessing as mp
+import struct
+import time
+from dataclasses import astuple
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+from deskpet.config import (
+    TICK_MS,
+    SHM_MAX_PETS, SHM_MAX_ENEMIES, SHM_MAX_FOOD, SHM_MAX_TOYS, SHM_META_BYTES,
+)
+from deskpet.entities import models
+from deskpet.entities.models import WorldState
+from deskpet.sim import SimThread
+from deskpet.world import World
+
+# ----------------------------
+# Shared-memory layout
+# ----------------------------
+#
+#   header   seq, t, ticks, dropped, time_s, width, height,
+#            n_pets, n_enemies, n_food, n_toys, meta_len, grab (kind, key, off_x, off_y, half_w, half_h)
+#   ack      tick up to which the Tk process has taken input stamps (written by Tk)
+#   meta     JSON: focused pet, lod counts, overlay stats, unclaimed input stamps
+#   rows     pets, enemies, food, toys back to back, n x models.*_COLS float64s each
+#
+# The rows are already in the snapshot's packed form (models.Rows), so the
+# writer copies each buffer in and the reader copies the used part of the
+# rows region out as one bytes slice; nothing is pickled or rebuilt per entity.
+#
+# seq is a sequence lock: odd while the sim process is writing. A reader
+# copies what it needs and keeps it only if seq was even and unchanged around
+# the copy. (CPython gives no memory fences; x86 store ordering makes this
+# safe, weaker architectures may in theory show a torn frame for one draw.)
+
+HEADER = struct.Struct("<4Q3d5Iiq4d")
+SEQ = struct.Struct("<Q")
+ACK = struct.Struct("<q")
+
+KIND_COLS = (models.PET_COLS, models.ENEMY_COLS, models.FOOD_COLS, models.TOY_COLS)
+GRAB_KINDS = ("pet", "enemy", "toy")
+
+READ_RETRIES = 64
+
+
+def _align8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class StateLayout:
+    """Byte offsets of each region for a given set of row capacities."""
+
+    def __init__(self, pets: int = SHM_MAX_PETS, enemies: int = SHM_MAX_ENEMIES, food: int = SHM_MAX_FOOD,
+                 toys: int = SHM_MAX_TOYS, meta_bytes: int = SHM_META_BYTES):
+        self.caps = (pets, enemies, food, toys)
+        self.meta_bytes = meta_bytes
+        self.ack_off = _align8(HEADER.size)
+        self.meta_off = self.ack_off + ACK.size
+        self.rows_off = _align8(self.meta_off + meta_bytes)
+        self.size = self.rows_off + 8 * sum(cap * len(cols) for cap, cols in zip(self.caps, KIND_COLS))
+
+
+# ----------------------------
+# Sim process side
+# ----------------------------
+
+class StateWriter:
+    def __init__(self, buf: memoryview, layout: StateLayout):
+        self.buf = buf
+        self.layout = layout
+        self._d = buf.cast("d")
+        self.seq = SEQ.unpack_from(buf, 0)[0]
+        self.truncated = 0   # rows dropped because a kind outgrew its capacity
+
+    def release(self) -> None:
+        self._d.release()
+
+    def _meta(self, state: WorldState, stamps) -> bytes:
+        meta = {
+            "focused": list(astuple(state.focused)),
+            "lod": state.lod,
+            "stats": state.stats,
+            "input_stamps": list(stamps),
+        }
+        raw = json.dumps(meta).encode()
+        if len(raw) > self.layout.meta_bytes:
+            meta["stats"] = ()
+            meta["input_stamps"] = meta["input_stamps"][-32:]
+            raw = json.dumps(meta).encode()
+        return raw[:self.layout.meta_bytes]
+
+    def acked(self) -> int:
+        return ACK.unpack_from(self.buf, self.layout.ack_off)[0]
+
+    def publish(self, state: WorldState, ticks: int, dropped: int, stamps=()) -> None:
+        """stamps: (tick, {kind: stamp}) pairs the Tk process hasn't acked yet."""
+        buf, d = self.buf, self._d
+        meta = self._meta(state, stamps)
+
+        blocks = []
+        for rows, cap in zip((state.pets, state.enemies, state.food, state.toys), self.layout.caps):
+            if rows.n > cap:
+                self.truncated += rows.n - cap
+            blocks.append(rows.data[:cap * len(rows.cols)])
+        counts = [len(b) // len(cols) for b, cols in zip(blocks, KIND_COLS)]
+
+        g = state.grab
+        grab = (-1, 0, 0.0, 0.0, 0.0, 0.0) if g is None else (
+            GRAB_KINDS.index(g.kind), g.key, g.off_x, g.off_y, g.half_w, g.half_h)
+
+        SEQ.pack_into(buf, 0, self.seq + 1)   # odd: readers back off
+        HEADER.pack_into(buf, 0, self.seq + 1, state.t, ticks, dropped, state.time_s, state.width, state.height,
+                         *counts, len(meta), *grab)
+        buf[self.layout.meta_off:self.layout.meta_off + len(meta)] = meta
+        at = self.layout.rows_off // 8
+        for b in blocks:
+            d[at:at + len(b)] = b
+            at += len(b)
+        self.seq += 2
+        SEQ.pack_into(buf, 0, self.seq)
+
+
+class _ChildSim(SimThread):
+    """SimThread driven by the process main loop: commands come off the pipe, states go to shared memory."""
+
+    def __init__(self, world, tick_secs: float, conn, writer: StateWriter):
+        super().__init__(world, tick_secs)
+        self.conn = conn
+        self.writer = writer
+
+    def _drain(self) -> None:
+        try:
+            while self.conn.poll():
+                msg = self.conn.recv()
+                if msg is None:
+                    self._stop.set()
+                    break
+                key, name, args = msg
+                self._commands.append((key, getattr(self.world, name), args))
+        except (EOFError, OSError):
+            self._stop.set()   # the Tk process is gone
+        super()._drain()
+
+    def _publish(self, state: WorldState) -> None:
+        # stamps ride along in every state until the Tk process acks their tick
+        q, acked = self._stamps, self.writer.acked()
+        while q and q[0][0] <= acked:
+            q.popleft()
+        self.writer.publish(state, self.ticks, self.dropped_ticks, q)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # the Tk process owns (and unlinks) the segment; don't let this process's tracker claim it
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:   # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+def _child_main(shm_name: str, layout: StateLayout, conn, world_kwargs: dict, tick_secs: float) -> None:
+    shm = _attach(shm_name)
+    writer = StateWriter(shm.buf, layout)
+    try:
+        sim = _ChildSim(World(**world_kwargs), tick_secs, conn, writer)
+        sim._publish(sim.world.snapshot())
+        sim._run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        writer.release()
+        shm.close()
+        conn.close()
+
+
+# ----------------------------
+# Tk process side
+# ----------------------------
+
+class StateReader:
+    def __init__(self, buf: memoryview, layout: StateLayout):
+        self.buf = buf
+        self.layout = layout
+        self._seq = 0
+        self.state: Optional[WorldState] = None
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.torn_reads = 0
+        self.stamps = []   # (tick, {kind: stamp}) not yet acked, as of self.state
+
+    def read(self) -> Optional[WorldState]:
+        """Newest complete state; the previous one (same object) if nothing new is readable."""
+        buf, layout = self.buf, self.layout
+        for _ in range(READ_RETRIES):
+            seq = SEQ.unpack_from(buf, 0)[0]
+            if seq == self._seq:
+                return self.state
+            if seq & 1:
+                time.sleep(0)
+                continue
+            head = HEADER.unpack_from(buf, 0)
+            counts = head[7:11]
+            meta = bytes(buf[layout.meta_off:layout.meta_off + head[11]])
+            used = 8 * sum(n * len(cols) for n, cols in zip(counts, KIND_COLS))
+            block = bytes(buf[layout.rows_off:layout.rows_off + used])
+            if SEQ.unpack_from(buf, 0)[0] != seq:
+                self.torn_reads += 1
+                continue
+            self._seq = seq
+            self.state = self._build(head, meta, block)
+            return self.state
+        return self.state
+
+    def _build(self, head, meta: bytes, block: bytes) -> WorldState:
+        (_, t, self.ticks, self.dropped_ticks, time_s, width, height,
+         n_pets, n_enemies, n_food, n_toys, _, grab_kind, grab_key, off_x, off_y, half_w, half_h) = head
+        m = json.loads(meta)
+        self.stamps = m["input_stamps"]
+        d = memoryview(block).cast("d")
+        rows = []
+        at = 0
+        for n, cols in zip((n_pets, n_enemies, n_food, n_toys), KIND_COLS):
+            rows.append(models.Rows(cols, d[at:at + n * len(cols)]))
+            at += n * len(cols)
+        pets, enemies, food, toys = rows
+        return WorldState(
+            t=t,
+            time_s=time_s,
+            width=width,
+            height=height,
+            focused=models.Focus(*m["focused"]),
+            pets=pets,
+            enemies=enemies,
+            food=food,
+            toys=toys,
+            grab=None if grab_kind < 0 else models.Grab(GRAB_KINDS[grab_kind], grab_key,
+                                                        off_x, off_y, half_w, half_h),
+            lod=m["lod"],
+            stats=tuple(tuple(s) for s in m["stats"]),
+        )
+
+
+class RemoteWorld:
+    """
+    Stand-in for the World in the Tk process: `world.grab_at` is just the
+    method name, which SimProcess.call sends to the sim process.
+    """
+
+    def __getattr__(self, name: str) -> str:
+        if name.startswith("_") or not callable(getattr(World, name, None)):
+            raise AttributeError(name)
+        return name
+
+
+class SimProcess:
+    """
+    Runs the World in a child process, with the same call / call_latest /
+    latest / take_input_stamps / start / stop surface as SimThread.
+
+    Tk -> sim:  (key, method name, args) tuples over a one-way pipe; the
+                child queues them into its SimThread loop. call_latest only
+                keeps the newest per key here; flush() writes them out at
+                most once per published state, so a stalled child can't
+                fill the pipe and block the Tk thread on a drag.
+    sim -> Tk:  each tick's WorldState is written into a shared-memory
+                block (fixed layout, sequence lock); latest() reads it.
+                Input stamps are republished until take_input_stamps()
+                acks their tick through the block.
+
+    There is no hold(): the World isn't in this process.
+    """
+
+    def __init__(self, world_kwargs: dict, tick_secs: float = TICK_MS / 1000.0,
+                 layout: Optional[StateLayout] = None):
+        self.layout = layout or StateLayout()
+        self.world = RemoteWorld()
+        self._shm = shared_memory.SharedMemory(create=True, size=self.layout.size)
+        self._reader = StateReader(self._shm.buf, self.layout)
+        recv, self._conn = mp.Pipe(duplex=False)
+        self._latest = {}         # key -> (method name, args) not yet sent
+        self._flushed_seq = -1
+        self._acked = 0
+        self._recv = recv
+        self._proc = mp.Process(
+            target=_child_main, name="deskpet-sim", daemon=True,
+            args=(self._shm.name, self.layout, recv, world_kwargs, float(tick_secs)),
+        )
+
+    @property
+    def ticks(self) -> int:
+        return self._reader.ticks
+
+    @property
+    def dropped_ticks(self) -> int:
+        return self._reader.dropped_ticks
+
+    def _send(self, key: Optional[str], name: str, args: tuple) -> None:
+        try:
+            self._conn.send((key, name, args))
+        except OSError:
+            pass   # sim process already gone (quitting)
+
+    def _send_latest(self) -> None:
+        for key, (name, args) in self._latest.items():
+            self._send(key, name, args)
+        self._latest.clear()
+
+    def call(self, name: str, *args) -> None:
+        self._send_latest()   # keep order: anything keyed was asked for first
+        self._send(None, name, args)
+
+    def call_latest(self, key: str, name: str, *args) -> None:
+        self._latest[key] = (name, args)
+
+    def flush(self) -> None:
+        if not self._latest:
+            return
+        seq = SEQ.unpack_from(self._shm.buf, 0)[0]
+        if seq == self._flushed_seq:
+            return   # no tick since the last flush: hold on, at most a tick's worth is ever queued
+        self._flushed_seq = seq
+        self._send_latest()
+
+    def latest(self) -> WorldState:
+        return self._reader.read()
+
+    def take_input_stamps(self, upto_t: int) -> List[Dict[str, float]]:
+        out = [stamps for t, stamps in self._reader.stamps if self._acked < t <= upto_t]
+        if upto_t > self._acked:
+            self._acked = upto_t
+            ACK.pack_into(self._shm.buf, self.layout.ack_off, upto_t)
+        return out
+
+    def start(self, timeout: float = 10.0) -> None:
+        self._proc.start()
+        self._recv.close()
+        deadline = time.perf_counter() + timeout
+        while self._reader.read() is None:
+            if not self._proc.is_alive() or time.perf_counter() > deadline:
+                self.stop()
+                raise RuntimeError("sim process failed to start")
+            time.sleep(0.01)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        if self._shm is None:
+            return
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._conn.close()
+        if self._proc.pid is not None:
+            self._proc.join(timeout)
+            if self._proc.is_alive():
+                self._proc.terminate()
+                self._proc.join(timeout)
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
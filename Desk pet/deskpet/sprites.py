@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Dict, Tuple
+import tkinter as tk
+
+from deskpet.config import PET_SPRITES
+
+
+class SpriteAtlas:
+    """
+    Lazily built, cached sprite frames keyed by (sprite, scale, facing).
+
+    Each PNG is decoded once. A scaled or mirrored variant is built the first
+    time it is asked for (zoom/subsample, Tk's negative-subsample mirror, or a
+    one-off pixel copy as fallback) and reused from then on, so animating is
+    just handing an existing PhotoImage to itemconfigure.
+    """
+
+    def __init__(self, root: tk.Misc, sources: Dict[str, object] = PET_SPRITES):
+        self.root = root
+        self.sources = dict(sources)
+        self._frames: Dict[Tuple[str, Fraction, int], tk.PhotoImage] = {}
+
+    def frame(self, sprite: str, scale: float = 1.0, facing: int = 1) -> tk.PhotoImage:
+        key = (sprite, Fraction(scale).limit_denominator(4), -1 if facing < 0 else 1)
+        img = self._frames.get(key)
+        if img is None:
+            img = self._frames[key] = self._build(*key)
+        return img
+
+    def _build(self, sprite: str, scale: Fraction, facing: int) -> tk.PhotoImage:
+        if facing < 0:
+            return self._mirror(self.frame(sprite, scale, 1))
+        if scale != 1:
+            img = self.frame(sprite, 1, 1)
+            if scale.numerator != 1:
+                img = img.zoom(scale.numerator)
+            if scale.denominator != 1:
+                img = img.subsample(scale.denominator)
+            return img
+        return tk.PhotoImage(master=self.root, file=str(self.sources[sprite]))
+
+    def _mirror(self, src: tk.PhotoImage) -> tk.PhotoImage:
+        w, h = src.width(), src.height()
+        try:
+            img = src.subsample(-1, 1)
+            if img.width() == w and img.height() == h:
+                return img
+        except tk.TclError:
+            pass
+
+        # pixel copy, once per variant
+        img = tk.PhotoImage(master=self.root, width=w, height=h)
+        for y in range(h):
+            row = []
+            for x in range(w - 1, -1, -1):
+                r, g, b = src.get(x, y)
+                row.append(f"#{r:02x}{g:02x}{b:02x}")
+            img.put("{" + " ".join(row) + "}", to=(0, y))
+            for x in range(w):
+                if src.transparency_get(w - 1 - x, y):
+                    img.transparency_set(x, y, True)
+        return img
@@ -0,0 +1,43 @@
+import time
+from collections import deque
+from typing import List, NamedTuple, Optional
+
+
+class InputEvent(NamedTuple):
+    name: str
+    t: float          # time.perf_counter() when it was pushed
+    payload: object = None
+
+
+class InputQueue:
+    """
+    Cross-thread input mailbox for the Tk main loop.
+
+    Background threads (global hotkeys, later RPC/IPC) push(); the main loop
+    drain()s once per frame. deque.append / popleft are atomic, so there is
+    no lock and no Tcl call on the producer side.
+
+    drain() coalesces by name: a key mashed five times between frames runs
+    once, at the position of its first press, with the latest payload.
+    """
+
+    def __init__(self, maxlen: int = 256):
+        self._q: deque = deque(maxlen=maxlen)
+
+    def push(self, name: str, payload: object = None, t: Optional[float] = None) -> None:
+        self._q.append(InputEvent(name, time.perf_counter() if t is None else t, payload))
+
+    def drain(self) -> List[InputEvent]:
+        merged = {}
+        q = self._q
+        while True:
+            try:
+                ev = q.popleft()
+            except IndexError:
+                break
+            first = merged.get(ev.name)
+            merged[ev.name] = ev if first is None else first._replace(payload=ev.payload)
+        return list(merged.values())
+
+    def __len__(self) -> int:
+        return len(self._q)
@@ -0,0 +1,88 @@
+from typing import Optional, Tuple
+
+
+class MotionRing:
+    """
+    Fixed-size ring of timestamped pointer samples (t, x, y).
+
+    Event handlers just add() (cheap, no Tk calls); consumers read the
+    latest position and derive speed over a short trailing window, so a
+    burst of motion events between frames costs one read.
+    """
+
+    def __init__(self, size: int = 32):
+        self.size = int(size)
+        self.t = [0.0] * self.size
+        self.x = [0.0] * self.size
+        self.y = [0.0] * self.size
+        self.n = 0      # samples held (<= size)
+        self.head = 0   # next write slot
+
+    def clear(self) -> None:
+        self.n = 0
+        self.head = 0
+
+    def add(self, x: float, y: float, t: float) -> None:
+        i = self.head
+        self.t[i] = t
+        self.x[i] = x
+        self.y[i] = y
+        self.head = (i + 1) % self.size
+        if self.n < self.size:
+            self.n += 1
+
+    def latest(self) -> Optional[Tuple[float, float, float]]:
+        if not self.n:
+            return None
+        i = (self.head - 1) % self.size
+        return self.t[i], self.x[i], self.y[i]
+
+    def _recent(self, since: float):
+        """Indices newest -> oldest with t >= since, plus the one just before (for the entry segment)."""
+        out = []
+        for k in range(1, self.n + 1):
+            i = (self.head - k) % self.size
+            out.append(i)
+            if self.t[i] < since:
+                break
+        return out
+
+    def speed(self, now: float, window: float) -> float:
+        """Path length covered in the last `window` seconds, per second."""
+        idx = self._recent(now - window)
+        dist = 0.0
+        for a, b in zip(idx, idx[1:]):
+            dist += ((self.x[a] - self.x[b]) ** 2 + (self.y[a] - self.y[b]) ** 2) ** 0.5
+        if dist <= 0.0:
+            return 0.0
+        # a short ring may not reach back a whole window; use the span it covers
+        span = min(window, now - self.t[idx[-1]])
+        return dist / span if span > 0 else 0.0
+
+    def velocity(self, now: float, window: float) -> Tuple[float, float]:
+        """
+        Least-squares slope of x(t) and y(t) over the samples in the last
+        `window` seconds, in px/s. (0, 0) if the pointer hasn't moved in
+        that window, so stopping before release drops instead of throwing.
+        """
+        since = now - window
+        ts, xs, ys = [], [], []
+        for k in range(1, self.n + 1):
+            i = (self.head - k) % self.size
+            if self.t[i] < since:
+                break
+            ts.append(self.t[i])
+            xs.append(self.x[i])
+            ys.append(self.y[i])
+        m = len(ts)
+        if m < 2:
+            return 0.0, 0.0
+        mt = sum(ts) / m
+        mx = sum(xs) / m
+        my = sum(ys) / m
+        stt = sum((t - mt) ** 2 for t in ts)
+        if stt <= 1e-12:
+            return 0.0, 0.0
+        vx = sum((t - mt) * (x - mx) for t, x in zip(ts, xs)) / stt
+        vy = sum((t - mt) * (y - my) for t, y in zip(ts, ys)) / stt
+        return vx, vy
@@ -0,0 +1,96 @@
+from typing import Callable, Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+INDEX_BITS = 20
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class EntityPool(Generic[T]):
+    """
+    Dense, recycling entity collection with generation-checked integer ids.
+
+      items:  live entities, packed (iterate this)
+      id:     (generation << INDEX_BITS) | slot, stored on the entity in id_attr
+
+    Removal swaps the last item into the hole (O(1)) and bumps the slot's
+    generation, so stale ids resolve to None instead of a recycled entity.
+    Released objects are kept and re-initialised on the next acquire, so
+    spawn/kill churn doesn't allocate new entities. on_release(ent) runs
+    after every successful release, with ent's id still set, so owners can
+    drop their own indexes of it however it was released.
+    """
+
+    def __init__(self, factory: Callable[..., T], id_attr: str, max_spare: int = 1024,
+                 on_release: Optional[Callable[[T], None]] = None):
+        self.factory = factory
+        self.id_attr = id_attr
+        self.max_spare = int(max_spare)
+        self.on_release = on_release
+
+        self.items: List[T] = []
+        self._pos: List[int] = []      # slot -> index in items, -1 when free
+        self._gen: List[int] = []      # slot -> generation
+        self._free: List[int] = []     # free slots
+        self._spare: List[T] = []      # released objects awaiting reuse
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __getitem__(self, i: int) -> T:
+        return self.items[i]
+
+    def acquire(self, **fields) -> T:
+        if self._spare:
+            ent = self._spare.pop()
+            type(ent).__init__(ent, **fields)
+        else:
+            ent = self.factory(**fields)
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._pos)
+            self._pos.append(-1)
+            self._gen.append(0)
+
+        self._pos[slot] = len(self.items)
+        self.items.append(ent)
+        setattr(ent, self.id_attr, (self._gen[slot] << INDEX_BITS) | slot)
+        return ent
+
+    def release(self, ent: T) -> bool:
+        eid = getattr(ent, self.id_attr)
+        if self.get(eid) is not ent:
+            return False
+        slot = eid & INDEX_MASK
+        pos = self._pos[slot]
+
+        last = self.items.pop()
+        if last is not ent:
+            self.items[pos] = last
+            self._pos[getattr(last, self.id_attr) & INDEX_MASK] = pos
+
+        self._pos[slot] = -1
+        self._gen[slot] += 1
+        self._free.append(slot)
+        if len(self._spare) < self.max_spare:
+            self._spare.append(ent)
+        if self.on_release is not None:
+            self.on_release(ent)
+        return True
+
+    def get(self, eid: Optional[int]) -> Optional[T]:
+        if eid is None:
+            return None
+        slot = eid & INDEX_MASK
+        if slot >= len(self._pos) or self._gen[slot] != (eid >> INDEX_BITS):
+            return None
+        pos = self._pos[slot]
+        return self.items[pos] if pos >= 0 else None
@@ -0,0 +1,48 @@
+from typing import Dict, Iterable, List, Tuple
+
+
+class SpatialGrid:
+    """
+    Uniform-grid spatial hash, rebuilt wholesale once per tick.
+
+    Items are (x, y, payload). Queries visit only the cells overlapping the
+    search box, so cost follows local density instead of population size.
+    """
+
+    def __init__(self, cell: float = 64.0):
+        self.cell = float(cell)
+        self.cells: Dict[Tuple[int, int], List[tuple]] = {}
+
+    def clear(self) -> None:
+        self.cells.clear()
+
+    def insert(self, x: float, y: float, payload) -> None:
+        c = self.cell
+        key = (int(x // c), int(y // c))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [(x, y, payload)]
+        else:
+            bucket.append((x, y, payload))
+
+    def rebuild(self, items: Iterable[tuple]) -> None:
+        self.cells.clear()
+        for x, y, payload in items:
+            self.insert(x, y, payload)
+
+    def query_box(self, x1: float, y1: float, x2: float, y2: float) -> List[tuple]:
+        c = self.cell
+        out = []
+        cells = self.cells
+        for cx in range(int(x1 // c), int(x2 // c) + 1):
+            for cy in range(int(y1 // c), int(y2 // c) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    out.extend(bucket)
+        return out
+
+    def query_radius(self, x: float, y: float, r: float) -> List[tuple]:
+        r2 = r * r
+        return [it for it in self.query_box(x - r, y - r, x + r, y + r)
+                if (it[0] - x) ** 2 + (it[1] - y) ** 2 <= r2]
+
@@ -0,0 +1,76 @@
+import math
+import threading
+from typing import Callable, List
+
+
+class TimerWheel:
+    """
+    Two-level hierarchical timer wheel.
+
+      fine:   one slot per tick, covers the next len(fine) ticks
+      coarse: one slot per len(fine) ticks; its entries are cascaded down
+              into the fine wheel when the fine wheel wraps into their range
+
+    advance() visits one fine slot per elapsed tick plus one coarse slot per
+    fine lap, so cost follows the number of timers that come due, not the
+    number pending. Deadlines beyond the coarse horizon simply wait in their
+    coarse slot for the right lap.
+    """
+
+    def __init__(self, resolution: float, slots: int = 256, coarse_slots: int = 64):
+        self.resolution = float(resolution)
+        self.fine: List[List[list]] = [[] for _ in range(int(slots))]
+        self.coarse: List[List[list]] = [[] for _ in range(int(coarse_slots))]
+        self.tick = 0          # last processed tick
+        self.pending = 0
+        # schedule() may come from parallel tick phases; advance() stays on one thread
+        self._lock = threading.Lock()
+
+    def _tick_of(self, t: float) -> int:
+        return int(math.ceil(t / self.resolution - 1e-6))
+
+    def _place(self, entry: list) -> None:
+        due = entry[0]
+        n = len(self.fine)
+        if due - self.tick < n:
+            self.fine[due % n].append(entry)
+        else:
+            self.coarse[(due // n) % len(self.coarse)].append(entry)
+
+    def schedule(self, deadline: float, fn: Callable, *args) -> list:
+        """Run fn(*args) on the first advance() with now >= deadline. Returns a cancel handle."""
+        entry = [max(self._tick_of(deadline), self.tick + 1), fn, args]
+        with self._lock:
+            self._place(entry)
+            self.pending += 1
+        return entry
+
+    @staticmethod
+    def cancel(entry: list) -> None:
+        entry[1] = None
+
+    def advance(self, now: float) -> int:
+        target = int(now / self.resolution + 1e-6)
+        n = len(self.fine)
+        fired = 0
+        while self.tick < target:
+            self.tick += 1
+            t = self.tick
+
+            if t % n == 0:
+                ci = (t // n) % len(self.coarse)
+                bucket, self.coarse[ci] = self.coarse[ci], []
+                for entry in bucket:
+                    self._place(entry)
+
+            bucket = self.fine[t % n]
+            if not bucket:
+                continue
+            self.fine[t % n] = []
+            for entry in bucket:
+                self.pending -= 1
+                fn = entry[1]
+                if fn is not None:
+                    fn(*entry[2])
+                    fired += 1
+        return fired
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except Exception:  # optional: scores are then computed pet by pet
+    np = None
+
+# below this many pets the per-pet loop beats building arrays
+BATCH_MIN = 16
+
+
+@dataclass(frozen=True)
+class Behaviour:
+    """
+    One thing a fenling can choose to do.
+
+    score(cols) must be plain arithmetic over the named columns (gates are
+    0/1 columns to multiply by), so the same function scores a whole array
+    of pets at once or a single pet's scalars; a plain constant is fine too
+    (it fills the whole row). act names the World method that carries the
+    choice out for one pet.
+    """
+    name: str
+    score: Callable[[Dict[str, object]], object]
+    act: str
+
+
+# ----------------------------
+# Default fenling behaviours
+# ----------------------------
+# columns (one value per pet):
+#   blocked    held, staggered or docked (0/1)
+#   has_food   hungry and holding a food claim (0/1)
+#   ball_near  bored and a ball within chase radius (0/1)
+#   enemy      any bug to go after (0/1)
+#   hunger, boredom (0..100), mood (-1..1), trust/bold/clingy/playful (0..1)
+
+def _score_rest(c):
+    return c["blocked"] * 10.0
+
+
+def _score_eat(c):
+    # above play (<= 0.9) and fight (<= 0.75): a pet holding a claim eats it
+    return c["has_food"] * (1.0 + c["hunger"] / 200.0)
+
+
+def _score_play(c):
+    return c["ball_near"] * (0.45 + c["boredom"] / 400.0 + 0.2 * c["playful"])
+
+
+def _score_fight(c):
+    return c["enemy"] * (0.40 + 0.25 * c["bold"] + 0.10 * c["mood"])
+
+
+def _score_wander(c):
+    return 0.2
+
+
+PET_BEHAVIOURS: List[Behaviour] = [
+    Behaviour("rest", _score_rest, "_act_rest"),
+    Behaviour("eat", _score_eat, "_act_eat"),
+    Behaviour("play", _score_play, "_act_play"),
+    Behaviour("fight", _score_fight, "_act_fight"),
+    Behaviour("wander", _score_wander, "_act_wander"),
+]
+
+
+class UtilityAI:
+    """
+    Scores every behaviour for a batch of pets and picks the best per pet.
+    With NumPy each behaviour is one array expression over the batch;
+    without it (or for tiny batches) the same functions run per pet.
+    Ties go to the behaviour listed first.
+    """
+
+    def __init__(self, behaviours: Optional[Sequence[Behaviour]] = None):
+        self.behaviours: List[Behaviour] = list(PET_BEHAVIOURS if behaviours is None else behaviours)
+
+    def add(self, behaviour: Behaviour, before: Optional[str] = None) -> None:
+        names = [b.name for b in self.behaviours]
+        at = names.index(before) if before in names else len(names)
+        self.behaviours.insert(at, behaviour)
+
+    def choose(self, cols: Dict[str, list], n: int) -> List[Behaviour]:
+        if n == 0:
+            return []
+        bs = self.behaviours
+        if np is not None and n >= BATCH_MIN:
+            arr = {k: np.asarray(v, dtype=float) for k, v in cols.items()}
+            scores = np.empty((len(bs), n))
+            for i, b in enumerate(bs):
+                scores[i] = b.score(arr)
+            return [bs[i] for i in scores.argmax(axis=0).tolist()]
+
+        keys = list(cols)
+        out = []
+        for row in zip(*cols.values()):
+            c = dict(zip(keys, row))
+            best, best_s = bs[0], bs[0].score(c)
+            for b in bs[1:]:
+                s = b.score(c)
+                if s > best_s:
+                    best, best_s = b, s
+            out.append(best)
+        return out
@@ -1,16 +1,27 @@
 import random
 import math
-from typing import List, Optional
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional
 
 from deskpet.entities.pet import Pet
 from deskpet.entities.enemy import Enemy
 from deskpet.entities.food import Food
 from deskpet.entities.toy import ToyBall
+from deskpet.entities import models
 
-from deskpet.personality import ensure_personality, record_feed, record_play_ball, record_poke
+from deskpet.personality import (
+    ensure_personality, apply_intro_name, apply_intro_choice,
+    record_feed, record_play_ball, record_poke, record_throw,
+)
+from deskpet.dialogue import generate_reply
+from deskpet import ai_batch
+from deskpet.utility_ai import UtilityAI
+from deskpet.parallel import ParallelStepper
+from deskpet.profiler import Profiler
 
 from deskpet.config import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, TICK_MS,
+    WINDOW_WIDTH, WINDOW_HEIGHT, TICK_MS, SIM_STATS_SECS,
     SPAWN_INTERVAL_TICKS, MAX_ENEMIES,
     GRAVITY, MAX_FALL_SPEED, GROUND_MARGIN,
     AIR_DRAG, GROUND_MODE, GROUND_FRICTION_SKID, GROUND_FRICTION_STICKY,
@@ -24,8 +35,9 @@ from deskpet.config import (
     ENEMY_SKITTER_ON, ENEMY_SKITTER_AMP_MIN, ENEMY_SKITTER_AMP_MAX,
     ENEMY_SKITTER_FREQ_MIN, ENEMY_SKITTER_FREQ_MAX,
     ENEMY_JUMP_STRENGTH, ENEMY_JUMP_COOLDOWN, ENEMY_WANDER_HOP_RATE, ENEMY_CHASE_HOP_RATE,
+    ENEMY_LOD_NEAR_RADIUS, ENEMY_LOD_CURSOR_RADIUS, ENEMY_LOD_FAR_STRIDE,
     AI_STEP_SECS,
-    ATTACK_RANGE, FOOD_EAT_RANGE, HUNGER_START_SEEK_FOOD,
+    ATTACK_RANGE, FOOD_EAT_RANGE, HUNGER_START_SEEK_FOOD, PET_HUNGER_RATE, FOOD_CLAIM_RADIUS, FOOD_SHARE_PENALTY,
     PET_ATTACK_COOLDOWN, ENEMY_ATTACK_COOLDOWN, PET_DAMAGE, ENEMY_DAMAGE,
     MOOD_START, MOOD_DECAY_PER_SEC, MOOD_HAPPY_THRESHOLD, MOOD_ANNOYED_THRESHOLD, MOOD_SCARED_THRESHOLD,
     CURSOR_INTERACT_RADIUS, CURSOR_POKE_RADIUS, CURSOR_STILL_SPEED, CURSOR_FAST_SPEED,
@@ -39,35 +51,97 @@ from deskpet.config import (
     TOY_BALL_RADIUS, TOY_BALL_BOUNCE, TOY_BALL_GROUND_FRICTION, TOY_BALL_STOP_EPS, TOY_CHASE_RADIUS,
 )
 from deskpet.util.mathutil import clamp, dist, sign
+from deskpet.util.spatial import SpatialGrid
+from deskpet.util.pool import EntityPool, INDEX_MASK
+from deskpet.util.timerwheel import TimerWheel
+
+SPATIAL_CELL = 64.0
 
 
 class World:
-    def __init__(self, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, offset_x=0, offset_y=0, work_area=None):
+    def __init__(self, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, offset_x=0, offset_y=0, work_area=None,
+                 rng_seed: Optional[int] = None, workers: Optional[int] = None):
         self.width = width
         self.height = height
         self.offset_x = offset_x
         self.offset_y = offset_y
         self.work_area = work_area
 
+        # fenlings are also registered by a stable handle; focus is held by reference
         self.fenlings: List[Pet] = []
-        self.focus_idx: int = 0
+        self._fenlings_by_handle: Dict[int, Pet] = {}
+        self._next_handle = 1
+        self._focused: Optional[Pet] = None
+
+        # everything pickable, bucketed by position; rebuilt after physics
+        self.spatial = SpatialGrid(SPATIAL_CELL)
+        # fenlings / bugs only, coarse cells sized for LOD, nearest and alert-radius queries
+        self.fenling_grid = SpatialGrid(ENEMY_LOD_NEAR_RADIUS)
+        self.enemy_grid = SpatialGrid(ENEMY_LOD_NEAR_RADIUS)
+
+        self.profiler = Profiler()
+        # overlay lines as last computed; snapshot() refreshes them every _stats_every ticks
+        self._stats = ()
+        self._stats_t = None
+        self._stats_every = max(1, int(round(SIM_STATS_SECS / (TICK_MS / 1000.0))))
+
+        # world-clock deadlines (bubble expiry), one slot per tick
+        self.timers = TimerWheel(TICK_MS / 1000.0)
+        self._spatial_dirty = True
+        self._pick_reach = 0.0
+
+        # staggered AI: every agent thinks once per AI_STEP_SECS, in the tick slot
+        # given by its ai_phase (fixed at spawn), so the work is spread out.
+        # Per-slot buckets (handle / eid -> agent, spawn order) so a tick only visits its slice.
+        self.ai_slots = max(1, int(round(AI_STEP_SECS / (TICK_MS / 1000.0))))
+        self._ai_slot = 0
+        self._ai_pets: List[Dict[int, Pet]] = [{} for _ in range(self.ai_slots)]
+        self._ai_enemies: List[Dict[int, Enemy]] = [{} for _ in range(self.ai_slots)]
+
         self.spawn_fenling(x=200.0, y=200.0, name="Fenling-1")
 
-        self.enemies: List[Enemy] = []
-        self.food: List[Food] = []
+        # pooled: swap-remove, recycled objects, generation-checked ids
+        self.enemies: EntityPool[Enemy] = EntityPool(
+            Enemy, "eid", on_release=lambda e: self._ai_enemies[e.ai_phase].pop(e.eid, None))
+        self.food: EntityPool[Food] = EntityPool(Food, "fid")
+        # fid -> handle of the fenling that reserved it
+        self.food_claims: Dict[int, int] = {}
+        self._food_grid = SpatialGrid(FOOD_CLAIM_RADIUS / 2.0)
 
-        self.toys: List[ToyBall] = []
+        self.toys: EntityPool[ToyBall] = EntityPool(ToyBall, "tid")
 
         self.t = 0
-        self.next_eid = 1
 
         self.time_s = 0.0
-        self._ai_accum = 0.0
+
+
+        # NumPy enemy AI for big swarms (optional dependency)
+        self.enemy_batch_ai = ai_batch.EnemyBatchAI(rng_seed) if ai_batch.available() else None
+
+        # fenling decisions: behaviours scored over the whole AI slice at once
+        self.utility_ai = UtilityAI()
+        self.profiler.register("pet AI", self._ai_choice_stats)
+
+        # per-entity phases split across threads (free-threaded builds only)
+        self.parallel = ParallelStepper(workers)
+        self.profiler.register("step", lambda: self.parallel.mode)
 
         self.cursor_x = None
         self.cursor_y = None
         self.cursor_speed = 0.0
 
+        # input kind -> perf_counter() stamp of the oldest input not yet on screen
+        self.input_stamps: Dict[str, float] = {}
+
+        # running totals (balance runs read these; see deskpet/farm.py)
+        self.kills = 0
+        self.bug_bits_earned = 0
+
+        # entity held by the mouse (grab_at / drag_grab_to / release_grab), as
+        # (kind, handle / generation-checked id) so a recycled object never matches
+        self._grab: Optional[tuple] = None
+        self._grab_off = (0.0, 0.0)
+
         # Wave 7: freeze simulation while modals are open
         self.paused: bool = False
 
@@ -80,6 +154,7 @@ class World:
         p.x = float(x)
         p.y = float(y)
         p.mood = MOOD_START
+        p.hunger_rate = PET_HUNGER_RATE
         p.selected_food_kind = DEFAULT_FOOD_KIND
         p.inventory = {"bug_bits": 0}
         p.boredom = float(BOREDOM_START)
@@ -87,21 +162,62 @@ class World:
 
         ensure_personality(p)
 
+        p.timers = self.timers
+        p.handle = self._next_handle
+        p.ai_phase = p.handle % self.ai_slots
+        self._ai_pets[p.ai_phase][p.handle] = p
+        self._next_handle += 1
+        self._fenlings_by_handle[p.handle] = p
         self.fenlings.append(p)
+        self._spatial_dirty = True
         return p
 
+    def spawn_fenlings(self, count: int, name_prefix: str = "Fenling") -> List[Pet]:
+        """Bulk spawn at random spots across the world width."""
+        start = len(self.fenlings) + 1
+        out = []
+        for i in range(int(count)):
+            x = float(random.randint(40, max(41, int(self.width) - 40)))
+            y = float(random.randint(40, max(41, int(self.height) // 2)))
+            out.append(self.spawn_fenling(x, y, name=f"{name_prefix}-{start + i}"))
+        return out
+
+    def remove_fenling(self, pet: Pet) -> bool:
+        if self._fenlings_by_handle.pop(pet.handle, None) is None:
+            return False
+        self.fenlings.remove(pet)
+        self._ai_pets[pet.ai_phase].pop(pet.handle, None)
+        if self._focused is pet:
+            self._focused = None
+        self._spatial_dirty = True
+        self._drop_food_claim(pet)
+        return True
+
+    def fenling_by_handle(self, handle: int) -> Optional[Pet]:
+        return self._fenlings_by_handle.get(handle)
+
+    def enemy_by_id(self, eid: Optional[int]) -> Optional[Enemy]:
+        """O(1); None once that bug is gone (even if its slot was reused)."""
+        return self.enemies.get(eid)
+
+    def target_of(self, p: Pet) -> Optional[Enemy]:
+        e = self.enemies.get(p.target_eid)
+        if e is None:
+            p.target_eid = None
+        return e
+
     def get_focused(self) -> Pet:
+        p = self._focused
+        if p is not None:
+            return p
         if not self.fenlings:
             self.spawn_fenling(200.0, 200.0, "Fenling-1")
-            self.focus_idx = 0
-        self.focus_idx = int(clamp(self.focus_idx, 0, len(self.fenlings) - 1))
-        return self.fenlings[self.focus_idx]
+        p = self._focused = self.fenlings[0]
+        return p
 
     def set_focus(self, pet: Pet):
-        try:
-            self.focus_idx = self.fenlings.index(pet)
-        except ValueError:
-            pass
+        if self._fenlings_by_handle.get(pet.handle) is pet:
+            self._focused = pet
 
     def nearest_fenling_to(self, x: float, y: float) -> Optional[Pet]:
         if not self.fenlings:
@@ -113,10 +229,136 @@ class World:
                 best, best_d = p, d
         return best
 
+    # ----------------------------
+    # Spatial index + picking
+    # ----------------------------
+
+    def _rebuild_spatial(self):
+        # payload: (kind rank, list index, entity); lower rank / later index wins a pick
+        grid = self.spatial
+        grid.clear()
+        reach = 0.0
+        for rank, ents in ((0, self.enemies), (1, self.toys), (2, self.fenlings)):
+            for i, ent in enumerate(ents):
+                grid.insert(ent.x, ent.y, (rank, i, ent))
+                reach = max(reach, ent.w * 0.5, ent.h * 0.5)
+
+        fgrid = self.fenling_grid
+        fgrid.clear()
+        for p in self.fenlings:
+            fgrid.insert(p.x, p.y, p)
+        egrid = self.enemy_grid
+        egrid.clear()
+        for e in self.enemies:
+            egrid.insert(e.x, e.y, e)
+        self._pick_reach = max(reach, 18.0) + 8.0
+        self._spatial_dirty = False
+
+    @staticmethod
+    def _hit_entity(ent, x: float, y: float) -> bool:
+        if isinstance(ent, ToyBall):
+            return dist(x, y, ent.x, ent.y) <= (ent.r + 8)
+        half_w = max(18.0, float(ent.w) * 0.5)
+        half_h = max(18.0, float(ent.h) * 0.5)
+        return (abs(x - ent.x) <= half_w) and (abs(y - ent.y) <= half_h)
+
+    def pick_entity_at(self, x: float, y: float):
+        """Topmost enemy, then toy, then fenling under (x, y), or None."""
+        if self._spatial_dirty:
+            self._rebuild_spatial()
+        r = self._pick_reach
+        best, best_key = None, None
+        for _, _, (rank, i, ent) in self.spatial.query_box(x - r, y - r, x + r, y + r):
+            key = (rank, -i)
+            if (best_key is None or key < best_key) and self._hit_entity(ent, x, y):
+                best, best_key = ent, key
+        return best
+
     # ----------------------------
     # Inputs
     # ----------------------------
 
+    def note_input(self, kind: str, t: float) -> None:
+        """Stamp an input whose effect the next draw will show (kept: the oldest per kind)."""
+        self.input_stamps.setdefault(kind, t)
+
+    def take_input_stamps(self) -> Dict[str, float]:
+        stamps, self.input_stamps = self.input_stamps, {}
+        return stamps
+
+    @property
+    def grabbed(self):
+        """The held entity, or None once it's gone (killed, removed, slot reused)."""
+        if self._grab is None:
+            return None
+        ent = self._entity_by(*self._grab)
+        if ent is None:
+            self._grab = None
+        return ent
+
+    def _entity_by(self, kind: str, key: int):
+        if kind == "pet":
+            return self._fenlings_by_handle.get(key)
+        if kind == "enemy":
+            return self.enemies.get(key)
+        return self.toys.get(key)
+
+    def grab_at(self, x: float, y: float):
+        """Mouse down: pick up whatever is under (x, y), else drop food there."""
+        ent = self.pick_entity_at(x, y)
+        if ent is None:
+            self.drop_food(x, y)
+            return None
+        return self._take_hold(ent, ent.x - x, ent.y - y)
+
+    def grab(self, kind: str, key: int, off_x: float, off_y: float):
+        """
+        Mouse down on what the renderer picked from its snapshot: hold exactly
+        that entity, at the renderer's offset, so both move it the same way.
+        Nothing happens if it's gone by now.
+        """
+        ent = self._entity_by(kind, key)
+        if ent is None:
+            return None
+        return self._take_hold(ent, off_x, off_y)
+
+    def _take_hold(self, ent, off_x: float, off_y: float):
+        if isinstance(ent, Pet):
+            self.set_focus(ent)
+        ent.held = True
+        ent.vx = 0.0
+        ent.vy = 0.0
+        ent.vx_desired = 0.0
+        if isinstance(ent, Pet):
+            self._grab = ("pet", ent.handle)
+        elif isinstance(ent, Enemy):
+            self._grab = ("enemy", ent.eid)
+        else:
+            self._grab = ("toy", ent.tid)
+        self._grab_off = (off_x, off_y)
+        return ent
+
+    def drag_grab_to(self, x: float, y: float) -> None:
+        ent = self.grabbed
+        if ent is None:
+            return
+        ent.x = clamp(x + self._grab_off[0], 0.0, float(self.width))
+        ent.y = clamp(y + self._grab_off[1], -2000.0, float(self.height))
+        self._spatial_dirty = True
+
+    def release_grab(self, vx: float, vy: float) -> None:
+        """Mouse up: let go with the (already scaled and capped) throw velocity."""
+        ent = self.grabbed
+        self._grab = None
+        if ent is None:
+            return
+        ent.held = False
+        ent.vx = vx
+        ent.vy = vy
+        if isinstance(ent, Pet):
+            speed = (vx * vx + vy * vy) ** 0.5
+            record_throw(ent, "gentle" if speed < 900 else "hard")
+
     def set_cursor(self, x: float, y: float, speed: float):
         self.cursor_x = float(x)
         self.cursor_y = float(y)
@@ -142,9 +384,37 @@ class World:
         p.push_bubble(f"crafted {kind}", self.time_s, ttl=1.4, priority=85)
         return True
 
+    def craft_and_select(self, kind: str) -> None:
+        if self.try_craft_food(kind):
+            self.set_selected_food(kind)
+
+    # UI commands: plain methods with plain arguments, so the app can queue
+    # them for the sim thread or send them by name to the sim process
+
+    def set_paused(self, paused: bool) -> None:
+        self.paused = bool(paused)
+
+    def say(self, text: str, ttl: float, priority: int) -> None:
+        self.get_focused().push_bubble(text, self.time_s, ttl=ttl, priority=priority)
+
+    def apply_intro(self, name: Optional[str], choice: Optional[str]) -> None:
+        p = self.get_focused()
+        ensure_personality(p)
+        if name is not None:
+            apply_intro_name(p, name)
+        if choice:
+            apply_intro_choice(p, choice)
+        p.push_bubble("hi.", self.time_s, ttl=1.4, priority=60)
+
+    def reply_to(self, text: str) -> None:
+        p = self.get_focused()
+        reply = generate_reply(self, p, text)
+        if reply:
+            p.push_bubble(reply, self.time_s, ttl=2.4, priority=80)
+
     def drop_food(self, x, y):
         p = self.get_focused()
-        self.food.append(Food(x=float(x), y=float(y), kind=p.selected_food_kind))
+        self.food.acquire(x=float(x), y=float(y), kind=p.selected_food_kind)
         print(f"[t={self.t}] Food dropped: {p.selected_food_kind} at ({x},{y})")
 
     def spawn_ball(self, x: Optional[float] = None, y: Optional[float] = None):
@@ -153,12 +423,13 @@ class World:
             x = float(p.x + random.choice([-80, 80]))
             y = float(p.y - 120)
 
-        ball = ToyBall(x=float(x), y=float(y), r=float(TOY_BALL_RADIUS))
-        ball.w = ball.r * 2
-        ball.h = ball.r * 2
-        ball.vx = random.uniform(-250, 250)
-        ball.vy = random.uniform(-100, 0)
-        self.toys.append(ball)
+        r = float(TOY_BALL_RADIUS)
+        self.toys.acquire(
+            x=float(x), y=float(y), r=r, w=r * 2, h=r * 2,
+            vx=random.uniform(-250, 250),
+            vy=random.uniform(-100, 0),
+        )
+        self._spatial_dirty = True
 
         self.get_focused().push_bubble("ball!", self.time_s, ttl=1.2, priority=80)
 
@@ -187,30 +458,23 @@ class World:
 
         x = random.randint(50, max(51, self.width - 50))
         y = random.randint(50, max(51, self.height - 50))
-        e = Enemy(eid=self.next_eid, x=float(x), y=float(y))
-
-        e.skitter_phase = random.random() * math.tau
-        e.skitter_freq = random.uniform(ENEMY_SKITTER_FREQ_MIN, ENEMY_SKITTER_FREQ_MAX)
-        e.skitter_amp = random.uniform(ENEMY_SKITTER_AMP_MIN, ENEMY_SKITTER_AMP_MAX)
-
-        e.chase_style = "direct"
-        e.orbit_dir = random.choice([-1, 1])
-        e.style_until = 0.0
-
-        e.attack_cd = 0.0
-        e.vx = 0.0
-        e.vy = 0.0
-        e.vx_desired = 0.0
-        e.w = 24.0
-        e.h = 24.0
-        e.held = False
-        e.on_ground = False
-        e.last_impact = 0.0
-
-        self.next_eid += 1
-        self.enemies.append(e)
+        e = self.add_enemy(
+            x=float(x), y=float(y), w=24.0, h=24.0,
+            skitter_phase=random.random() * math.tau,
+            skitter_freq=random.uniform(ENEMY_SKITTER_FREQ_MIN, ENEMY_SKITTER_FREQ_MAX),
+            skitter_amp=random.uniform(ENEMY_SKITTER_AMP_MIN, ENEMY_SKITTER_AMP_MAX),
+            orbit_dir=random.choice([-1, 1]),
+        )
         print(f"[t={self.t}] Spawned Bug#{e.eid} at ({x},{y})")
 
+    def add_enemy(self, **fields) -> Enemy:
+        """Pool a bug in; everything not given starts at the dataclass defaults (also on reuse)."""
+        e = self.enemies.acquire(eid=0, **fields)
+        e.ai_phase = (e.eid & INDEX_MASK) % self.ai_slots
+        self._ai_enemies[e.ai_phase][e.eid] = e
+        self._spatial_dirty = True
+        return e
+
     # ----------------------------
     # Physics
     # ----------------------------
@@ -307,19 +571,160 @@ class World:
     # Helpers
     # ----------------------------
 
-    def _nearest_food_to(self, p: Pet) -> Optional[Food]:
-        if not self.food:
+    def _grab_view(self) -> Optional[models.Grab]:
+        ent = self.grabbed
+        if ent is None:
             return None
+        ox, oy = self._grab_off
+        if isinstance(ent, Pet):
+            return models.Grab("pet", ent.handle, ox, oy, ent.w / 2, ent.h / 2)
+        if isinstance(ent, Enemy):
+            return models.Grab("enemy", ent.eid, ox, oy, ent.w / 2, ent.h / 2)
+        return models.Grab("toy", ent.tid, ox, oy, ent.r, ent.r)
+
+    def _overlay_stats(self):
+        # sources can be O(pets) (the AI choice tally): not something to run per tick
+        if self._stats_t is None or self.t - self._stats_t >= self._stats_every:
+            self._stats = tuple(self.profiler.lines())
+            self._stats_t = self.t
+        return self._stats
+
+    def snapshot(self) -> models.WorldState:
+        """Immutable copy of what the renderer needs; safe to hand to another thread."""
+        f = self.get_focused()
+        bubble = f.bubbles[0].text if f.bubbles else None
+        focus = models.Focus(
+            f.handle, f.name, f.x, f.y, f.h, f.mood, f.mood_state, f.boredom,
+            int(f.inventory.get("bug_bits", 0)), f.selected_food_kind, bubble,
+        )
+        kinds = models.FOOD_KINDS
+        return models.WorldState(
+            t=self.t,
+            time_s=self.time_s,
+            width=float(self.width),
+            height=float(self.height),
+            focused=focus,
+            pets=models.Rows(models.PET_COLS, array("d", [
+                v for p in self.fenlings for v in (p.handle, p.x, p.y, p.w, p.h, p.vx, p.on_ground, p.held)])),
+            enemies=models.Rows(models.ENEMY_COLS, array("d", [
+                v for e in self.enemies for v in (e.eid, e.x, e.y, e.w, e.h)])),
+            food=models.Rows(models.FOOD_COLS, array("d", [
+                v for fd in self.food
+                for v in (fd.fid, fd.x, fd.y, kinds.index(fd.kind) if fd.kind in kinds else -1)])),
+            toys=models.Rows(models.TOY_COLS, array("d", [
+                v for b in self.toys for v in (b.tid, b.x, b.y, b.r)])),
+            grab=self._grab_view(),
+            lod=self.enemy_lod_counts(),
+            stats=self._overlay_stats(),
+        )
+
+    def _nearest_food_to(self, p: Pet, foods=None) -> Optional[Food]:
         best, best_d = None, 1e18
-        for f in self.food:
+        for f in (self.food if foods is None else foods):
             d = dist(p.x, p.y, f.x, f.y)
             if d < best_d:
                 best, best_d = f, d
         return best
 
+    def _holds_food_claim(self, p: Pet) -> bool:
+        return (p.food_fid is not None
+                and self.food_claims.get(p.food_fid) == p.handle
+                and self.food.get(p.food_fid) is not None)
+
+    def _drop_food_claim(self, p: Pet) -> None:
+        if p.food_fid is not None and self.food_claims.get(p.food_fid) == p.handle:
+            del self.food_claims[p.food_fid]
+        p.food_fid = None
+
+    def _food_is_claimed(self, fid: int) -> bool:
+        owner = self.fenling_by_handle(self.food_claims.get(fid, 0))
+        return owner is not None and owner.food_fid == fid
+
+    def _assign_food(self, pets: List[Pet]) -> None:
+        """
+        Reserve pellets for the hungry pets in this AI slice, once per step.
+
+        Greedy matching, closest pair first, over a grid of unclaimed food, so
+        pets spread across the pellets instead of all chasing the same one.
+        Claims persist until eaten. When every pellet is taken, the rest share
+        pellets without reserving them, spread by how many are already on each.
+        """
+        if not self.food:
+            return
+        need = []
+        for p in pets:
+            if p.hunger < HUNGER_START_SEEK_FOOD or p.held or p.docked:
+                if p.food_fid is not None:
+                    self._drop_food_claim(p)
+            elif not self._holds_food_claim(p):
+                need.append(p)
+        if not need:
+            return
+
+        claims = self.food_claims
+        for fid in [fid for fid in claims if not self._food_is_claimed(fid)]:
+            del claims[fid]
+        free = [f for f in self.food if f.fid not in claims]
+
+        grid = self._food_grid
+        r = FOOD_CLAIM_RADIUS
+        if free:
+            grid.rebuild((f.x, f.y, f) for f in free)
+            pairs = []
+            for i, p in enumerate(need):
+                for fx, fy, f in grid.query_radius(p.x, p.y, r):
+                    pairs.append(((fx - p.x) ** 2 + (fy - p.y) ** 2, i, f))
+            pairs.sort(key=lambda t: (t[0], t[1]))
+
+            left = []
+            for _, i, f in pairs:
+                p = need[i]
+                if p is None or f.fid in claims:
+                    continue
+                p.food_fid = f.fid
+                claims[f.fid] = p.handle
+                need[i] = None
+            need = [p for p in need if p is not None]
+
+            # nothing free within reach: nearest free pellet anywhere
+            free = [f for f in free if f.fid not in claims]
+            for p in need:
+                if not free:
+                    left.append(p)
+                    continue
+                f = self._nearest_food_to(p, free)
+                p.food_fid = f.fid
+                claims[f.fid] = p.handle
+                free.remove(f)
+            need = left
+
+        need = [p for p in need if self.food.get(p.food_fid) is None]
+        if not need:
+            return
+
+        # sharers: nearby pellet with the fewest pets already on it
+        load = Counter(q.food_fid for q in self.fenlings if q.food_fid is not None)
+        grid.rebuild((f.x, f.y, f) for f in self.food)
+        for p in need:
+            best, best_s = None, 1e18
+            for fx, fy, f in grid.query_radius(p.x, p.y, r):
+                score = math.hypot(fx - p.x, fy - p.y) + FOOD_SHARE_PENALTY * load[f.fid]
+                if score < best_s:
+                    best, best_s = f, score
+            best = best or self._nearest_food_to(p)
+            p.food_fid = best.fid
+            load[best.fid] += 1
+
     def _nearest_enemy_to(self, p: Pet) -> Optional[Enemy]:
-        if not self.enemies:
-            return None
+        """Nearest bug to a fenling; grid first, full scan if none is close."""
+        r = ENEMY_LOD_NEAR_RADIUS
+        best, best_d = None, r * r
+        for ex, ey, e in self.enemy_grid.query_box(p.x - r, p.y - r, p.x + r, p.y + r):
+            d = (ex - p.x) ** 2 + (ey - p.y) ** 2
+            if d <= best_d:
+                best, best_d = e, d
+        if best is not None and self.enemies.get(best.eid) is best:
+            return best
         best, best_d = None, 1e18
         for e in self.enemies:
             d = dist(p.x, p.y, e.x, e.y)
@@ -338,8 +743,9 @@ class World:
         return best
 
     def _enemy_near_pet(self, p: Pet, radius: float) -> bool:
-        for e in self.enemies:
-            if dist(p.x, p.y, e.x, e.y) <= radius:
+        r2 = radius * radius
+        for ex, ey, e in self.enemy_grid.query_box(p.x - radius, p.y - radius, p.x + radius, p.y + radius):
+            if (ex - p.x) ** 2 + (ey - p.y) ** 2 <= r2 and self.enemies.get(e.eid) is e:
                 return True
         return False
 
@@ -382,9 +788,6 @@ class World:
         if self.cursor_x is None or self.cursor_y is None:
             return
 
-        if p.cursor_react_cd > 0:
-            p.cursor_react_cd = max(0.0, p.cursor_react_cd - (TICK_MS / 1000.0))
-
         d = dist(p.x, p.y, self.cursor_x, self.cursor_y)
 
         if d <= CURSOR_POKE_RADIUS and self.cursor_speed >= CURSOR_STILL_SPEED:
@@ -402,17 +805,17 @@ class World:
         if self.time_s - p.last_poke_time > 5.0:
             p.poke_count = 0
 
-        if p.cursor_react_cd > 0:
+        if self.time_s < p.cursor_react_ready_at:
             return
 
         if d <= CURSOR_INTERACT_RADIUS:
             if self.cursor_speed >= CURSOR_FAST_SPEED:
                 p.push_bubble("!!", self.time_s, ttl=1.2, priority=70)
-                p.cursor_react_cd = CURSOR_REACT_COOLDOWN
+                p.cursor_react_ready_at = self.time_s + CURSOR_REACT_COOLDOWN
             else:
                 if p.mood_state == "happy":
                     p.push_bubble("♪", self.time_s, ttl=1.4, priority=55)
-                    p.cursor_react_cd = CURSOR_REACT_COOLDOWN
+                    p.cursor_react_ready_at = self.time_s + CURSOR_REACT_COOLDOWN
 
     def _dock_step(self, p: Pet, dt: float):
         if p.held:
@@ -432,9 +835,8 @@ class World:
         near_taskbar = p.y >= band_y
         calm = p.mood_state in ("content", "happy")
         not_hungry = p.hunger < DOCK_UNDOCK_HUNGER
-        safe = not self._enemy_near_pet(p, DOCK_ENEMY_ALERT_RADIUS)
 
-        if near_taskbar and calm and not_hungry and safe:
+        if near_taskbar and calm and not_hungry and not self._enemy_near_pet(p, DOCK_ENEMY_ALERT_RADIUS):
             p.dock_progress += dt
             if p.dock_progress >= DOCK_MIN_SECS:
                 p.docked = True
@@ -472,63 +874,120 @@ class World:
         dx = p.wander_tx - p.x
         p.vx_desired = sign(dx) * (PET_MAX_SPEED * 0.35)
 
-    def _pet_ai_step(self, p: Pet):
-        p._is_playing = False
-
-        if p.held or self.time_s < p.stagger_until or p.docked:
-            p.vx_desired = 0.0
+    def _pet_ai_columns(self, pets: List[Pet]) -> Dict[str, list]:
+        """Need/trait/context columns the behaviour scores read, one entry per pet."""
+        now = self.time_s
+        cols = {k: [] for k in ("blocked", "has_food", "ball_near", "enemy", "hunger",
+                                "boredom", "mood", "trust", "bold", "clingy", "playful")}
+        for p in pets:
+            blocked = p.held or now < p.stagger_until or p.docked
+            has_food = ball_near = enemy = False
+            if not blocked:
+                has_food = p.hunger >= HUNGER_START_SEEK_FOOD and self.food.get(p.food_fid) is not None
+                if p.boredom >= BOREDOM_SEEK_THRESHOLD and self.toys:
+                    b = self._nearest_ball_to(p)
+                    ball_near = dist(p.x, p.y, b.x, b.y) <= TOY_CHASE_RADIUS
+                enemy = bool(self.enemies)
+            t = p.traits
+            cols["blocked"].append(blocked)
+            cols["has_food"].append(has_food)
+            cols["ball_near"].append(ball_near)
+            cols["enemy"].append(enemy)
+            cols["hunger"].append(p.hunger)
+            cols["boredom"].append(p.boredom)
+            cols["mood"].append(p.mood)
+            cols["trust"].append(t.trust)
+            cols["bold"].append(t.bold)
+            cols["clingy"].append(t.clingy)
+            cols["playful"].append(t.playful)
+        return cols
+
+    def _pet_ai_batch(self, pets: List[Pet]):
+        """Score every behaviour for the whole slice, then run each pet's pick."""
+        parts = self.parallel.run(self._pet_ai_columns, pets)
+        cols = parts[0] if len(parts) == 1 else {k: [v for c in parts for v in c[k]] for k in parts[0]}
+        choices = self.utility_ai.choose(cols, len(pets))
+        for fx in self.parallel.run(self._pet_act_chunk, list(zip(pets, choices))):
+            self._apply_pet_effects(fx)
+
+    def _pet_act_chunk(self, picks) -> list:
+        # acts only touch their own pet; anything shared comes back as an effect
+        fx = []
+        for p, b in picks:
+            p._is_playing = False
+            p.ai_choice = b.name
+            getattr(self, b.act)(p, fx)
+        return fx
+
+    def _apply_pet_effects(self, fx: list) -> None:
+        """Shared effects of pet acts, applied serially in pet order (first eater wins)."""
+        for kind, p, target in fx:
+            if kind == "eat":
+                self._eat(p, target)
+            elif kind == "kick":
+                self._kick_ball(p, target)
+
+    def _eat(self, p: Pet, f: Food) -> None:
+        if self.food.get(f.fid) is not f:
             return
-
-        # hungry -> food
-        if p.hunger >= HUNGER_START_SEEK_FOOD and self.food:
-            f = self._nearest_food_to(p)
-            if f:
-                dx = f.x - p.x
-                p.vx_desired = sign(dx) * PET_MAX_SPEED
-                if dist(p.x, p.y, f.x, f.y) <= FOOD_EAT_RANGE:
-                    try:
-                        self.food.remove(f)
-                    except ValueError:
-                        pass
-
-                    spec = FOOD_TYPES.get(f.kind, FOOD_TYPES[DEFAULT_FOOD_KIND])
-                    hunger_reduce = float(spec.get("hunger_reduce", 25.0))
-                    heal = int(spec.get("heal", 1))
-                    mood_boost = float(spec.get("mood_boost", 0.12))
-
-                    p.hunger = clamp(p.hunger - hunger_reduce, 0.0, 100.0)
-                    if heal > 0:
-                        p.heal(heal)
-                    p.mood = clamp(p.mood + mood_boost, -1.0, 1.0)
-
-                    record_feed(p)
-                    p.push_bubble(f"nom {f.kind}", self.time_s, ttl=1.4, priority=75)
-                return
-
-        # bored -> ball
-        if p.boredom >= BOREDOM_SEEK_THRESHOLD and self.toys:
-            b = self._nearest_ball_to(p)
-            if b:
-                d = dist(p.x, p.y, b.x, b.y)
-                if d <= TOY_CHASE_RADIUS:
-                    dx = b.x - p.x
-                    p.vx_desired = sign(dx) * PET_MAX_SPEED
-                    p._is_playing = True
-                    if d <= 24.0 and p.on_ground:
-                        b.vx += sign(b.x - p.x) * 220.0
-                        b.vy -= 180.0
-                        record_play_ball(p)
-                        p.push_bubble("boop!", self.time_s, ttl=1.0, priority=60)
-                    return
-
-        # chase enemy
-        e = self._nearest_enemy_to(p)
-        if e:
-            dx = e.x - p.x
-            p.vx_desired = 0.0 if abs(dx) <= ATTACK_RANGE else sign(dx) * PET_MAX_SPEED
-            p.target_eid = e.eid
+        self.food_claims.pop(f.fid, None)
+        if p.food_fid == f.fid:
+            p.food_fid = None
+        self.food.release(f)
+
+        spec = FOOD_TYPES.get(f.kind, FOOD_TYPES[DEFAULT_FOOD_KIND])
+        hunger_reduce = float(spec.get("hunger_reduce", 25.0))
+        heal = int(spec.get("heal", 1))
+        mood_boost = float(spec.get("mood_boost", 0.12))
+
+        p.hunger = clamp(p.hunger - hunger_reduce, 0.0, 100.0)
+        if heal > 0:
+            p.heal(heal)
+        p.mood = clamp(p.mood + mood_boost, -1.0, 1.0)
+
+        record_feed(p)
+        p.push_bubble(f"nom {f.kind}", self.time_s, ttl=1.4, priority=75)
+
+    def _kick_ball(self, p: Pet, b: ToyBall) -> None:
+        b.vx += sign(b.x - p.x) * 220.0
+        b.vy -= 180.0
+        record_play_ball(p)
+        p.push_bubble("boop!", self.time_s, ttl=1.0, priority=60)
+
+    def _ai_choice_stats(self) -> str:
+        counts = Counter(p.ai_choice for p in self.fenlings)
+        return " ".join(f"{b.name}={counts[b.name]}" for b in self.utility_ai.behaviours if counts[b.name])
+
+    def _act_rest(self, p: Pet, fx: list):
+        p.vx_desired = 0.0
+
+    def _act_eat(self, p: Pet, fx: list):
+        f = self.food.get(p.food_fid)
+        if f is None:
+            # a pellet shared with an earlier pet in this slice got eaten first
+            self._act_wander(p, fx)
             return
+        dx = f.x - p.x
+        p.vx_desired = sign(dx) * PET_MAX_SPEED
+        if dist(p.x, p.y, f.x, f.y) <= FOOD_EAT_RANGE:
+            fx.append(("eat", p, f))
+
+    def _act_play(self, p: Pet, fx: list):
+        b = self._nearest_ball_to(p)
+        d = dist(p.x, p.y, b.x, b.y)
+        dx = b.x - p.x
+        p.vx_desired = sign(dx) * PET_MAX_SPEED
+        p._is_playing = True
+        if d <= 24.0 and p.on_ground:
+            fx.append(("kick", p, b))
+
+    def _act_fight(self, p: Pet, fx: list):
+        e = self._nearest_enemy_to(p)
+        dx = e.x - p.x
+        p.vx_desired = 0.0 if abs(dx) <= ATTACK_RANGE else sign(dx) * PET_MAX_SPEED
+        p.target_eid = e.eid
 
+    def _act_wander(self, p: Pet, fx: list):
         p.target_eid = None
         self._pet_idle_wander(p)
 
@@ -543,17 +1002,74 @@ class World:
             e.chase_style = "direct"
             e.style_until = self.time_s + random.uniform(ENEMY_STYLE_MIN_SECS_DIRECT, ENEMY_STYLE_MAX_SECS_DIRECT)
 
-    def _enemy_ai_step(self):
-        for e in self.enemies:
+    def _nearest_fenling_within(self, x: float, y: float, r: float) -> Optional[Pet]:
+        best, best_d = None, r * r
+        for px, py, p in self.fenling_grid.query_box(x - r, y - r, x + r, y + r):
+            d = (px - x) ** 2 + (py - y) ** 2
+            if d <= best_d:
+                best, best_d = p, d
+        return best
+
+    def _target_fenling_for(self, e: Enemy) -> Optional[Pet]:
+        """Nearest fenling to a bug; grid first, full scan if none is close."""
+        target = self._nearest_fenling_within(e.x, e.y, ENEMY_LOD_NEAR_RADIUS)
+        if target is None:
+            target = self.nearest_fenling_to(e.x, e.y)
+        return target
+
+    def _enemy_lod_tier(self, e: Enemy) -> int:
+        """0 (full AI) near a fenling or the cursor and on screen, else 1 (cheap)."""
+        if not (0.0 <= e.x <= self.width and -e.h <= e.y <= self.height):
+            return 1
+        if self.cursor_x is not None and self.cursor_y is not None:
+            if dist(e.x, e.y, self.cursor_x, self.cursor_y) <= ENEMY_LOD_CURSOR_RADIUS:
+                return 0
+        r = ENEMY_LOD_NEAR_RADIUS
+        for px, py, _ in self.fenling_grid.query_box(e.x - r, e.y - r, e.x + r, e.y + r):
+            if (px - e.x) ** 2 + (py - e.y) ** 2 <= r * r:
+                return 0
+        return 1
+
+    def enemy_lod_counts(self) -> Dict[str, int]:
+        far = sum(1 for e in self.enemies if e.lod)
+        return {"full": len(self.enemies) - far, "cheap": far}
+
+    def _enemy_cheap_wander(self, e: Enemy):
+        # same wander as the full model minus skitter; hop odds scaled by the stride
+        e.lod_skip += 1
+        if e.lod_skip < ENEMY_LOD_FAR_STRIDE:
+            return
+        e.lod_skip = 0
+
+        base = (random.choice([-1, 1]) * 0.55 * ENEMY_MAX_SPEED)
+        if random.random() < 0.25:
+            base = 0.0
+        e.vx_desired = base
+
+        if e.on_ground and (self.time_s - e.last_jump_time) >= ENEMY_JUMP_COOLDOWN:
+            if random.random() < ENEMY_WANDER_HOP_RATE * AI_STEP_SECS * ENEMY_LOD_FAR_STRIDE:
+                e.vy = -ENEMY_JUMP_STRENGTH
+                e.last_jump_time = self.time_s
+
+    def _enemy_ai_step(self, enemies=None):
+        if self._spatial_dirty:
+            self._rebuild_spatial()
+        for e in (self.enemies if enemies is None else enemies):
             if e.held:
                 e.vx_desired = 0.0
                 continue
 
-            target = self.nearest_fenling_to(e.x, e.y)
-            if not target:
+            if not self.fenlings:
                 e.vx_desired = 0.0
                 continue
 
+            e.lod = self._enemy_lod_tier(e)
+            if e.lod:
+                self._enemy_cheap_wander(e)
+                continue
+
+            target = self._target_fenling_for(e)
+
             d = dist(e.x, e.y, target.x, target.y)
             chasing = d <= ENEMY_DETECT_RADIUS
 
@@ -576,7 +1092,7 @@ class World:
 
             e.vx_desired = base
 
-            if e.on_ground and (self.time_s - getattr(e, "last_jump_time", 0.0)) >= ENEMY_JUMP_COOLDOWN:
+            if e.on_ground and (self.time_s - e.last_jump_time) >= ENEMY_JUMP_COOLDOWN:
                 rate = ENEMY_CHASE_HOP_RATE if chasing else ENEMY_WANDER_HOP_RATE
                 if random.random() < rate * AI_STEP_SECS:
                     e.vy = -ENEMY_JUMP_STRENGTH
@@ -587,34 +1103,36 @@ class World:
     # ----------------------------
 
     def _combat_step(self, dt: float):
-        for p in self.fenlings:
-            if p.attack_cd > 0:
-                p.attack_cd = max(0.0, p.attack_cd - dt)
-
+        """Contacts come from the grids (only fenlings within ATTACK_RANGE of each bug)."""
+        if self._spatial_dirty:
+            self._rebuild_spatial()
+        now = self.time_s
+        r = ATTACK_RANGE
         for e in list(self.enemies):
-            if e.attack_cd > 0:
-                e.attack_cd = max(0.0, e.attack_cd - dt)
-
-            target = self.nearest_fenling_to(e.x, e.y)
-            if target and dist(target.x, target.y, e.x, e.y) <= ATTACK_RANGE:
-                if (not e.held) and e.attack_cd <= 0.0 and (not target.held):
+            # the nearest fenling is in range exactly when some fenling is: nearest within range
+            target = self._nearest_fenling_within(e.x, e.y, r)
+            if target is not None:
+                if (not e.held) and now >= e.attack_ready_at and (not target.held):
                     target.take_damage(ENEMY_DAMAGE)
-                    e.attack_cd = ENEMY_ATTACK_COOLDOWN
+                    e.attack_ready_at = now + ENEMY_ATTACK_COOLDOWN
                     target.vx += sign(target.x - e.x) * 100.0
                     target.mood = clamp(target.mood - 0.08, -1.0, 1.0)
 
-            for p in self.fenlings:
-                if p.held:
+            for _, _, (rank, _, p) in self.spatial.query_radius(e.x, e.y, r):
+                if rank != 2 or p.held:
                     continue
-                if dist(p.x, p.y, e.x, e.y) <= ATTACK_RANGE and p.attack_cd <= 0.0:
+                if now >= p.attack_ready_at:
                     e.hp -= PET_DAMAGE
-                    p.attack_cd = PET_ATTACK_COOLDOWN
+                    p.attack_ready_at = now + PET_ATTACK_COOLDOWN
                     e.vx += sign(e.x - p.x) * 120.0
 
                     if e.hp <= 0:
-                        self.enemies.remove(e)
+                        self.enemies.release(e)
+                        self._spatial_dirty = True
                         bits = random.randint(BUG_BITS_DROP_MIN, BUG_BITS_DROP_MAX)
                         p.inventory["bug_bits"] = p.inventory.get("bug_bits", 0) + bits
+                        self.kills += 1
+                        self.bug_bits_earned += bits
                         p.add_xp(5)
                         p.mood = clamp(p.mood + 0.12, -1.0, 1.0)
                         p.push_bubble(f"+{bits} bits", self.time_s, ttl=1.4, priority=85)
@@ -624,6 +1142,26 @@ class World:
     # Main tick
     # ----------------------------
 
+    # per-entity phases: each call only writes the entities in its partition
+    # (bubble timers are scheduled under the wheel's lock)
+
+    def _needs_chunk(self, pets: List[Pet], dt: float):
+        for p in pets:
+            p.tick_needs()
+
+            self._update_mood(p, dt)
+            self._cursor_step(p)
+            self._dock_step(p, dt)
+            self._boredom_step(p, dt)
+
+    def _physics_chunk(self, ents: list, dt: float, max_speed: float, accel: float):
+        for ent in ents:
+            self._apply_physics_to_entity(ent, dt=dt, max_speed=max_speed, accel=accel)
+
+    def _landing_chunk(self, pets: List[Pet]):
+        for p in pets:
+            self._landing_reactions(p)
+
     def tick(self):
         if self.paused:
             return
@@ -635,35 +1173,32 @@ class World:
         if self.t % SPAWN_INTERVAL_TICKS == 0:
             self.spawn_enemy()
 
-        for p in self.fenlings:
-            p.tick_needs()
-            if p.bubble_cd > 0:
-                p.bubble_cd = max(0.0, p.bubble_cd - dt)
-
-            self._update_mood(p, dt)
-            self._cursor_step(p)
-            self._dock_step(p, dt)
-            self._boredom_step(p, dt)
-
-        self._ai_accum += dt
-        if self._ai_accum >= AI_STEP_SECS:
-            self._ai_accum = 0.0
-            for p in self.fenlings:
-                self._pet_ai_step(p)
-            self._enemy_ai_step()
+        par = self.parallel
+        par.run(self._needs_chunk, self.fenlings, dt)
+
+        slot = self._ai_slot
+        self._ai_slot = (slot + 1) % self.ai_slots
+        ai_pets = list(self._ai_pets[slot].values())
+        self._assign_food(ai_pets)
+        self._pet_ai_batch(ai_pets)
+        ai_enemies = list(self._ai_enemies[slot].values())
+        if self.enemy_batch_ai is not None and len(ai_enemies) >= ai_batch.BATCH_MIN:
+            self.enemy_batch_ai.step(self, ai_enemies)
+        else:
+            if self._spatial_dirty:
+                self._rebuild_spatial()  # once, before the workers read the grid
+            par.run(self._enemy_ai_step, ai_enemies)
 
-        for p in self.fenlings:
-            self._apply_physics_to_entity(p, dt=dt, max_speed=PET_MAX_SPEED, accel=PET_ACCEL)
-        for e in self.enemies:
-            self._apply_physics_to_entity(e, dt=dt, max_speed=ENEMY_MAX_SPEED, accel=ENEMY_ACCEL)
+        par.run(self._physics_chunk, self.fenlings, dt, PET_MAX_SPEED, PET_ACCEL)
+        par.run(self._physics_chunk, self.enemies.items, dt, ENEMY_MAX_SPEED, ENEMY_ACCEL)
         for b in self.toys:
             self._apply_physics_to_ball(b, dt=dt)
 
-        for p in self.fenlings:
-            self._landing_reactions(p)
+        self._rebuild_spatial()
+
+        par.run(self._landing_chunk, self.fenlings)
 
+        # kills, drops and bit credits stay serial: one order, same result every run
         self._combat_step(dt)
 
-        for p in self.fenlings:
-            if p.bubbles:
-                p.bubbles = [bb for bb in p.bubbles if bb["until"] > self.time_s]
\ No newline at end of file
+        self.timers.advance(self.time_s)
\ No newline at end of file
@@ -0,0 +1,44 @@
+import contextlib
+import io
+import random
+
+from deskpet.world import World
+
+
+def _buckets_match(world: World) -> None:
+    # entities are dataclasses (unhashable): compare identities
+    for slot in range(world.ai_slots):
+        assert {id(p) for p in world._ai_pets[slot].values()} == \
+            {id(p) for p in world.fenlings if p.ai_phase == slot}
+        assert {id(e) for e in world._ai_enemies[slot].values()} == \
+            {id(e) for e in world.enemies if e.ai_phase == slot}
+
+
+def test_slot_buckets_follow_spawns_and_releases():
+    rng = random.Random(37)
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1280, height=720, rng_seed=37)
+        world.spawn_fenlings(30)
+        for _ in range(200):
+            if rng.random() < 0.6 or not world.enemies:
+                world.add_enemy(x=rng.uniform(0, 1280), y=600.0, w=24.0, h=24.0)
+            else:
+                world.enemies.release(rng.choice(world.enemies.items))
+            if rng.random() < 0.05 and len(world.fenlings) > 1:
+                world.remove_fenling(rng.choice(world.fenlings[1:]))
+        _buckets_match(world)
+        for _ in range(40):
+            world.tick()
+    _buckets_match(world)
+
+
+def test_every_agent_thinks_once_per_lap():
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1280, height=720, rng_seed=3)
+        world.spawn_fenlings(25)
+    seen = []
+    world._pet_ai_batch = lambda pets: seen.extend(p.handle for p in pets)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(world.ai_slots):
+            world.tick()
+    assert sorted(seen) == sorted(p.handle for p in world.fenlings)
@@ -0,0 +1,21 @@
+from deskpet.autocomplete import PrefixTrie
+
+
+def test_top_k_by_weight():
+    trie = PrefixTrie(k=3)
+    for text, w in (("feed", 5), ("fetch", 3), ("fed up", 1), ("fence", 4), ("play", 9)):
+        trie.add(text, w)
+    assert trie.complete("fe") == ["feed", "fence", "fetch"]
+    assert trie.complete("FE", k=1) == ["feed"]
+    assert trie.complete("x") == []
+
+
+def test_top_k_after_bump_and_remove():
+    trie = PrefixTrie(k=2, entries=("alpha", "alps", "altitude"))
+    trie.add("altitude", 5)
+    assert trie.complete("al") == ["altitude", "alpha"]
+    trie.remove("altitude")
+    assert sorted(trie.complete("al")) == ["alpha", "alps"]
+    trie.remove("alps")
+    assert trie.complete("al") == ["alpha"]
+    assert trie.complete("alt") == []
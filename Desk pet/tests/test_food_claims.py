@@ -0,0 +1,36 @@
+import contextlib
+import io
+import math
+from collections import Counter
+
+from deskpet.world import World
+
+
+def _world(pets: int, pellets: int) -> World:
+    with contextlib.redirect_stdout(io.StringIO()):
+        world = World(width=1920, height=1080, rng_seed=3)
+        world.spawn_fenlings(pets - 1)
+    for i, p in enumerate(world.fenlings):
+        p.x, p.y = 900.0 + i, 1000.0
+        p.hunger = 80.0
+    for i in range(pellets):
+        world.drop_food(900.0 + 4 * i, 1000.0)
+    return world
+
+
+def test_one_claim_per_pellet():
+    world = _world(pets=12, pellets=4)
+    world._assign_food(list(world.fenlings))
+    claims = world.food_claims
+    assert sorted(claims) == sorted(f.fid for f in world.food)
+    assert len(set(claims.values())) == len(claims)
+    for fid, handle in claims.items():
+        assert world.fenling_by_handle(handle).food_fid == fid
+
+
+def test_sharers_spread_over_pellets():
+    world = _world(pets=12, pellets=4)
+    world._assign_food(list(world.fenlings))
+    load = Counter(p.food_fid for p in world.fenlings)
+    assert set(load) == {f.fid for f in world.food}
+    assert max(load.values()) <= math.ceil(12 / 4)
@@ -0,0 +1,22 @@
+from deskpet.history import ConversationHistory, _iter_varints, _put_varint
+
+
+def test_varint_round_trip():
+    values = [0, 1, 127, 128, 300, 16383, 16384, 2 ** 31, 2 ** 40 + 5]
+    buf = bytearray()
+    for v in values:
+        _put_varint(buf, v)
+    assert list(_iter_varints(buf)) == values
+
+
+def test_postings_recall():
+    h = ConversationHistory()
+    for i in range(300):
+        h.add("user" if i % 2 else "pet", f"line {i} about {'cats' if i % 3 == 0 else 'dogs'}", float(i))
+    assert h._ids_for("cats") == list(range(0, 300, 3))
+    hits = h.search("cats", limit=1000)
+    assert [int(ts) for ts, _, _ in hits] == list(range(297, -1, -3))
+    assert [e[2] for e in h.search("line 150")] == ["line 150 about cats"]
+    assert all(s == "user" for _, s, _ in h.search("dogs", speaker="user", limit=50))
+    assert h.search("cats", before=9) == [h.entries[6], h.entries[3], h.entries[0]]
+    assert h.search("birds") == []
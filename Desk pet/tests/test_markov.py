@@ -0,0 +1,41 @@
+import random
+
+from deskpet.markov import NGramModel
+
+
+def _count(node) -> int:
+    children = node[1] or {}
+    return sum(1 + _count(c) for c in children.values())
+
+
+def test_prune_keeps_trie_under_cap():
+    rng = random.Random(7)
+    model = NGramModel(order=3, max_nodes=200)
+    for _ in range(300):
+        model.train(" ".join(f"w{rng.randrange(5000)}" for _ in range(6)))
+        assert model.nodes <= model.max_nodes
+        assert model.nodes == _count(model.root)
+
+
+def test_prune_keeps_frequent_ngrams():
+    model = NGramModel(order=2, max_nodes=10 ** 6)
+    for _ in range(8):
+        model.train("good boy")
+    model.train("rare words")
+    model.prune()
+    assert model.nodes == _count(model.root)
+    assert "good" in model.generate(random.Random(1))
+    assert "rare" not in model.ids and "rare" not in model.words
+
+
+def test_prune_drops_unused_words():
+    rng = random.Random(9)
+    model = NGramModel(order=3, max_nodes=200)
+    for _ in range(2000):
+        model.train(" ".join(f"w{rng.randrange(10 ** 6)}" for _ in range(5)))
+    for _ in range(20):
+        model.train("good boy")
+    model.prune()
+    assert len(model.words) <= model.nodes + 2
+    assert all(model.words[tid] == w for w, tid in model.ids.items())
+    assert model.generate(random.Random(1)).startswith("good")
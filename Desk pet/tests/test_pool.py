@@ -0,0 +1,42 @@
+from deskpet.util.pool import EntityPool, INDEX_MASK
+
+
+class Thing:
+    def __init__(self, name=""):
+        self.name = name
+        self.tid = 0
+
+
+def test_swap_remove_keeps_ids_resolving():
+    pool = EntityPool(Thing, "tid")
+    a, b, c = (pool.acquire(name=n) for n in "abc")
+    assert pool.release(a)
+    assert [t.name for t in pool] == ["c", "b"]     # last one moved into the hole
+    assert pool.get(b.tid) is b
+    assert pool.get(c.tid) is c
+    assert pool.get(a.tid) is None
+    assert not pool.release(a)
+
+
+def test_stale_handle_rejected_after_slot_reuse():
+    pool = EntityPool(Thing, "tid")
+    old = pool.acquire(name="old")
+    old_id = old.tid
+    pool.release(old)
+    new = pool.acquire(name="new")
+    assert new is old                               # recycled object
+    assert new.tid & INDEX_MASK == old_id & INDEX_MASK
+    assert new.tid != old_id
+    assert pool.get(old_id) is None
+    assert pool.get(new.tid) is new
+    assert new.name == "new"
+
+
+def test_on_release_sees_the_old_id_once():
+    seen = []
+    pool = EntityPool(Thing, "tid", on_release=lambda t: seen.append(t.tid))
+    a = pool.acquire(name="a")
+    a_id = a.tid
+    pool.release(a)
+    pool.release(a)                                 # stale: no second call
+    assert seen == [a_id]
@@ -0,0 +1,68 @@
+import contextlib
+import io
+from multiprocessing import shared_memory
+
+import pytest
+
+from deskpet.simproc import SEQ, StateLayout, StateReader, StateWriter
+from deskpet.world import World
+
+
+@pytest.fixture
+def world():
+    with contextlib.redirect_stdout(io.StringIO()):
+        w = World(width=1280, height=720, rng_seed=5)
+        w.spawn_fenlings(9)
+        w.spawn_ball()
+        w.drop_food(300.0, 600.0)
+        w.add_enemy(x=640.0, y=500.0, w=24.0, h=24.0, hp=10)
+        for _ in range(5):
+            w.tick()
+    return w
+
+
+@pytest.fixture
+def shm():
+    layout = StateLayout(pets=8, enemies=4, food=4, toys=2)
+    mem = shared_memory.SharedMemory(create=True, size=layout.size)
+    writer = StateWriter(mem.buf, layout)
+    reader = StateReader(mem.buf, layout)
+    yield layout, mem, writer, reader
+    writer.release()
+    mem.close()
+    mem.unlink()
+
+
+def test_round_trip(world, shm):
+    layout, mem, writer, reader = shm
+    state = world.snapshot()
+    writer.publish(state, ticks=5, dropped=1, stamps=[(state.t, {"click": 1.5})])
+    got = reader.read()
+
+    assert (got.t, got.time_s, got.width, got.height) == (state.t, state.time_s, state.width, state.height)
+    assert got.focused == state.focused
+    assert got.grab == state.grab
+    assert (reader.ticks, reader.dropped_ticks) == (5, 1)
+    assert reader.stamps == [[state.t, {"click": 1.5}]]
+    for kind in ("pets", "enemies", "food", "toys"):
+        sent, recv = getattr(state, kind), getattr(got, kind)
+        assert recv.cols == sent.cols
+        assert recv.data.tolist() == sent.data.tolist()[:len(recv.data)]
+    assert len(got.pets) == 8 and writer.truncated == 2     # 10 pets, room for 8
+
+
+def test_reader_skips_torn_and_unchanged_states(world, shm):
+    layout, mem, writer, reader = shm
+    writer.publish(world.snapshot(), 0, 0)
+    first = reader.read()
+    assert reader.read() is first                   # nothing new: same object
+
+    seq = writer.seq
+    SEQ.pack_into(mem.buf, 0, seq + 1)              # writer mid-publish
+    assert reader.read() is first
+    SEQ.pack_into(mem.buf, 0, seq)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        world.tick()
+    writer.publish(world.snapshot(), 1, 0)
+    assert reader.read().t == first.t + 1
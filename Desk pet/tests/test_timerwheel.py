@@ -0,0 +1,38 @@
+from deskpet.util.timerwheel import TimerWheel
+
+
+def test_fires_on_the_due_tick():
+    wheel = TimerWheel(0.05, slots=8, coarse_slots=4)
+    fired = []
+    wheel.schedule(0.25, fired.append, "a")     # tick 5
+    wheel.schedule(0.26, fired.append, "b")     # rounds up to tick 6
+    wheel.advance(0.20)
+    assert fired == []
+    wheel.advance(0.25)
+    assert fired == ["a"]
+    wheel.advance(0.30)
+    assert fired == ["a", "b"]
+    assert wheel.pending == 0
+
+
+def test_cascades_from_the_coarse_wheel():
+    wheel = TimerWheel(1.0, slots=8, coarse_slots=4)
+    fired = []
+    for due in (9, 15, 20, 45):                 # coarse; 45 is past the coarse horizon (32)
+        wheel.schedule(float(due), lambda d=due: fired.append((d, wheel.tick)))
+    assert all(not slot for slot in wheel.fine)
+    for t in range(1, 50):
+        wheel.advance(float(t))
+    assert fired == [(9, 9), (15, 15), (20, 20), (45, 45)]
+
+
+def test_cancel_and_past_deadlines():
+    wheel = TimerWheel(1.0, slots=8)
+    wheel.advance(10.0)
+    fired = []
+    handle = wheel.schedule(12.0, fired.append, "cancelled")
+    wheel.schedule(3.0, fired.append, "late")   # already past: next tick
+    TimerWheel.cancel(handle)
+    assert wheel.advance(11.0) == 1
+    assert wheel.advance(13.0) == 0
+    assert fired == ["late"]
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from deskpet import utility_ai
+from deskpet.utility_ai import UtilityAI
+
+np = pytest.importorskip("numpy")
+
+
+def _cols(n: int, rng: random.Random):
+    return {
+        "blocked": [float(rng.random() < 0.1) for _ in range(n)],
+        "has_food": [float(rng.random() < 0.4) for _ in range(n)],
+        "ball_near": [float(rng.random() < 0.4) for _ in range(n)],
+        "enemy": [float(rng.random() < 0.4) for _ in range(n)],
+        "hunger": [rng.uniform(0, 100) for _ in range(n)],
+        "boredom": [rng.uniform(0, 100) for _ in range(n)],
+        "mood": [rng.uniform(-1, 1) for _ in range(n)],
+        "trust": [rng.random() for _ in range(n)],
+        "bold": [rng.random() for _ in range(n)],
+        "clingy": [rng.random() for _ in range(n)],
+        "playful": [rng.random() for _ in range(n)],
+    }
+
+
+def test_numpy_and_scalar_scores_agree(monkeypatch):
+    ai = UtilityAI()
+    cols = _cols(500, random.Random(11))
+    assert 500 >= utility_ai.BATCH_MIN
+    batched = [b.name for b in ai.choose(cols, 500)]
+    monkeypatch.setattr(utility_ai, "np", None)
+    scalar = [b.name for b in ai.choose(cols, 500)]
+    assert batched == scalar
+    assert set(scalar) == {"rest", "eat", "play", "fight", "wander"}
+
+
+def test_per_behaviour_scores_match():
+    cols = _cols(64, random.Random(5))
+    arr = {k: np.asarray(v, dtype=float) for k, v in cols.items()}
+    for b in utility_ai.PET_BEHAVIOURS:
+        batch = np.broadcast_to(b.score(arr), (64,))
+        for i in range(64):
+            assert batch[i] == pytest.approx(b.score({k: v[i] for k, v in cols.items()}))
+
+
+def test_pet_with_a_food_claim_eats(monkeypatch):
+    monkeypatch.setattr(utility_ai, "np", None)
+    n = 2 * 2 * 2
+    cols = _cols(n, random.Random(3))
+    cols.update(blocked=[0.0] * n, has_food=[1.0] * n, ball_near=[1.0] * n, enemy=[1.0] * n,
+                hunger=[25.0] * n, boredom=[100.0] * n,
+                mood=[1.0, -1.0] * 4, bold=[1.0, 1.0, 0.0, 0.0] * 2, playful=[1.0] * 4 + [0.0] * 4)
+    assert [b.name for b in UtilityAI().choose(cols, n)] == ["eat"] * n